@@ -21,7 +21,7 @@ from typing import Any, Optional
 
 import duckdb
 
-from backend.healthdata.config import DUCKDB_PATH
+from backend.healthdata.storage.duckdb_pool import get_read_cursor
 from backend.healthdata.ai.registry import CHART_REGISTRY, get_chart_scope
 
 
@@ -100,8 +100,8 @@ class ChartContext:
 
 
 def get_db_connection() -> duckdb.DuckDBPyConnection:
-    """Get read-only DuckDB connection."""
-    return duckdb.connect(str(DUCKDB_PATH), read_only=True)
+    """Get a cursor on the shared read-only DuckDB connection."""
+    return get_read_cursor()
 
 
 def _format_date(d: date) -> str:
@@ -3,12 +3,15 @@ Apple Health Analytics - DuckDB Builder
 
 Creates curated analytics tables from Parquet data:
 - daily_metrics: One row per (date, metric_key) with aggregated values
+- daily_metrics_meta: Build timestamp per daily_metrics run_id
 - baselines: 28-day rolling statistics for each metric
 - anomalies: MAD-based anomaly detection
 - correlations: Cross-metric correlations with lag analysis
+- baseline_state: Per-metric watermarks for incremental baseline/anomaly builds
+- _pipeline_state: Source fingerprint per built table (skip unchanged rebuilds)
 
 Usage:
-    python -m backend.healthdata.analytics.build_duckdb
+    python -m backend.healthdata.analytics.build_duckdb [--full-rebuild]
 
 Architecture:
 - DuckDB queries Parquet directly via external views (no data copy)
@@ -16,15 +19,24 @@ Architecture:
 - Raw Parquet remains immutable source of truth
 """
 
+import argparse
+import hashlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 
 import duckdb
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent))
 
-from backend.healthdata.config import DUCKDB_PATH, PARQUET_DIR, ensure_data_dirs
+from backend.healthdata.config import (
+    DUCKDB_PATH,
+    PARQUET_DIR,
+    ensure_data_dirs,
+)
+from backend.healthdata.storage.duckdb_pool import open_build_connection
 
 # =============================================================================
 # METRIC TAXONOMY
@@ -90,6 +102,38 @@ EXCLUDED_METRICS = [
     'sleep_duration_goal',
 ]
 
+# Minimum samples per day for a daily_metrics row to be written.
+# Days below the threshold are dropped at build time (counts are logged per
+# metric), so the 28-day baseline windows, anomalies and derived scores only
+# see days with enough samples to be representative. Heart rate needs 10
+# readings (a handful of spot checks say little about the day's mean, min or
+# max) and walking speed/step length 3. Sums default to 1: a single low sample
+# on a quiet day is still a real (low) total.
+MIN_DAILY_SAMPLES = {
+    'heart_rate_mean': 10,
+    'heart_rate_min': 10,
+    'heart_rate_max': 10,
+    'resting_heart_rate': 1,
+    'hrv_sdnn': 1,
+    'steps': 1,
+    'active_energy': 1,
+    'basal_energy': 1,
+    'distance_walking_running': 1,
+    'flights_climbed': 1,
+    'physical_effort_load': 1,
+    'sleep_duration': 1,
+    'vo2max': 1,
+    'exercise_time': 1,
+    'stand_hours': 1,
+    'walking_speed': 3,
+    'walking_step_length': 3,
+}
+
+# Version of the build logic, mixed into the source fingerprint. Bump it when
+# a change here (SQL, metric lists, MIN_DAILY_SAMPLES) alters table contents,
+# so the next run rebuilds instead of reporting unchanged tables as cached.
+BUILD_LOGIC_VERSION = 1
+
 # Metrics eligible for baseline computation (require sufficient daily coverage)
 # NOTE: This list must NOT include any SPARSE_METRICS
 BASELINE_ELIGIBLE_METRICS = [
@@ -136,7 +180,69 @@ def create_connection() -> duckdb.DuckDBPyConnection:
     """Create or open DuckDB connection."""
     ensure_data_dirs()
     DUCKDB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    return duckdb.connect(str(DUCKDB_PATH))
+    return open_build_connection()
+
+
+def run_concurrently(con: duckdb.DuckDBPyConnection, *builders):
+    """Run data-independent build steps in parallel, one cursor per step."""
+    if not builders:
+        return
+    cursors = [con.cursor() for _ in builders]
+    try:
+        with ThreadPoolExecutor(max_workers=len(builders)) as executor:
+            futures = [
+                executor.submit(builder, cursor)
+                for builder, cursor in zip(builders, cursors)
+            ]
+            for future in futures:
+                future.result()
+    finally:
+        for cursor in cursors:
+            cursor.close()
+
+
+def source_fingerprint() -> str:
+    """Fingerprint the build inputs: BUILD_LOGIC_VERSION and the records Parquet (path, mtime, size)."""
+    records_dir = PARQUET_DIR / "records"
+    digest = hashlib.sha256()
+    digest.update(f"build_logic_version={BUILD_LOGIC_VERSION}\n".encode())
+    for path in sorted(records_dir.rglob("*.parquet")):
+        stat = path.stat()
+        digest.update(f"{path.relative_to(records_dir).as_posix()}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def create_pipeline_state(con: duckdb.DuckDBPyConnection):
+    """Create the table tracking which source fingerprint each table was built from."""
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS _pipeline_state (
+            table_name VARCHAR PRIMARY KEY,
+            source_fingerprint VARCHAR
+        )
+    """)
+
+
+def is_fresh(con: duckdb.DuckDBPyConnection, table_name: str, fingerprint: str) -> bool:
+    """Check whether table_name exists and was built from the current source."""
+    exists = con.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+        [table_name],
+    ).fetchone()[0]
+    if not exists:
+        return False
+    row = con.execute(
+        "SELECT source_fingerprint FROM _pipeline_state WHERE table_name = ?",
+        [table_name],
+    ).fetchone()
+    return row is not None and row[0] == fingerprint
+
+
+def mark_fresh(con: duckdb.DuckDBPyConnection, table_name: str, fingerprint: str):
+    """Record the source fingerprint table_name was just built from."""
+    con.execute(
+        "INSERT OR REPLACE INTO _pipeline_state VALUES (?, ?)",
+        [table_name, fingerprint],
+    )
 
 
 def setup_views(con: duckdb.DuckDBPyConnection):
@@ -146,6 +252,7 @@ def setup_views(con: duckdb.DuckDBPyConnection):
 
     print("Creating Parquet views...")
 
+    con.execute("DROP VIEW IF EXISTS records_daily")
     con.execute("DROP VIEW IF EXISTS records_parquet")
     con.execute("DROP VIEW IF EXISTS workouts_parquet")
 
@@ -159,16 +266,61 @@ def setup_views(con: duckdb.DuckDBPyConnection):
         SELECT * FROM read_parquet('{workouts_path}', hive_partitioning=true)
     """)
 
+    # Day bucket and source tier computed once per record for the daily
+    # aggregations (source_tier: 2=watch, 1=ring/strap, 0=other)
+    con.execute("""
+        CREATE VIEW records_daily AS
+        SELECT
+            CAST(start_ts AS DATE) AS date,
+            type,
+            value,
+            start_ts,
+            end_ts,
+            source_name,
+            CAST(CASE
+                WHEN LOWER(source_name) LIKE '%watch%' THEN 2
+                WHEN LOWER(source_name) LIKE '%whoop%'
+                    OR LOWER(source_name) LIKE '%oura%'
+                    OR LOWER(source_name) LIKE '%ultrahuman%' THEN 1
+                ELSE 0
+            END AS TINYINT) AS source_tier
+        FROM records_parquet
+    """)
+
     record_count = con.execute("SELECT COUNT(*) FROM records_parquet").fetchone()[0]
     workout_count = con.execute("SELECT COUNT(*) FROM workouts_parquet").fetchone()[0]
     print(f"  records_parquet: {record_count:,} rows")
     print(f"  workouts_parquet: {workout_count:,} rows")
 
 
+def record_pipeline_run(con: duckdb.DuckDBPyConnection) -> int:
+    """
+    Register a daily_metrics build in daily_metrics_meta and return its run_id.
+
+    The build timestamp lives here once per run; daily_metrics rows carry
+    only the small run_id.
+    """
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS daily_metrics_meta (
+            run_id INTEGER PRIMARY KEY,
+            computed_at TIMESTAMP
+        )
+    """)
+    run_id = con.execute("SELECT COALESCE(MAX(run_id), 0) + 1 FROM daily_metrics_meta").fetchone()[0]
+    computed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    con.execute("INSERT INTO daily_metrics_meta VALUES (?, ?)", [run_id, computed_at])
+    return run_id
+
+
 def build_daily_metrics(con: duckdb.DuckDBPyConnection):
     """
     Build daily_metrics table with all metric aggregations.
     Each (date, metric_key) is unique - we aggregate across all sources per day.
+    
+    Days with fewer than MIN_DAILY_SAMPLES[metric_key] samples are dropped
+    (10 for heart rate mean/min/max, 3 for walking speed and step length, 1
+    otherwise); the number dropped per metric is printed. Dropped days are
+    missing from the baselines, anomalies and scores built on top.
     """
     print("\nBuilding daily_metrics table...")
 
@@ -182,18 +334,31 @@ def build_daily_metrics(con: duckdb.DuckDBPyConnection):
             sample_count INTEGER,
             coverage_score DOUBLE,
             source_quality VARCHAR,
-            computed_at TIMESTAMP,
+            run_id INTEGER,
             PRIMARY KEY (date, metric_key)
         )
     """)
 
-    computed_at = datetime.now(timezone.utc).isoformat()
+    # Per-metric INSERTs land in an unkeyed staging table first; the final
+    # load below writes them to daily_metrics clustered by (metric_key, date).
+    con.execute("DROP TABLE IF EXISTS daily_metrics_staging")
+    con.execute("""
+        CREATE TEMP TABLE daily_metrics_staging (
+            date DATE,
+            metric_key VARCHAR,
+            value DOUBLE,
+            unit VARCHAR,
+            sample_count INTEGER,
+            coverage_score DOUBLE,
+            source_quality VARCHAR
+        )
+    """)
 
     # Helper to determine best source quality for a day
     source_quality_case = """
-        CASE 
-            WHEN SUM(CASE WHEN LOWER(source_name) LIKE '%watch%' THEN 1 ELSE 0 END) > 0 THEN 'high'
-            WHEN SUM(CASE WHEN LOWER(source_name) LIKE '%whoop%' OR LOWER(source_name) LIKE '%oura%' OR LOWER(source_name) LIKE '%ultrahuman%' THEN 1 ELSE 0 END) > 0 THEN 'medium'
+        CASE MAX(source_tier)
+            WHEN 2 THEN 'high'
+            WHEN 1 THEN 'medium'
             ELSE 'low'
         END
     """
@@ -202,106 +367,85 @@ def build_daily_metrics(con: duckdb.DuckDBPyConnection):
     # A. Heart Rate Metrics (HKQuantityTypeIdentifierHeartRate)
     # -------------------------------------------------------------------------
     print("  Processing heart rate metrics...")
-    
-    # heart_rate_mean
-    con.execute(f"""
-        INSERT INTO daily_metrics
-        SELECT 
-            CAST(start_ts AS DATE) as date,
-            'heart_rate_mean' as metric_key,
-            AVG(value) as value,
-            'count/min' as unit,
-            COUNT(*) as sample_count,
-            LEAST(COUNT(*) / 1440.0, 1.0) as coverage_score,
-            {source_quality_case} as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
-        WHERE type = 'HeartRate'
-            AND value IS NOT NULL
-            AND value > 30 AND value < 250
-        GROUP BY CAST(start_ts AS DATE)
-    """)
 
-    # heart_rate_min
+    # One pass over HeartRate: the range filter and per-day aggregates are
+    # evaluated once, then fanned out into mean/min/max rows.
     con.execute(f"""
-        INSERT INTO daily_metrics
+        CREATE OR REPLACE TEMP TABLE heart_rate_daily AS
         SELECT 
-            CAST(start_ts AS DATE) as date,
-            'heart_rate_min' as metric_key,
-            MIN(value) as value,
-            'count/min' as unit,
+            date,
+            AVG(value) as mean_value,
+            MIN(value) as min_value,
+            MAX(value) as max_value,
             COUNT(*) as sample_count,
-            LEAST(COUNT(*) / 1440.0, 1.0) as coverage_score,
-            {source_quality_case} as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            {source_quality_case} as source_quality
+        FROM records_daily
         WHERE type = 'HeartRate'
             AND value IS NOT NULL
             AND value > 30 AND value < 250
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
-    # heart_rate_max
-    con.execute(f"""
-        INSERT INTO daily_metrics
-        SELECT 
-            CAST(start_ts AS DATE) as date,
-            'heart_rate_max' as metric_key,
-            MAX(value) as value,
-            'count/min' as unit,
-            COUNT(*) as sample_count,
-            LEAST(COUNT(*) / 1440.0, 1.0) as coverage_score,
-            {source_quality_case} as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
-        WHERE type = 'HeartRate'
-            AND value IS NOT NULL
-            AND value > 30 AND value < 250
-        GROUP BY CAST(start_ts AS DATE)
-    """)
+    for metric_key, value_column in (
+        ('heart_rate_mean', 'mean_value'),
+        ('heart_rate_min', 'min_value'),
+        ('heart_rate_max', 'max_value'),
+    ):
+        con.execute(f"""
+            INSERT INTO daily_metrics_staging
+            SELECT 
+                date,
+                '{metric_key}' as metric_key,
+                {value_column} as value,
+                'count/min' as unit,
+                sample_count,
+                LEAST(sample_count / 1440.0, 1.0) as coverage_score,
+                source_quality
+            FROM heart_rate_daily
+        """)
+
+    con.execute("DROP TABLE heart_rate_daily")
 
     # -------------------------------------------------------------------------
     # B. Resting Heart Rate (HKQuantityTypeIdentifierRestingHeartRate)
     # -------------------------------------------------------------------------
     print("  Processing resting heart rate...")
-    con.execute(f"""
-        INSERT INTO daily_metrics
+    con.execute("""
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'resting_heart_rate' as metric_key,
             AVG(value) as value,
             'count/min' as unit,
             COUNT(*) as sample_count,
             CASE WHEN COUNT(*) >= 1 THEN 1.0 ELSE 0.0 END as coverage_score,
-            'high' as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            'high' as source_quality
+        FROM records_daily
         WHERE type = 'RestingHeartRate'
             AND value IS NOT NULL
             AND value > 30 AND value < 150
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # -------------------------------------------------------------------------
     # C. HRV SDNN (HKQuantityTypeIdentifierHeartRateVariabilitySDNN)
     # -------------------------------------------------------------------------
     print("  Processing HRV SDNN...")
-    con.execute(f"""
-        INSERT INTO daily_metrics
+    con.execute("""
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'hrv_sdnn' as metric_key,
             MEDIAN(value) as value,
             'ms' as unit,
             COUNT(*) as sample_count,
             LEAST(COUNT(*) / 10.0, 1.0) as coverage_score,
-            'high' as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            'high' as source_quality
+        FROM records_daily
         WHERE type = 'HeartRateVariabilitySDNN'
             AND value IS NOT NULL
             AND value > 0 AND value < 300
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # -------------------------------------------------------------------------
@@ -311,118 +455,112 @@ def build_daily_metrics(con: duckdb.DuckDBPyConnection):
 
     # Steps - sum all sources per day
     con.execute(f"""
-        INSERT INTO daily_metrics
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'steps' as metric_key,
             SUM(value) as value,
             'count' as unit,
             COUNT(*) as sample_count,
             LEAST(COUNT(*) / 100.0, 1.0) as coverage_score,
-            {source_quality_case} as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            {source_quality_case} as source_quality
+        FROM records_daily
         WHERE type = 'StepCount'
             AND value IS NOT NULL
             AND value >= 0
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # Active Energy
     con.execute(f"""
-        INSERT INTO daily_metrics
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'active_energy' as metric_key,
             SUM(value) as value,
             'kcal' as unit,
             COUNT(*) as sample_count,
             LEAST(COUNT(*) / 100.0, 1.0) as coverage_score,
-            {source_quality_case} as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            {source_quality_case} as source_quality
+        FROM records_daily
         WHERE type = 'ActiveEnergyBurned'
             AND value IS NOT NULL
             AND value >= 0
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # Basal Energy
-    con.execute(f"""
-        INSERT INTO daily_metrics
+    con.execute("""
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'basal_energy' as metric_key,
             SUM(value) as value,
             'kcal' as unit,
             COUNT(*) as sample_count,
             LEAST(COUNT(*) / 100.0, 1.0) as coverage_score,
-            'high' as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            'high' as source_quality
+        FROM records_daily
         WHERE type = 'BasalEnergyBurned'
             AND value IS NOT NULL
             AND value >= 0
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # Distance Walking Running
     con.execute(f"""
-        INSERT INTO daily_metrics
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'distance_walking_running' as metric_key,
             SUM(value) as value,
             'km' as unit,
             COUNT(*) as sample_count,
             LEAST(COUNT(*) / 50.0, 1.0) as coverage_score,
-            {source_quality_case} as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            {source_quality_case} as source_quality
+        FROM records_daily
         WHERE type = 'DistanceWalkingRunning'
             AND value IS NOT NULL
             AND value >= 0
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # Flights Climbed
-    con.execute(f"""
-        INSERT INTO daily_metrics
+    con.execute("""
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'flights_climbed' as metric_key,
             SUM(value) as value,
             'count' as unit,
             COUNT(*) as sample_count,
             LEAST(COUNT(*) / 10.0, 1.0) as coverage_score,
-            'medium' as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            'medium' as source_quality
+        FROM records_daily
         WHERE type = 'FlightsClimbed'
             AND value IS NOT NULL
             AND value >= 0
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # -------------------------------------------------------------------------
     # E. Physical Effort
     # -------------------------------------------------------------------------
     print("  Processing physical effort...")
-    con.execute(f"""
-        INSERT INTO daily_metrics
+    con.execute("""
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'physical_effort_load' as metric_key,
             SUM(value) as value,
             'arbitrary' as unit,
             COUNT(*) as sample_count,
             LEAST(COUNT(*) / 100.0, 1.0) as coverage_score,
-            'high' as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            'high' as source_quality
+        FROM records_daily
         WHERE type = 'PhysicalEffort'
             AND value IS NOT NULL
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # -------------------------------------------------------------------------
@@ -432,27 +570,26 @@ def build_daily_metrics(con: duckdb.DuckDBPyConnection):
     print("  Processing sleep metrics...")
     
     sleep_count = con.execute("""
-        SELECT COUNT(*) FROM records_parquet 
+        SELECT COUNT(*) FROM records_daily 
         WHERE type = 'cat_SleepAnalysis'
     """).fetchone()[0]
     
     if sleep_count > 0:
-        con.execute(f"""
-            INSERT INTO daily_metrics
+        con.execute("""
+            INSERT INTO daily_metrics_staging
             SELECT 
-                CAST(start_ts AS DATE) as date,
+                date,
                 'sleep_duration' as metric_key,
                 SUM(EXTRACT(EPOCH FROM (end_ts - start_ts)) / 60.0) as value,
                 'minutes' as unit,
                 COUNT(*) as sample_count,
                 CASE WHEN COUNT(*) >= 1 THEN 1.0 ELSE 0.0 END as coverage_score,
-                'high' as source_quality,
-                TIMESTAMP '{computed_at}' as computed_at
-            FROM records_parquet
+                'high' as source_quality
+            FROM records_daily
             WHERE type = 'cat_SleepAnalysis'
                 AND start_ts IS NOT NULL
                 AND end_ts IS NOT NULL
-            GROUP BY CAST(start_ts AS DATE)
+            GROUP BY date
         """)
         print(f"    Found {sleep_count:,} sleep records")
     else:
@@ -462,22 +599,21 @@ def build_daily_metrics(con: duckdb.DuckDBPyConnection):
     # G. VO2 Max (sparse, latest value per day)
     # -------------------------------------------------------------------------
     print("  Processing VO2 Max...")
-    con.execute(f"""
-        INSERT INTO daily_metrics
+    con.execute("""
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'vo2max' as metric_key,
             LAST(value ORDER BY start_ts) as value,
             'mL/kg/min' as unit,
             COUNT(*) as sample_count,
             1.0 as coverage_score,
-            'high' as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            'high' as source_quality
+        FROM records_daily
         WHERE type = 'VO2Max'
             AND value IS NOT NULL
             AND value > 0
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # -------------------------------------------------------------------------
@@ -491,42 +627,40 @@ def build_daily_metrics(con: duckdb.DuckDBPyConnection):
     # I. Apple Exercise Time
     # -------------------------------------------------------------------------
     print("  Processing exercise time...")
-    con.execute(f"""
-        INSERT INTO daily_metrics
+    con.execute("""
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'exercise_time' as metric_key,
             SUM(value) as value,
             'min' as unit,
             COUNT(*) as sample_count,
             LEAST(COUNT(*) / 10.0, 1.0) as coverage_score,
-            'high' as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            'high' as source_quality
+        FROM records_daily
         WHERE type = 'AppleExerciseTime'
             AND value IS NOT NULL
             AND value >= 0
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # -------------------------------------------------------------------------
     # J. Stand Hours
     # -------------------------------------------------------------------------
     print("  Processing stand hours...")
-    con.execute(f"""
-        INSERT INTO daily_metrics
+    con.execute("""
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'stand_hours' as metric_key,
             COUNT(*) as value,
             'hours' as unit,
             COUNT(*) as sample_count,
             LEAST(COUNT(*) / 12.0, 1.0) as coverage_score,
-            'high' as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            'high' as source_quality
+        FROM records_daily
         WHERE type = 'cat_AppleStandHour'
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # -------------------------------------------------------------------------
@@ -535,43 +669,81 @@ def build_daily_metrics(con: duckdb.DuckDBPyConnection):
     print("  Processing walking metrics...")
     
     # Walking speed (average)
-    con.execute(f"""
-        INSERT INTO daily_metrics
+    con.execute("""
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'walking_speed' as metric_key,
             AVG(value) as value,
             'km/hr' as unit,
             COUNT(*) as sample_count,
             LEAST(COUNT(*) / 50.0, 1.0) as coverage_score,
-            'high' as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            'high' as source_quality
+        FROM records_daily
         WHERE type = 'WalkingSpeed'
             AND value IS NOT NULL
             AND value > 0
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
     # Walking step length (average)
-    con.execute(f"""
-        INSERT INTO daily_metrics
+    con.execute("""
+        INSERT INTO daily_metrics_staging
         SELECT 
-            CAST(start_ts AS DATE) as date,
+            date,
             'walking_step_length' as metric_key,
             AVG(value) as value,
             'cm' as unit,
             COUNT(*) as sample_count,
             LEAST(COUNT(*) / 50.0, 1.0) as coverage_score,
-            'high' as source_quality,
-            TIMESTAMP '{computed_at}' as computed_at
-        FROM records_parquet
+            'high' as source_quality
+        FROM records_daily
         WHERE type = 'WalkingStepLength'
             AND value IS NOT NULL
             AND value > 0
-        GROUP BY CAST(start_ts AS DATE)
+        GROUP BY date
     """)
 
+    # -------------------------------------------------------------------------
+    # Minimum daily samples
+    # -------------------------------------------------------------------------
+    con.execute("""
+        CREATE OR REPLACE TEMP TABLE min_daily_samples AS
+        SELECT UNNEST(?) as metric_key, UNNEST(?) as min_samples
+    """, [list(MIN_DAILY_SAMPLES), list(MIN_DAILY_SAMPLES.values())])
+    dropped = con.execute("""
+        SELECT s.metric_key, COUNT(*)
+        FROM daily_metrics_staging s
+        JOIN min_daily_samples t USING (metric_key)
+        WHERE s.sample_count < t.min_samples
+        GROUP BY s.metric_key
+        ORDER BY s.metric_key
+    """).fetchall()
+    con.execute("""
+        DELETE FROM daily_metrics_staging
+        USING min_daily_samples t
+        WHERE daily_metrics_staging.metric_key = t.metric_key
+            AND daily_metrics_staging.sample_count < t.min_samples
+    """)
+    con.execute("DROP TABLE min_daily_samples")
+    for metric_key, days in dropped:
+        print(f"    Dropped {days:,} {metric_key} days below {MIN_DAILY_SAMPLES[metric_key]} samples")
+
+    # -------------------------------------------------------------------------
+    # Clustered load
+    # Every downstream reader filters on metric_key and scans a date range,
+    # so storing rows in (metric_key, date) order keeps those scans on
+    # contiguous row groups with tight zone maps.
+    # -------------------------------------------------------------------------
+    run_id = record_pipeline_run(con)
+    con.execute("""
+        INSERT INTO daily_metrics
+        SELECT *, ? as run_id FROM daily_metrics_staging
+        ORDER BY metric_key, date
+    """, [run_id])
+    con.execute("DROP TABLE daily_metrics_staging")
+    con.execute("CREATE INDEX idx_daily_metrics_metric_date ON daily_metrics (metric_key, date)")
+
     # Summary
     total_rows = con.execute("SELECT COUNT(*) FROM daily_metrics").fetchone()[0]
     unique_metrics = con.execute("SELECT COUNT(DISTINCT metric_key) FROM daily_metrics").fetchone()[0]
@@ -583,19 +755,8 @@ def build_daily_metrics(con: duckdb.DuckDBPyConnection):
     print(f"    Date range: {date_range[0]} to {date_range[1]}")
 
 
-def build_baselines(con: duckdb.DuckDBPyConnection):
-    """
-    Build baselines table with 28-day rolling statistics.
-    Window is 28 days BEFORE the current date (no leakage).
-    Requires minimum 10 data points.
-    Only includes metrics in BASELINE_ELIGIBLE_METRICS allowlist.
-    """
-    print("\nBuilding baselines table...")
-    
-    # Build SQL allowlist string
-    eligible_metrics_sql = ", ".join([f"'{m}'" for m in BASELINE_ELIGIBLE_METRICS])
-    print(f"  Eligible metrics: {len(BASELINE_ELIGIBLE_METRICS)}")
-
+def create_baseline_tables(con: duckdb.DuckDBPyConnection):
+    """(Re)create empty baselines, anomalies and baseline_state tables."""
     con.execute("DROP TABLE IF EXISTS baselines")
     con.execute("""
         CREATE TABLE baselines (
@@ -610,8 +771,122 @@ def build_baselines(con: duckdb.DuckDBPyConnection):
         )
     """)
 
-    con.execute(f"""
-        INSERT INTO baselines
+    con.execute("DROP TABLE IF EXISTS anomalies")
+    con.execute("""
+        CREATE TABLE anomalies (
+            date DATE,
+            metric_key VARCHAR,
+            value DOUBLE,
+            baseline_median DOUBLE,
+            z_mad DOUBLE,
+            anomaly_level VARCHAR,
+            reason VARCHAR,
+            PRIMARY KEY (date, metric_key)
+        )
+    """)
+
+    con.execute("DROP TABLE IF EXISTS baseline_state")
+    con.execute("""
+        CREATE TABLE baseline_state (
+            metric_key VARCHAR PRIMARY KEY,
+            watermark DATE,
+            history_hash UBIGINT
+        )
+    """)
+
+
+def build_baselines_and_anomalies(con: duckdb.DuckDBPyConnection, full_rebuild: bool = False):
+    """
+    Build baselines and anomalies tables from a single windowed pass.
+
+    Baselines: 28-day rolling statistics.
+    Window is 28 days BEFORE the current date (no leakage).
+    Requires minimum 10 data points.
+    Only includes metrics in BASELINE_ELIGIBLE_METRICS allowlist.
+
+    Anomalies: MAD-based z-scores.
+    z = (value - median) / (1.4826 * MAD)
+    Thresholds: |z| < 2.5 → none, 2.5-3.5 → mild, ≥3.5 → strong
+    Only mild/strong days are stored; readers treat a missing row as 'none'.
+    Only includes metrics in ANOMALY_ELIGIBLE_METRICS allowlist.
+
+    The window pass carries the current day's value alongside its baseline,
+    so anomalies are scored straight from it instead of joining
+    daily_metrics back against baselines.
+
+    Incremental by default: baseline_state keeps, per metric, the last
+    daily_metrics date seen (watermark) and a hash of the history before it.
+    Only dates >= watermark are recomputed; a metric whose earlier history
+    changed (late-arriving or deleted days) is recomputed in full.
+    """
+    print("\nBuilding baselines and anomalies tables...")
+
+    print(f"  Baseline eligible metrics: {len(BASELINE_ELIGIBLE_METRICS)}")
+    print(f"  Anomaly eligible metrics: {len(ANOMALY_ELIGIBLE_METRICS)}")
+
+    existing_tables = {
+        row[0] for row in con.execute("""
+            SELECT table_name FROM information_schema.tables
+            WHERE table_schema = 'main'
+                AND table_name IN ('baselines', 'anomalies', 'baseline_state')
+        """).fetchall()
+    }
+    if full_rebuild or len(existing_tables) < 3:
+        print("  Mode: full rebuild")
+        create_baseline_tables(con)
+    else:
+        print("  Mode: incremental")
+
+    # -------------------------------------------------------------------------
+    # Per-metric recompute start (NULL = recompute every date)
+    # -------------------------------------------------------------------------
+    con.execute("DROP TABLE IF EXISTS rebuild_from")
+    con.execute("""
+        CREATE TEMP TABLE rebuild_from AS
+        WITH history AS (
+            SELECT 
+                dm.metric_key,
+                bit_xor(hash(dm.date, ROUND(dm.value, 6))) as history_hash
+            FROM daily_metrics dm
+            JOIN baseline_state s ON dm.metric_key = s.metric_key
+            WHERE dm.value IS NOT NULL
+                AND dm.date < s.watermark
+            GROUP BY dm.metric_key
+        )
+        SELECT 
+            m.metric_key,
+            CASE WHEN h.history_hash = s.history_hash THEN s.watermark END as start_date
+        FROM (SELECT UNNEST(?::VARCHAR[]) as metric_key) m
+        LEFT JOIN baseline_state s ON m.metric_key = s.metric_key
+        LEFT JOIN history h ON m.metric_key = h.metric_key
+    """, [BASELINE_ELIGIBLE_METRICS])
+
+    full_metrics, incremental_metrics = con.execute("""
+        SELECT 
+            COUNT(*) FILTER (WHERE start_date IS NULL),
+            COUNT(*) FILTER (WHERE start_date IS NOT NULL)
+        FROM rebuild_from
+    """).fetchone()
+    print(f"  Metrics recomputed in full: {full_metrics}, incrementally: {incremental_metrics}")
+
+    # Drop rows being recomputed (and rows for metrics no longer eligible)
+    for table in ['baselines', 'anomalies']:
+        con.execute(f"""
+            DELETE FROM {table} t
+            WHERE NOT EXISTS (
+                SELECT 1 FROM rebuild_from r
+                WHERE r.metric_key = t.metric_key
+                    AND r.start_date IS NOT NULL
+                    AND t.date < r.start_date
+            )
+        """)
+
+    # -------------------------------------------------------------------------
+    # Single windowed pass: rolling stats + MAD + the day's own value
+    # -------------------------------------------------------------------------
+    con.execute("DROP TABLE IF EXISTS baseline_windows")
+    con.execute("""
+        CREATE TEMP TABLE baseline_windows AS
         WITH daily_values AS (
             SELECT 
                 date,
@@ -619,48 +894,136 @@ def build_baselines(con: duckdb.DuckDBPyConnection):
                 value
             FROM daily_metrics
             WHERE value IS NOT NULL
-                AND metric_key IN ({eligible_metrics_sql})
+                AND metric_key = ANY(?)
+        ),
+        target_days AS (
+            SELECT dv.*
+            FROM daily_values dv
+            JOIN rebuild_from r ON dv.metric_key = r.metric_key
+            WHERE r.start_date IS NULL OR dv.date >= r.start_date
         ),
         rolling_stats AS (
             SELECT 
                 d1.date,
                 d1.metric_key,
+                d1.value,
                 MEDIAN(d2.value) as baseline_28d_median,
                 PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY d2.value) as baseline_28d_p25,
                 PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY d2.value) as baseline_28d_p75,
+                LIST(d2.value) as window_values,
                 COUNT(d2.value) as data_points
-            FROM daily_values d1
+            FROM target_days d1
             LEFT JOIN daily_values d2 
                 ON d1.metric_key = d2.metric_key
                 AND d2.date >= d1.date - INTERVAL 28 DAY
                 AND d2.date < d1.date
-            GROUP BY d1.date, d1.metric_key
+            GROUP BY d1.date, d1.metric_key, d1.value
             HAVING COUNT(d2.value) >= 10
         )
         SELECT 
-            rs.date,
-            rs.metric_key,
-            rs.baseline_28d_median,
-            rs.baseline_28d_p25,
-            rs.baseline_28d_p75,
-            NULL as baseline_28d_mad,
-            rs.data_points
-        FROM rolling_stats rs
+            date,
+            metric_key,
+            value,
+            baseline_28d_median,
+            baseline_28d_p25,
+            baseline_28d_p75,
+            -- MAD (Median Absolute Deviation) over the same window
+            list_median(list_transform(window_values, x -> ABS(x - baseline_28d_median))) as baseline_28d_mad,
+            data_points
+        FROM rolling_stats
+    """, [BASELINE_ELIGIBLE_METRICS])
+
+    # Clustered by metric so metric_key filters can skip row groups via zone maps
+    con.execute("""
+        INSERT INTO baselines
+        SELECT 
+            date,
+            metric_key,
+            baseline_28d_median,
+            baseline_28d_p25,
+            baseline_28d_p75,
+            baseline_28d_mad,
+            data_points
+        FROM baseline_windows
+        ORDER BY metric_key, date
     """)
 
-    # Update MAD (Median Absolute Deviation)
+    # z and |z| are computed once per row; the reason phrase comes from a
+    # small (level, direction) lookup instead of re-deriving z in every CASE arm.
+    # Inserted in (metric_key, date) order like baselines, for the same
+    # zone-map pruning on the API's metric_key/date filters.
     con.execute("""
-        UPDATE baselines b
-        SET baseline_28d_mad = (
-            SELECT MEDIAN(ABS(dm.value - b.baseline_28d_median))
-            FROM daily_metrics dm
-            WHERE dm.metric_key = b.metric_key
-                AND dm.date >= b.date - INTERVAL 28 DAY
-                AND dm.date < b.date
-                AND dm.value IS NOT NULL
+        INSERT INTO anomalies
+        WITH z_scores AS (
+            SELECT 
+                date,
+                metric_key,
+                value,
+                baseline_28d_median,
+                (value - baseline_28d_median) / (1.4826 * baseline_28d_mad) as z
+            FROM baseline_windows
+            -- mad > 0 also rules out NULL median/MAD
+            WHERE metric_key = ANY(?)
+                AND baseline_28d_mad > 0
+        ),
+        scored AS (
+            SELECT *, ABS(z) as abs_z
+            FROM z_scores
+        ),
+        classified AS (
+            SELECT 
+                *,
+                CASE WHEN abs_z >= 3.5 THEN 'strong' ELSE 'mild' END as anomaly_level
+            FROM scored
+            WHERE abs_z >= 2.5
+        ),
+        reason_lut (anomaly_level, is_high, phrase) AS (
+            VALUES
+                ('strong', true, 'unusually high'),
+                ('strong', false, 'unusually low'),
+                ('mild', true, 'elevated'),
+                ('mild', false, 'reduced')
         )
-        WHERE baseline_28d_median IS NOT NULL
-    """)
+        SELECT 
+            c.date,
+            c.metric_key,
+            c.value,
+            c.baseline_28d_median as baseline_median,
+            c.z as z_mad,
+            c.anomaly_level,
+            c.metric_key || ' ' || lut.phrase || ' (' || ROUND(c.value, 1) || ' vs baseline ' || ROUND(c.baseline_28d_median, 1) || ')' as reason
+        FROM classified c
+        JOIN reason_lut lut
+            ON lut.anomaly_level = c.anomaly_level
+            AND lut.is_high = (c.z > 0)
+        ORDER BY c.metric_key, c.date
+    """, [ANOMALY_ELIGIBLE_METRICS])
+
+    con.execute("DROP TABLE baseline_windows")
+    con.execute("DROP TABLE rebuild_from")
+
+    # Next run recomputes from the latest day onward (it may still be partial)
+    con.execute("DELETE FROM baseline_state")
+    con.execute("""
+        INSERT INTO baseline_state
+        WITH watermarks AS (
+            SELECT metric_key, MAX(date) as watermark
+            FROM daily_metrics
+            WHERE value IS NOT NULL
+                AND metric_key = ANY(?)
+            GROUP BY metric_key
+        )
+        SELECT 
+            w.metric_key,
+            w.watermark,
+            bit_xor(hash(dm.date, ROUND(dm.value, 6))) FILTER (WHERE dm.date IS NOT NULL) as history_hash
+        FROM watermarks w
+        LEFT JOIN daily_metrics dm 
+            ON dm.metric_key = w.metric_key
+            AND dm.date < w.watermark
+            AND dm.value IS NOT NULL
+        GROUP BY w.metric_key, w.watermark
+    """, [BASELINE_ELIGIBLE_METRICS])
 
     total_rows = con.execute("SELECT COUNT(*) FROM baselines").fetchone()[0]
     metrics_with_baselines = con.execute("SELECT COUNT(DISTINCT metric_key) FROM baselines").fetchone()[0]
@@ -669,71 +1032,6 @@ def build_baselines(con: duckdb.DuckDBPyConnection):
     print(f"    Total rows: {total_rows:,}")
     print(f"    Metrics with baselines: {metrics_with_baselines}")
 
-
-def build_anomalies(con: duckdb.DuckDBPyConnection):
-    """
-    Build anomalies table using MAD-based z-scores.
-    z = (value - median) / (1.4826 * MAD)
-    Thresholds: |z| < 2.5 → none, 2.5-3.5 → mild, ≥3.5 → strong
-    Only includes metrics in ANOMALY_ELIGIBLE_METRICS allowlist.
-    """
-    print("\nBuilding anomalies table...")
-    
-    # Build SQL allowlist string
-    eligible_metrics_sql = ", ".join([f"'{m}'" for m in ANOMALY_ELIGIBLE_METRICS])
-    print(f"  Eligible metrics: {len(ANOMALY_ELIGIBLE_METRICS)}")
-
-    con.execute("DROP TABLE IF EXISTS anomalies")
-    con.execute("""
-        CREATE TABLE anomalies (
-            date DATE,
-            metric_key VARCHAR,
-            value DOUBLE,
-            baseline_median DOUBLE,
-            z_mad DOUBLE,
-            anomaly_level VARCHAR,
-            reason VARCHAR,
-            PRIMARY KEY (date, metric_key)
-        )
-    """)
-
-    con.execute(f"""
-        INSERT INTO anomalies
-        SELECT 
-            dm.date,
-            dm.metric_key,
-            dm.value,
-            b.baseline_28d_median as baseline_median,
-            CASE 
-                WHEN b.baseline_28d_mad > 0 
-                THEN (dm.value - b.baseline_28d_median) / (1.4826 * b.baseline_28d_mad)
-                ELSE 0
-            END as z_mad,
-            CASE 
-                WHEN b.baseline_28d_mad > 0 AND ABS((dm.value - b.baseline_28d_median) / (1.4826 * b.baseline_28d_mad)) >= 3.5 THEN 'strong'
-                WHEN b.baseline_28d_mad > 0 AND ABS((dm.value - b.baseline_28d_median) / (1.4826 * b.baseline_28d_mad)) >= 2.5 THEN 'mild'
-                ELSE 'none'
-            END as anomaly_level,
-            CASE 
-                WHEN b.baseline_28d_mad > 0 AND (dm.value - b.baseline_28d_median) / (1.4826 * b.baseline_28d_mad) >= 3.5 
-                    THEN dm.metric_key || ' unusually high (' || ROUND(dm.value, 1) || ' vs baseline ' || ROUND(b.baseline_28d_median, 1) || ')'
-                WHEN b.baseline_28d_mad > 0 AND (dm.value - b.baseline_28d_median) / (1.4826 * b.baseline_28d_mad) <= -3.5 
-                    THEN dm.metric_key || ' unusually low (' || ROUND(dm.value, 1) || ' vs baseline ' || ROUND(b.baseline_28d_median, 1) || ')'
-                WHEN b.baseline_28d_mad > 0 AND (dm.value - b.baseline_28d_median) / (1.4826 * b.baseline_28d_mad) >= 2.5 
-                    THEN dm.metric_key || ' elevated (' || ROUND(dm.value, 1) || ' vs baseline ' || ROUND(b.baseline_28d_median, 1) || ')'
-                WHEN b.baseline_28d_mad > 0 AND (dm.value - b.baseline_28d_median) / (1.4826 * b.baseline_28d_mad) <= -2.5 
-                    THEN dm.metric_key || ' reduced (' || ROUND(dm.value, 1) || ' vs baseline ' || ROUND(b.baseline_28d_median, 1) || ')'
-                ELSE 'within normal range'
-            END as reason
-        FROM daily_metrics dm
-        JOIN baselines b ON dm.date = b.date AND dm.metric_key = b.metric_key
-        WHERE dm.metric_key IN ({eligible_metrics_sql})
-            AND dm.value IS NOT NULL
-            AND b.baseline_28d_median IS NOT NULL
-            AND b.baseline_28d_mad IS NOT NULL
-            AND b.baseline_28d_mad > 0
-    """)
-
     total_rows = con.execute("SELECT COUNT(*) FROM anomalies").fetchone()[0]
     mild_count = con.execute("SELECT COUNT(*) FROM anomalies WHERE anomaly_level = 'mild'").fetchone()[0]
     strong_count = con.execute("SELECT COUNT(*) FROM anomalies WHERE anomaly_level = 'strong'").fetchone()[0]
@@ -820,10 +1118,19 @@ def validate_and_summarize(con: duckdb.DuckDBPyConnection):
     # -------------------------------------------------------------------------
     print("\nExcluded metrics check:")
     excluded_check = EXCLUDED_METRICS + SPARSE_METRICS
+    excluded_counts = {}
+    for table in ['baselines', 'anomalies', 'daily_metrics']:
+        excluded_counts[table] = dict(con.execute(f"""
+            SELECT metric_key, COUNT(*)
+            FROM {table}
+            WHERE metric_key = ANY(?)
+            GROUP BY metric_key
+        """, [excluded_check]).fetchall())
+
     for metric in excluded_check:
-        in_baselines = con.execute(f"SELECT COUNT(*) FROM baselines WHERE metric_key = '{metric}'").fetchone()[0]
-        in_anomalies = con.execute(f"SELECT COUNT(*) FROM anomalies WHERE metric_key = '{metric}'").fetchone()[0]
-        in_daily = con.execute(f"SELECT COUNT(*) FROM daily_metrics WHERE metric_key = '{metric}'").fetchone()[0]
+        in_baselines = excluded_counts['baselines'].get(metric, 0)
+        in_anomalies = excluded_counts['anomalies'].get(metric, 0)
+        in_daily = excluded_counts['daily_metrics'].get(metric, 0)
         
         if metric in EXCLUDED_METRICS:
             # Should not be in daily_metrics at all
@@ -835,40 +1142,52 @@ def validate_and_summarize(con: duckdb.DuckDBPyConnection):
             anomaly_status = "✓" if in_anomalies == 0 else f"✗ {in_anomalies}"
             print(f"  {metric}: daily={in_daily}, baselines={baseline_status}, anomalies={anomaly_status}")
 
-    print("\nTable row counts:")
-    for table in ['daily_metrics', 'baselines', 'anomalies', 'correlations']:
-        count = con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-        print(f"  {table}: {count:,}")
+    none_rows = con.execute("SELECT COUNT(*) FROM anomalies WHERE anomaly_level = 'none'").fetchone()[0]
+    status = "✓ none stored" if none_rows == 0 else f"✗ FOUND {none_rows} rows"
+    print(f"  anomalies with level 'none': {status}")
 
-    print("\nBaselines row count per metric:")
+    # One grouped pass per table; table totals are summed from these rows
+    metrics = con.execute("""
+        SELECT metric_key, COUNT(*) as days, MIN(date) as first_date, MAX(date) as last_date
+        FROM daily_metrics
+        GROUP BY metric_key
+        ORDER BY days DESC
+    """).fetchall()
     baselines_by_metric = con.execute("""
         SELECT metric_key, COUNT(*) as rows
         FROM baselines
         GROUP BY metric_key
         ORDER BY rows DESC
-    """).fetchdf()
-    for _, row in baselines_by_metric.iterrows():
-        print(f"  {row['metric_key']}: {row['rows']:,}")
-
-    print("\nAnomalies row count per metric:")
+    """).fetchall()
     anomalies_by_metric = con.execute("""
         SELECT metric_key, COUNT(*) as rows
         FROM anomalies
         GROUP BY metric_key
         ORDER BY rows DESC
-    """).fetchdf()
-    for _, row in anomalies_by_metric.iterrows():
-        print(f"  {row['metric_key']}: {row['rows']:,}")
+    """).fetchall()
+    correlations_count = con.execute("SELECT COUNT(*) FROM correlations").fetchone()[0]
+
+    print("\nTable row counts:")
+    table_counts = {
+        'daily_metrics': sum(days for _, days, _, _ in metrics),
+        'baselines': sum(rows for _, rows in baselines_by_metric),
+        'anomalies': sum(rows for _, rows in anomalies_by_metric),
+        'correlations': correlations_count,
+    }
+    for table, count in table_counts.items():
+        print(f"  {table}: {count:,}")
+
+    print("\nBaselines row count per metric:")
+    for metric_key, rows in baselines_by_metric:
+        print(f"  {metric_key}: {rows:,}")
+
+    print("\nAnomalies row count per metric:")
+    for metric_key, rows in anomalies_by_metric:
+        print(f"  {metric_key}: {rows:,}")
 
     print("\nMetrics in daily_metrics:")
-    metrics = con.execute("""
-        SELECT metric_key, COUNT(*) as days, MIN(date) as first_date, MAX(date) as last_date
-        FROM daily_metrics
-        GROUP BY metric_key
-        ORDER BY days DESC
-    """).fetchdf()
-    for _, row in metrics.iterrows():
-        print(f"  {row['metric_key']}: {row['days']:,} days ({row['first_date']} to {row['last_date']})")
+    for metric_key, days, first_date, last_date in metrics:
+        print(f"  {metric_key}: {days:,} days ({first_date} to {last_date})")
 
     print("\nAnomaly distribution by metric (mild/strong):")
     anomaly_dist = con.execute("""
@@ -877,10 +1196,10 @@ def validate_and_summarize(con: duckdb.DuckDBPyConnection):
         WHERE anomaly_level != 'none'
         GROUP BY metric_key, anomaly_level
         ORDER BY metric_key, anomaly_level
-    """).fetchdf()
-    if len(anomaly_dist) > 0:
-        for _, row in anomaly_dist.iterrows():
-            print(f"  {row['metric_key']} - {row['anomaly_level']}: {row['cnt']}")
+    """).fetchall()
+    if anomaly_dist:
+        for metric_key, anomaly_level, cnt in anomaly_dist:
+            print(f"  {metric_key} - {anomaly_level}: {cnt}")
     else:
         print("  No anomalies detected")
 
@@ -890,41 +1209,33 @@ def validate_and_summarize(con: duckdb.DuckDBPyConnection):
         FROM correlations
         ORDER BY ABS(corr) DESC
         LIMIT 10
-    """).fetchdf()
-    if len(top_corr) > 0:
-        for _, row in top_corr.iterrows():
-            print(f"  {row['metric_a']} ↔ {row['metric_b']} (lag={row['lag_days']}): r={row['corr']} (n={row['n']})")
+    """).fetchall()
+    if top_corr:
+        for metric_a, metric_b, lag_days, corr, n in top_corr:
+            print(f"  {metric_a} ↔ {metric_b} (lag={lag_days}): r={corr} (n={n})")
     else:
         print("  No significant correlations found")
 
-    print("\nSample daily_metrics rows (steps):")
-    sample = con.execute("""
-        SELECT date, metric_key, ROUND(value, 1) as value, unit, sample_count
-        FROM daily_metrics
-        WHERE metric_key = 'steps'
-        ORDER BY date DESC
-        LIMIT 5
-    """).fetchdf()
-    if len(sample) > 0:
-        print(sample.to_string(index=False))
-    else:
-        print("  No steps data")
-
-    print("\nSample daily_metrics rows (heart_rate_mean):")
-    sample_hr = con.execute("""
+    # Latest rows for each sample metric in one round trip
+    sample_metrics = {'steps': 'steps', 'heart_rate_mean': 'heart rate'}
+    samples = con.execute("""
         SELECT date, metric_key, ROUND(value, 1) as value, unit, sample_count
         FROM daily_metrics
-        WHERE metric_key = 'heart_rate_mean'
+        WHERE metric_key = ANY(?)
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY metric_key ORDER BY date DESC) <= 5
         ORDER BY date DESC
-        LIMIT 5
-    """).fetchdf()
-    if len(sample_hr) > 0:
-        print(sample_hr.to_string(index=False))
-    else:
-        print("  No heart rate data")
+    """, [list(sample_metrics)]).fetchall()
+    for sample_key, label in sample_metrics.items():
+        print(f"\nSample daily_metrics rows ({sample_key}):")
+        rows = [row for row in samples if row[1] == sample_key]
+        if rows:
+            for date, metric_key, value, unit, sample_count in rows:
+                print(f"  {date}  {metric_key}  {value}  {unit}  n={sample_count}")
+        else:
+            print(f"  No {label} data")
 
 
-def main():
+def main(full_rebuild: bool = False):
     """Main entry point for building DuckDB analytics."""
     print("=" * 60)
     print("Apple Health Analytics - DuckDB Builder")
@@ -936,10 +1247,29 @@ def main():
 
     try:
         setup_views(con)
-        build_daily_metrics(con)
-        build_baselines(con)
-        build_anomalies(con)
-        build_correlations(con)
+        create_pipeline_state(con)
+        fingerprint = source_fingerprint()
+
+        if full_rebuild or not is_fresh(con, "daily_metrics", fingerprint):
+            build_daily_metrics(con)
+            mark_fresh(con, "daily_metrics", fingerprint)
+        else:
+            print("\nSource unchanged - daily_metrics cached")
+
+        # Both only read daily_metrics and write disjoint tables
+        stale = {}
+        for table_name, builder in (
+            ("baselines", partial(build_baselines_and_anomalies, full_rebuild=full_rebuild)),
+            ("correlations", build_correlations),
+        ):
+            if full_rebuild or not is_fresh(con, table_name, fingerprint):
+                stale[table_name] = builder
+            else:
+                print(f"Source unchanged - {table_name} cached")
+        run_concurrently(con, *stale.values())
+        for table_name in stale:
+            mark_fresh(con, table_name, fingerprint)
+
         validate_and_summarize(con)
 
         print("\n" + "=" * 60)
@@ -948,13 +1278,27 @@ def main():
         print(f"\nDuckDB file: {DUCKDB_PATH}")
         print("\nTables created:")
         print("  - daily_metrics (curated daily aggregates)")
+        print("  - daily_metrics_meta (build run timestamps)")
         print("  - baselines (28-day rolling statistics)")
         print("  - anomalies (MAD-based anomaly detection)")
         print("  - correlations (cross-metric correlations)")
+        print("  - baseline_state (incremental baseline watermarks)")
+        print("  - _pipeline_state (source fingerprints per table)")
 
     finally:
         con.close()
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Build DuckDB analytics tables")
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help=(
+            "Rebuild every table: recompute daily_metrics and correlations even if the "
+            "source fingerprint is unchanged, and baselines/anomalies for every date "
+            "instead of incrementally"
+        ),
+    )
+    args = parser.parse_args()
+    main(full_rebuild=args.full_rebuild)
@@ -5,6 +5,9 @@ Creates derived_scores_daily table with:
 - Recovery Score (0-100): HRV, Resting HR, Yesterday's Effort
 - Strain Score (0-100): Physical effort with fallback to active energy
 
+and derived_timeline_daily with each day's anomaly-based readiness
+annotation (read by /analytics/readiness-timeline).
+
 IMPORTANT:
 - Does NOT modify existing tables (daily_metrics, baselines, anomalies, correlations)
 - All scores are baseline-relative using robust normalization
@@ -22,7 +25,7 @@ import duckdb
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent))
 
-from backend.healthdata.config import DUCKDB_PATH
+from backend.healthdata.storage.duckdb_pool import open_build_connection
 
 # =============================================================================
 # LOCKED WEIGHTS (DO NOT CHANGE)
@@ -36,10 +39,21 @@ STRAIN_SECONDARY_EXERCISE = 0.10
 
 SIGMOID_SLOPE = 0.7
 
+# Metrics the scores read (metric_key -> baseline column prefix);
+# pivots only scan rows for these keys
+SCORE_INPUT_METRICS = {
+    'hrv_sdnn': 'hrv',
+    'resting_heart_rate': 'rhr',
+    'physical_effort_load': 'effort',
+    'active_energy': 'energy',
+    'heart_rate_max': 'hrmax',
+    'exercise_time': 'exercise',
+}
+
 
 def create_connection() -> duckdb.DuckDBPyConnection:
     """Open existing DuckDB connection."""
-    return duckdb.connect(str(DUCKDB_PATH))
+    return open_build_connection()
 
 
 def build_derived_scores(con: duckdb.DuckDBPyConnection):
@@ -59,9 +73,66 @@ def build_derived_scores(con: duckdb.DuckDBPyConnection):
     
     con.execute("DROP TABLE IF EXISTS derived_scores_daily")
     
-    computed_at = datetime.now(timezone.utc).isoformat()
+    computed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    score_metrics = ", ".join(f"'{m}'" for m in SCORE_INPUT_METRICS)
+    
+    # Robust z clipped to +/- 3; NULL unless value and all baseline stats exist.
+    # The differences null-propagate their inputs, so two checks cover all four;
+    # the guard itself is needed because GREATEST/LEAST skip NULL arguments.
+    con.execute("""
+        CREATE OR REPLACE TEMP MACRO clipped_z(deviation, iqr) AS
+        CASE 
+            WHEN deviation IS NOT NULL AND iqr IS NOT NULL
+            THEN GREATEST(-3.0, LEAST(3.0, deviation / GREATEST(iqr, 0.000001)))
+        END
+    """)
+    con.execute("""
+        CREATE OR REPLACE TEMP MACRO robust_z(v, med, p25, p75) AS
+        clipped_z(v - med, p75 - p25)
+    """)
+    # Logistic sigmoid via the identity 1 / (1 + e^-x) = 0.5 * (1 + tanh(x / 2))
+    con.execute("""
+        CREATE OR REPLACE TEMP MACRO score_sigmoid(z, slope) AS
+        0.5 * (1.0 + TANH(slope / 2 * z))
+    """)
+    
+    # Pivots are materialized once; joined reads each of them twice (today/yesterday)
+    con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE metrics_pivot AS
+        PIVOT (
+            SELECT date, metric_key, value
+            FROM daily_metrics
+            WHERE metric_key IN ({score_metrics})
+        )
+        ON metric_key IN ({score_metrics})
+        USING MAX(value)
+        GROUP BY date
+    """)
     
+    # baselines is unique on (date, metric_key), so each metric is a plain
+    # lookup join instead of an aggregate. Baselines only exist on days with a
+    # value, so metrics_pivot's dates cover every baseline row needed.
+    baseline_columns = ",\n".join(
+        f"{prefix}.baseline_28d_median AS {prefix}_med, "
+        f"{prefix}.baseline_28d_p25 AS {prefix}_p25, "
+        f"{prefix}.baseline_28d_p75 AS {prefix}_p75"
+        for prefix in SCORE_INPUT_METRICS.values()
+    )
+    baseline_joins = "\n".join(
+        f"LEFT JOIN baselines {prefix} ON {prefix}.date = m.date AND {prefix}.metric_key = '{metric_key}'"
+        for metric_key, prefix in SCORE_INPUT_METRICS.items()
+    )
     con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE baselines_pivot AS
+        SELECT 
+            m.date,
+            {baseline_columns}
+        FROM metrics_pivot m
+        {baseline_joins}
+    """)
+    
+    # Weights, slope and timestamp are bound parameters, not SQL text
+    con.execute("""
         CREATE TABLE derived_scores_daily AS
         WITH 
         -- Get all unique dates from daily_metrics
@@ -69,46 +140,6 @@ def build_derived_scores(con: duckdb.DuckDBPyConnection):
             SELECT DISTINCT date FROM daily_metrics
         ),
         
-        -- Pivot daily_metrics to get values per metric per day
-        metrics_pivot AS (
-            SELECT 
-                date,
-                MAX(CASE WHEN metric_key = 'hrv_sdnn' THEN value END) AS hrv_sdnn,
-                MAX(CASE WHEN metric_key = 'resting_heart_rate' THEN value END) AS resting_heart_rate,
-                MAX(CASE WHEN metric_key = 'physical_effort_load' THEN value END) AS physical_effort_load,
-                MAX(CASE WHEN metric_key = 'active_energy' THEN value END) AS active_energy,
-                MAX(CASE WHEN metric_key = 'heart_rate_max' THEN value END) AS heart_rate_max,
-                MAX(CASE WHEN metric_key = 'exercise_time' THEN value END) AS exercise_time
-            FROM daily_metrics
-            GROUP BY date
-        ),
-        
-        -- Pivot baselines to get baseline stats per metric per day
-        baselines_pivot AS (
-            SELECT 
-                date,
-                MAX(CASE WHEN metric_key = 'hrv_sdnn' THEN baseline_28d_median END) AS hrv_med,
-                MAX(CASE WHEN metric_key = 'hrv_sdnn' THEN baseline_28d_p25 END) AS hrv_p25,
-                MAX(CASE WHEN metric_key = 'hrv_sdnn' THEN baseline_28d_p75 END) AS hrv_p75,
-                MAX(CASE WHEN metric_key = 'resting_heart_rate' THEN baseline_28d_median END) AS rhr_med,
-                MAX(CASE WHEN metric_key = 'resting_heart_rate' THEN baseline_28d_p25 END) AS rhr_p25,
-                MAX(CASE WHEN metric_key = 'resting_heart_rate' THEN baseline_28d_p75 END) AS rhr_p75,
-                MAX(CASE WHEN metric_key = 'physical_effort_load' THEN baseline_28d_median END) AS effort_med,
-                MAX(CASE WHEN metric_key = 'physical_effort_load' THEN baseline_28d_p25 END) AS effort_p25,
-                MAX(CASE WHEN metric_key = 'physical_effort_load' THEN baseline_28d_p75 END) AS effort_p75,
-                MAX(CASE WHEN metric_key = 'active_energy' THEN baseline_28d_median END) AS energy_med,
-                MAX(CASE WHEN metric_key = 'active_energy' THEN baseline_28d_p25 END) AS energy_p25,
-                MAX(CASE WHEN metric_key = 'active_energy' THEN baseline_28d_p75 END) AS energy_p75,
-                MAX(CASE WHEN metric_key = 'heart_rate_max' THEN baseline_28d_median END) AS hrmax_med,
-                MAX(CASE WHEN metric_key = 'heart_rate_max' THEN baseline_28d_p25 END) AS hrmax_p25,
-                MAX(CASE WHEN metric_key = 'heart_rate_max' THEN baseline_28d_p75 END) AS hrmax_p75,
-                MAX(CASE WHEN metric_key = 'exercise_time' THEN baseline_28d_median END) AS exercise_med,
-                MAX(CASE WHEN metric_key = 'exercise_time' THEN baseline_28d_p25 END) AS exercise_p25,
-                MAX(CASE WHEN metric_key = 'exercise_time' THEN baseline_28d_p75 END) AS exercise_p75
-            FROM baselines
-            GROUP BY date
-        ),
-        
         -- Join current day metrics with baselines, and yesterday's effort
         joined AS (
             SELECT 
@@ -126,190 +157,72 @@ def build_derived_scores(con: duckdb.DuckDBPyConnection):
                 b.hrmax_med, b.hrmax_p25, b.hrmax_p75,
                 b.exercise_med, b.exercise_p25, b.exercise_p75,
                 -- Yesterday's effort for recovery calculation
-                LAG(m.physical_effort_load) OVER (ORDER BY d.date) AS yesterday_effort,
-                LAG(b.effort_med) OVER (ORDER BY d.date) AS yesterday_effort_med,
-                LAG(b.effort_p25) OVER (ORDER BY d.date) AS yesterday_effort_p25,
-                LAG(b.effort_p75) OVER (ORDER BY d.date) AS yesterday_effort_p75
+                m_prev.physical_effort_load AS yesterday_effort,
+                b_prev.effort_med AS yesterday_effort_med,
+                b_prev.effort_p25 AS yesterday_effort_p25,
+                b_prev.effort_p75 AS yesterday_effort_p75
             FROM all_dates d
             LEFT JOIN metrics_pivot m ON d.date = m.date
             LEFT JOIN baselines_pivot b ON d.date = b.date
+            LEFT JOIN metrics_pivot m_prev ON m_prev.date = d.date - INTERVAL 1 DAY
+            LEFT JOIN baselines_pivot b_prev ON b_prev.date = d.date - INTERVAL 1 DAY
         ),
         
-        -- Calculate z-scores with robust normalization (capped at +/- 3)
-        z_scores AS (
+        -- z-scores, sigmoid components and scores in a single projection;
+        -- later expressions reuse earlier aliases
+        scores AS (
             SELECT 
                 date,
-                hrv_sdnn, resting_heart_rate, physical_effort_load, active_energy,
-                heart_rate_max, exercise_time,
-                hrv_med, rhr_med, effort_med, energy_med, hrmax_med, exercise_med,
-                yesterday_effort,
-                
-                -- HRV z-score (higher is better for recovery)
-                CASE 
-                    WHEN hrv_sdnn IS NOT NULL AND hrv_med IS NOT NULL AND hrv_p75 IS NOT NULL AND hrv_p25 IS NOT NULL
-                    THEN GREATEST(-3.0, LEAST(3.0, 
-                        (hrv_sdnn - hrv_med) / GREATEST(hrv_p75 - hrv_p25, 0.000001)
-                    ))
-                END AS z_hrv,
-                
-                -- RHR z-score (lower is better for recovery, so we negate)
-                CASE 
-                    WHEN resting_heart_rate IS NOT NULL AND rhr_med IS NOT NULL AND rhr_p75 IS NOT NULL AND rhr_p25 IS NOT NULL
-                    THEN GREATEST(-3.0, LEAST(3.0, 
-                        (resting_heart_rate - rhr_med) / GREATEST(rhr_p75 - rhr_p25, 0.000001)
-                    ))
-                END AS z_rhr,
-                
-                -- Yesterday effort z-score (lower is better for recovery, so we negate)
-                CASE 
-                    WHEN yesterday_effort IS NOT NULL AND yesterday_effort_med IS NOT NULL 
-                         AND yesterday_effort_p75 IS NOT NULL AND yesterday_effort_p25 IS NOT NULL
-                    THEN GREATEST(-3.0, LEAST(3.0, 
-                        (yesterday_effort - yesterday_effort_med) / GREATEST(yesterday_effort_p75 - yesterday_effort_p25, 0.000001)
-                    ))
-                END AS z_effort_yesterday,
-                
-                -- Physical effort z-score for strain (primary)
-                CASE 
-                    WHEN physical_effort_load IS NOT NULL AND effort_med IS NOT NULL 
-                         AND effort_p75 IS NOT NULL AND effort_p25 IS NOT NULL
-                    THEN GREATEST(-3.0, LEAST(3.0, 
-                        (physical_effort_load - effort_med) / GREATEST(effort_p75 - effort_p25, 0.000001)
-                    ))
-                END AS z_effort,
-                
-                -- Active energy z-score for strain (fallback)
-                CASE 
-                    WHEN active_energy IS NOT NULL AND energy_med IS NOT NULL 
-                         AND energy_p75 IS NOT NULL AND energy_p25 IS NOT NULL
-                    THEN GREATEST(-3.0, LEAST(3.0, 
-                        (active_energy - energy_med) / GREATEST(energy_p75 - energy_p25, 0.000001)
-                    ))
-                END AS z_energy,
                 
-                -- HR max z-score for strain (secondary)
-                CASE 
-                    WHEN heart_rate_max IS NOT NULL AND hrmax_med IS NOT NULL 
-                         AND hrmax_p75 IS NOT NULL AND hrmax_p25 IS NOT NULL
-                    THEN GREATEST(-3.0, LEAST(3.0, 
-                        (heart_rate_max - hrmax_med) / GREATEST(hrmax_p75 - hrmax_p25, 0.000001)
-                    ))
-                    ELSE 0
-                END AS z_hrmax,
+                -- Robust z-scores (capped at +/- 3)
+                robust_z(hrv_sdnn, hrv_med, hrv_p25, hrv_p75) AS z_hrv,
+                robust_z(resting_heart_rate, rhr_med, rhr_p25, rhr_p75) AS z_rhr,
+                robust_z(yesterday_effort, yesterday_effort_med, yesterday_effort_p25, yesterday_effort_p75) AS z_effort_yesterday,
                 
-                -- Exercise time z-score for strain (secondary)
-                CASE 
-                    WHEN exercise_time IS NOT NULL AND exercise_med IS NOT NULL 
-                         AND exercise_p75 IS NOT NULL AND exercise_p25 IS NOT NULL
-                    THEN GREATEST(-3.0, LEAST(3.0, 
-                        (exercise_time - exercise_med) / GREATEST(exercise_p75 - exercise_p25, 0.000001)
-                    ))
-                    ELSE 0
-                END AS z_exercise,
+                -- Strain primary z (effort_load preferred, else active_energy)
+                COALESCE(
+                    robust_z(physical_effort_load, effort_med, effort_p25, effort_p75),
+                    robust_z(active_energy, energy_med, energy_p25, energy_p75)
+                ) AS z_strain_primary,
+                -- Strain secondaries default to 0 when missing
+                COALESCE(robust_z(heart_rate_max, hrmax_med, hrmax_p25, hrmax_p75), 0) AS z_strain_hrmax,
+                COALESCE(robust_z(exercise_time, exercise_med, exercise_p25, exercise_p75), 0) AS z_strain_exercise,
                 
                 -- Determine which metric to use for strain primary
                 CASE 
                     WHEN physical_effort_load IS NOT NULL AND effort_med IS NOT NULL THEN 'effort_load'
                     WHEN active_energy IS NOT NULL AND energy_med IS NOT NULL THEN 'active_energy'
                     ELSE NULL
-                END AS strain_primary_metric
-                
-            FROM joined
-        ),
-        
-        -- Calculate sigmoid components
-        components AS (
-            SELECT 
-                date,
-                z_hrv, z_rhr, z_effort_yesterday,
-                z_effort, z_energy, z_hrmax, z_exercise,
-                strain_primary_metric,
+                END AS strain_primary_metric,
                 
-                -- Recovery components using sigmoid
-                -- HRV: higher z -> higher recovery (positive z is good)
-                CASE WHEN z_hrv IS NOT NULL 
-                    THEN 1.0 / (1.0 + EXP(-{SIGMOID_SLOPE} * z_hrv)) 
-                END AS hrv_component,
+                -- Recovery components (NULL when the z-score is missing)
+                -- HRV: higher z -> higher recovery; RHR and yesterday effort negated
+                score_sigmoid(z_hrv, $sigmoid_slope) AS hrv_component,
+                score_sigmoid(-z_rhr, $sigmoid_slope) AS rhr_component,
+                score_sigmoid(-z_effort_yesterday, $sigmoid_slope) AS effort_component,
                 
-                -- RHR: higher z -> lower recovery (negate z)
-                CASE WHEN z_rhr IS NOT NULL 
-                    THEN 1.0 / (1.0 + EXP(-{SIGMOID_SLOPE} * (-z_rhr))) 
-                END AS rhr_component,
-                
-                -- Yesterday effort: higher z -> lower recovery (negate z)
-                CASE WHEN z_effort_yesterday IS NOT NULL 
-                    THEN 1.0 / (1.0 + EXP(-{SIGMOID_SLOPE} * (-z_effort_yesterday))) 
-                END AS effort_component,
-                
-                -- Strain primary z (effort_load preferred, else active_energy)
-                CASE 
-                    WHEN z_effort IS NOT NULL THEN z_effort
-                    WHEN z_energy IS NOT NULL THEN z_energy
-                    ELSE NULL
-                END AS z_strain_primary,
-                
-                z_hrmax AS z_strain_hrmax,
-                z_exercise AS z_strain_exercise
-                
-            FROM z_scores
-        ),
-        
-        -- Calculate final scores
-        scores AS (
-            SELECT 
-                date,
-                hrv_component, rhr_component, effort_component,
-                strain_primary_metric,
-                
-                -- Recovery score (only if all components available)
-                CASE 
-                    WHEN hrv_component IS NOT NULL 
-                         AND rhr_component IS NOT NULL 
-                         AND effort_component IS NOT NULL
-                    THEN ROUND(100 * (
-                        {RECOVERY_WEIGHT_HRV} * hrv_component + 
-                        {RECOVERY_WEIGHT_RHR} * rhr_component + 
-                        {RECOVERY_WEIGHT_EFFORT} * effort_component
-                    ))
-                END AS recovery_score,
+                -- Recovery score (NULL unless all components available)
+                ROUND(100 * (
+                    $recovery_weight_hrv * hrv_component + 
+                    $recovery_weight_rhr * rhr_component + 
+                    $recovery_weight_effort * effort_component
+                )) AS recovery_score,
                 
                 -- Strain score
                 CASE 
                     WHEN z_strain_primary IS NOT NULL
-                    THEN GREATEST(0, LEAST(100, ROUND(100 * (
-                        1.0 / (1.0 + EXP(-{SIGMOID_SLOPE} * (
-                            z_strain_primary + 
-                            {STRAIN_SECONDARY_HRMAX} * COALESCE(z_strain_hrmax, 0) + 
-                            {STRAIN_SECONDARY_EXERCISE} * COALESCE(z_strain_exercise, 0)
-                        )))
+                    THEN GREATEST(0, LEAST(100, ROUND(100 * score_sigmoid(
+                        z_strain_primary + 
+                        $strain_secondary_hrmax * z_strain_hrmax + 
+                        $strain_secondary_exercise * z_strain_exercise,
+                        $sigmoid_slope
                     ))))
                 END AS strain_score,
                 
-                -- Calculate contributor impacts for UI
-                -- Impact = weight * (component - 0.5)
-                CASE WHEN hrv_component IS NOT NULL 
-                    THEN {RECOVERY_WEIGHT_HRV} * (hrv_component - 0.5) 
-                END AS hrv_impact_raw,
-                CASE WHEN rhr_component IS NOT NULL 
-                    THEN {RECOVERY_WEIGHT_RHR} * (rhr_component - 0.5) 
-                END AS rhr_impact_raw,
-                CASE WHEN effort_component IS NOT NULL 
-                    THEN {RECOVERY_WEIGHT_EFFORT} * (effort_component - 0.5) 
-                END AS effort_impact_raw
-                
-            FROM components
-        ),
-        
-        -- Normalize impacts to percentages
-        final_scores AS (
-            SELECT 
-                date,
-                recovery_score,
-                strain_score,
-                strain_primary_metric,
-                hrv_impact_raw,
-                rhr_impact_raw,
-                effort_impact_raw,
+                -- Contributor impacts for UI: weight * (component - 0.5)
+                $recovery_weight_hrv * (hrv_component - 0.5) AS hrv_impact_raw,
+                $recovery_weight_rhr * (rhr_component - 0.5) AS rhr_impact_raw,
+                $recovery_weight_effort * (effort_component - 0.5) AS effort_impact_raw,
                 
                 -- Sum of absolute impacts for normalization
                 GREATEST(
@@ -319,7 +232,7 @@ def build_derived_scores(con: duckdb.DuckDBPyConnection):
                     0.000001
                 ) AS sum_abs_impacts
                 
-            FROM scores
+            FROM joined
         )
         
         SELECT 
@@ -361,22 +274,89 @@ def build_derived_scores(con: duckdb.DuckDBPyConnection):
                 THEN ROUND(100 * effort_impact_raw / sum_abs_impacts, 1)
             END AS effort_pct,
             
-            TIMESTAMP '{computed_at}' AS computed_at
+            CAST($computed_at AS TIMESTAMP) AS computed_at
             
-        FROM final_scores
+        FROM scores
+        -- Stored in date order so row-group min/max zone maps prune the
+        -- API's date-range reads, as partitioned Parquet would
         ORDER BY date
-    """)
+    """, {
+        "recovery_weight_hrv": RECOVERY_WEIGHT_HRV,
+        "recovery_weight_rhr": RECOVERY_WEIGHT_RHR,
+        "recovery_weight_effort": RECOVERY_WEIGHT_EFFORT,
+        "strain_secondary_hrmax": STRAIN_SECONDARY_HRMAX,
+        "strain_secondary_exercise": STRAIN_SECONDARY_EXERCISE,
+        "sigmoid_slope": SIGMOID_SLOPE,
+        "computed_at": computed_at,
+    })
+    
+    con.execute("DROP TABLE metrics_pivot")
+    con.execute("DROP TABLE baselines_pivot")
     
     # Get stats
-    total_rows = con.execute("SELECT COUNT(*) FROM derived_scores_daily").fetchone()[0]
-    recovery_rows = con.execute("SELECT COUNT(*) FROM derived_scores_daily WHERE recovery_score IS NOT NULL").fetchone()[0]
-    strain_rows = con.execute("SELECT COUNT(*) FROM derived_scores_daily WHERE strain_score IS NOT NULL").fetchone()[0]
+    total_rows, recovery_rows, strain_rows = con.execute("""
+        SELECT COUNT(*), COUNT(recovery_score), COUNT(strain_score)
+        FROM derived_scores_daily
+    """).fetchone()
     
     print(f"  Total rows: {total_rows}")
     print(f"  Days with recovery score: {recovery_rows}")
     print(f"  Days with strain score: {strain_rows}")
 
 
+def build_derived_timeline(con: duckdb.DuckDBPyConnection):
+    """
+    Build derived_timeline_daily: per scored day, the anomaly-based
+    readiness-timeline annotation (first match wins):
+    - high_strain: strong anomaly on physical_effort_load or active_energy
+    - low_hrv: strong hrv_sdnn anomaly below its 28d baseline median
+    - high_rhr: strong resting_heart_rate anomaly above its 28d baseline median
+    
+    The day-over-day recovery rules depend on the requested range (its first
+    day has no previous day), so the endpoint still applies those.
+    """
+    print("Building derived_timeline_daily table...")
+    
+    con.execute("DROP TABLE IF EXISTS derived_timeline_daily")
+    
+    # One pass over each day's strong anomalies (at most one row per metric)
+    con.execute("""
+        CREATE TABLE derived_timeline_daily AS
+        WITH anomaly_check AS (
+            SELECT 
+                d.date,
+                d.recovery_score,
+                BOOL_OR(a.metric_key IN ('physical_effort_load', 'active_energy')) AS has_strain_anomaly,
+                BOOL_OR(a.metric_key = 'hrv_sdnn' AND a.value < b.baseline_28d_median) AS hrv_below_baseline,
+                BOOL_OR(a.metric_key = 'resting_heart_rate' AND a.value > b.baseline_28d_median) AS rhr_above_baseline
+            FROM derived_scores_daily d
+            LEFT JOIN anomalies a 
+                ON a.date = d.date
+                AND a.anomaly_level = 'strong'
+                AND a.metric_key IN ('physical_effort_load', 'active_energy', 'hrv_sdnn', 'resting_heart_rate')
+            LEFT JOIN baselines b 
+                ON b.date = a.date AND b.metric_key = a.metric_key
+            GROUP BY d.date, d.recovery_score
+        )
+        SELECT 
+            date,
+            recovery_score,
+            CASE
+                WHEN has_strain_anomaly THEN 'high_strain'
+                WHEN hrv_below_baseline THEN 'low_hrv'
+                WHEN rhr_above_baseline THEN 'high_rhr'
+            END AS anomaly_annotation_type
+        FROM anomaly_check
+        -- Date order for row-group pruning, as derived_scores_daily
+        ORDER BY date
+    """)
+    
+    annotated_rows = con.execute("""
+        SELECT COUNT(anomaly_annotation_type) FROM derived_timeline_daily
+    """).fetchone()[0]
+    print(f"  Days with anomaly annotation: {annotated_rows}")
+
+
 def validate_derived_scores(con: duckdb.DuckDBPyConnection):
     """Validate that derived scores follow the rules."""
     print("\nValidating derived scores...")
@@ -384,39 +364,41 @@ def validate_derived_scores(con: duckdb.DuckDBPyConnection):
     # Check recovery score only uses HRV, RHR, effort
     print("  Checking recovery score inputs...")
     
-    # Verify no sleep_duration influence
-    result = con.execute("""
-        SELECT COUNT(*) FROM derived_scores_daily d
-        WHERE d.recovery_score IS NOT NULL
-        AND EXISTS (
-            SELECT 1 FROM daily_metrics dm 
-            WHERE dm.date = d.date AND dm.metric_key = 'sleep_duration' AND dm.value IS NOT NULL
-        )
-        AND NOT EXISTS (
-            SELECT 1 FROM daily_metrics dm 
-            WHERE dm.date = d.date AND dm.metric_key = 'hrv_sdnn' AND dm.value IS NOT NULL
-        )
-    """).fetchone()[0]
+    # Both input checks in one pass over derived_scores_daily
+    recovery_without_hrv, strain_fallback_with_effort = con.execute("""
+        SELECT 
+            -- Recovery scored on a sleep day without HRV (sleep_duration influence)
+            COUNT(*) FILTER (
+                WHERE d.recovery_score IS NOT NULL
+                AND COALESCE(dm.has_sleep, false)
+                AND NOT COALESCE(dm.has_hrv, false)
+            ),
+            -- Strain fell back to active_energy although effort_load exists
+            COUNT(*) FILTER (
+                WHERE d.strain_primary_metric = 'active_energy'
+                AND COALESCE(dm.has_effort, false)
+            )
+        FROM derived_scores_daily d
+        LEFT JOIN (
+            SELECT 
+                date,
+                BOOL_OR(metric_key = 'sleep_duration' AND value IS NOT NULL) AS has_sleep,
+                BOOL_OR(metric_key = 'hrv_sdnn' AND value IS NOT NULL) AS has_hrv,
+                BOOL_OR(metric_key = 'physical_effort_load' AND value IS NOT NULL) AS has_effort
+            FROM daily_metrics
+            WHERE metric_key IN ('sleep_duration', 'hrv_sdnn', 'physical_effort_load')
+            GROUP BY date
+        ) dm ON dm.date = d.date
+    """).fetchone()
     
-    if result > 0:
-        print(f"  WARNING: {result} recovery scores may be computed without HRV")
+    if recovery_without_hrv > 0:
+        print(f"  WARNING: {recovery_without_hrv} recovery scores may be computed without HRV")
     else:
         print("  ✓ Recovery score requires HRV (not computed from sleep)")
     
     # Check strain uses effort_load when available
-    result = con.execute("""
-        SELECT COUNT(*) FROM derived_scores_daily d
-        WHERE d.strain_primary_metric = 'active_energy'
-        AND EXISTS (
-            SELECT 1 FROM daily_metrics dm 
-            WHERE dm.date = d.date 
-            AND dm.metric_key = 'physical_effort_load' 
-            AND dm.value IS NOT NULL
-        )
-    """).fetchone()[0]
-    
-    if result > 0:
-        print(f"  WARNING: {result} strain scores use active_energy despite effort_load being available")
+    if strain_fallback_with_effort > 0:
+        print(f"  WARNING: {strain_fallback_with_effort} strain scores use active_energy despite effort_load being available")
     else:
         print("  ✓ Strain prefers physical_effort_load over active_energy")
     
@@ -448,7 +430,18 @@ def main():
     con = create_connection()
     
     try:
-        build_derived_scores(con)
+        # One commit for drop/create/stats; readers never see a missing table
+        con.execute("BEGIN TRANSACTION")
+        try:
+            build_derived_scores(con)
+            build_derived_timeline(con)
+            con.execute("COMMIT")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+        # Write the date-sorted table out of the WAL into its row groups now,
+        # so API readers get tight per-row-group date ranges immediately
+        con.execute("CHECKPOINT")
         validate_derived_scores(con)
         print("\n✓ Derived scores build complete")
     finally:
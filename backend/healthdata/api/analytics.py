@@ -13,43 +13,31 @@ Endpoints:
 - GET /analytics/chart-context - AI graph chat context
 """
 
+import hashlib
 from datetime import date, timedelta
 from functools import lru_cache
-from time import time
 from typing import Optional
 
 import duckdb
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
 
 # =============================================================================
 # CACHING INFRASTRUCTURE
 # =============================================================================
 # Light in-memory caching for hot endpoints.
-# - /analytics/metrics: 1 hour TTL (static catalog)
-# - /analytics/overview: 5 minutes TTL (summary tiles)
+# - /analytics/metrics: built once at import (static catalog)
+# - /analytics/overview: keyed by data version (daily_metrics_meta run_id),
+#   so entries stay valid until the next DuckDB build
+# Cached responses are held as serialized JSON and returned as-is, skipping
+# FastAPI's response_model validation and encoding on every hit.
 # No caching for time series, anomalies, correlations, chart-context.
+# Every endpoint also sends an ETag over the request URL and data version
+# (the catalog's over its JSON) and answers a matching If-None-Match with 304.
 
-METRICS_CACHE_TTL = 3600  # 1 hour
-OVERVIEW_CACHE_TTL = 300  # 5 minutes
+OVERVIEW_CACHE_SIZE = 16
 
-_cache_store: dict[str, tuple[float, any]] = {}
-
-
-def get_cached(key: str, ttl: int) -> Optional[any]:
-    """Get value from cache if not expired."""
-    if key in _cache_store:
-        timestamp, value = _cache_store[key]
-        if time() - timestamp < ttl:
-            return value
-        del _cache_store[key]
-    return None
-
-
-def set_cached(key: str, value: any) -> None:
-    """Store value in cache with current timestamp."""
-    _cache_store[key] = (time(), value)
-
-from backend.healthdata.config import DUCKDB_PATH
+from backend.healthdata.storage.duckdb_pool import get_read_cursor
 from backend.healthdata.api.schemas import (
     AnomaliesResponse,
     AnomalyItem,
@@ -59,7 +47,6 @@ from backend.healthdata.api.schemas import (
     ChartContextResponse,
     CorrelationItem,
     CorrelationsResponse,
-    DailyMetricPoint,
     DailyMetricResponse,
     DataQualityIndicators,
     MetricCategory,
@@ -189,10 +176,58 @@ METRICS_CATALOG: dict[str, MetricInfo] = {
     ),
 }
 
+METRIC_DISPLAY_NAMES: dict[str, str] = {
+    key: info.display_name for key, info in METRICS_CATALOG.items()
+}
+
+# Enum members by stored value, so row loops skip Enum's value lookup
+ANOMALY_LEVELS: dict[str, AnomalyLevel] = {level.value: level for level in AnomalyLevel}
+
+METRICS_CATALOG_JSON = MetricsCatalogResponse(
+    metrics=list(METRICS_CATALOG.values()),
+    count=len(METRICS_CATALOG),
+).model_dump_json()
+
 
 def get_db_connection() -> duckdb.DuckDBPyConnection:
-    """Get a read-only DuckDB connection."""
-    return duckdb.connect(str(DUCKDB_PATH), read_only=True)
+    """Get a cursor on the shared read-only DuckDB connection."""
+    return get_read_cursor()
+
+
+def data_version(con: duckdb.DuckDBPyConnection) -> Optional[int]:
+    """Run id of the latest daily_metrics build (None for pre-versioned DBs)."""
+    try:
+        return con.execute("SELECT MAX(run_id) FROM daily_metrics_meta").fetchone()[0]
+    except duckdb.CatalogException:
+        return None
+
+
+def etag_headers(request: Request, version: object) -> dict[str, str]:
+    """ETag/Cache-Control for a response that depends only on the request URL and version."""
+    if version is None:
+        return {}  # pre-versioned database: no validator
+    key = f"{request.url.path}?{request.url.query}|{version}"
+    return {"ETag": f'"{hashlib.md5(key.encode()).hexdigest()}"', "Cache-Control": "no-cache"}
+
+
+def not_modified(request: Request, headers: dict[str, str]) -> Optional[Response]:
+    """304 response when the client already holds this ETag, else None."""
+    if headers and request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return None
+
+
+# Row-level response models (AnomalyItem, CorrelationItem, OverviewTile) are built with model_construct(): their fields come straight
+# from typed DuckDB columns, so per-row validation would only re-check them.
+def fetch_columns(con: duckdb.DuckDBPyConnection, query: str, params: list) -> dict[str, list]:
+    """Run a query and return its result as column lists (via Arrow, no row tuples)."""
+    table = con.execute(query, params).fetch_arrow_table()
+    return {name: table.column(name).to_pylist() for name in table.column_names}
+
+
+def get_display_name(metric_key: str) -> str:
+    """Display name for a metric key, falling back to the key itself."""
+    return METRIC_DISPLAY_NAMES.get(metric_key, metric_key)
 
 
 def validate_metric_key(metric_key: str) -> MetricInfo:
@@ -200,43 +235,50 @@ def validate_metric_key(metric_key: str) -> MetricInfo:
     if metric_key not in METRICS_CATALOG:
         raise HTTPException(
             status_code=400,
-            detail=f"Unknown metric_key: {metric_key}. Valid keys: {list(METRICS_CATALOG.keys())}"
+            detail=f"Unknown metric_key: {metric_key}. Valid keys: {list(METRICS_CATALOG)}"
         )
     return METRICS_CATALOG[metric_key]
 
 
 def validate_date_range(start_date: date, end_date: date) -> None:
     """Validate date range is sensible."""
-    if start_date > end_date:
+    span_days = end_date.toordinal() - start_date.toordinal()
+    if span_days < 0:
         raise HTTPException(
             status_code=400,
             detail=f"start_date ({start_date}) must be <= end_date ({end_date})"
         )
-    if (end_date - start_date).days > 730:
+    if span_days > 730:
         raise HTTPException(
             status_code=400,
             detail="Date range cannot exceed 2 years (730 days)"
         )
 
 
-def interpret_correlation(corr: float, metric_a: str, metric_b: str, lag: int) -> str:
-    """Generate human-readable interpretation of correlation."""
-    strength = "strong" if abs(corr) >= 0.6 else "moderate" if abs(corr) >= 0.4 else "weak"
-    direction = "positive" if corr > 0 else "negative"
+# Strength/direction label for a correlations row, e.g. 'Moderate negative'
+CORRELATION_STRENGTH_SQL = """
+    CASE
+        WHEN ABS(corr) >= 0.6 THEN 'Strong'
+        WHEN ABS(corr) >= 0.4 THEN 'Moderate'
+        ELSE 'Weak'
+    END || CASE WHEN corr > 0 THEN ' positive' ELSE ' negative' END
+"""
+
+
+def interpret_correlation(strength: str, metric_a: str, metric_b: str, lag: int) -> str:
+    """Generate human-readable interpretation of correlation.
     
-    a_name = METRICS_CATALOG.get(metric_a, MetricInfo(
-        metric_key=metric_a, display_name=metric_a, unit="", category=MetricCategory.activity
-    )).display_name
-    b_name = METRICS_CATALOG.get(metric_b, MetricInfo(
-        metric_key=metric_b, display_name=metric_b, unit="", category=MetricCategory.activity
-    )).display_name
+    strength is the CORRELATION_STRENGTH_SQL label computed with the row.
+    """
+    a_name = get_display_name(metric_a)
+    b_name = get_display_name(metric_b)
     
     if lag == 0:
-        return f"{strength.capitalize()} {direction} correlation between {a_name} and {b_name}"
+        return f"{strength} correlation between {a_name} and {b_name}"
     elif lag > 0:
-        return f"{strength.capitalize()} {direction} correlation: {a_name} leads {b_name} by {lag} day(s)"
+        return f"{strength} correlation: {a_name} leads {b_name} by {lag} day(s)"
     else:
-        return f"{strength.capitalize()} {direction} correlation: {b_name} leads {a_name} by {abs(lag)} day(s)"
+        return f"{strength} correlation: {b_name} leads {a_name} by {abs(lag)} day(s)"
 
 
 # =============================================================================
@@ -244,7 +286,7 @@ def interpret_correlation(corr: float, metric_a: str, metric_b: str, lag: int) -
 # =============================================================================
 
 @router.get("/metrics", response_model=MetricsCatalogResponse)
-async def get_metrics_catalog() -> MetricsCatalogResponse:
+async def get_metrics_catalog(request: Request) -> Response:
     """
     Get the catalog of all available metrics.
     
@@ -252,17 +294,12 @@ async def get_metrics_catalog() -> MetricsCatalogResponse:
     - Dashboard metric selector
     - AI graph chat metric awareness
     
-    Cached for 1 hour (static catalog).
+    Static catalog, built once at import.
     """
-    cache_key = "metrics_catalog"
-    cached = get_cached(cache_key, METRICS_CACHE_TTL)
-    if cached is not None:
-        return cached
-    
-    metrics = list(METRICS_CATALOG.values())
-    response = MetricsCatalogResponse(metrics=metrics, count=len(metrics))
-    set_cached(cache_key, response)
-    return response
+    headers = etag_headers(request, METRICS_CATALOG_JSON)
+    return not_modified(request, headers) or Response(
+        content=METRICS_CATALOG_JSON, media_type="application/json", headers=headers
+    )
 
 
 # =============================================================================
@@ -271,27 +308,36 @@ async def get_metrics_catalog() -> MetricsCatalogResponse:
 
 @router.get("/metric/daily", response_model=DailyMetricResponse)
 async def get_daily_metric(
+    request: Request,
     metric_key: str = Query(..., description="Metric key from catalog"),
     start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
-) -> DailyMetricResponse:
+) -> Response:
     """
     Get daily time series for a metric with baseline bands.
     
     Returns data points ordered by date ASC.
     Missing days are NOT backfilled - nulls preserved.
+    
+    Points are emitted as plain dicts straight from the Arrow result (up to
+    730 of them), shaped in SQL to match DailyMetricPoint.
     """
     metric_info = validate_metric_key(metric_key)
     validate_date_range(start_date, end_date)
     
     con = get_db_connection()
     try:
+        headers = etag_headers(request, data_version(con))
+        cached = not_modified(request, headers)
+        if cached is not None:
+            return cached
+        
         # Query daily_metrics with LEFT JOIN to baselines and anomalies
         query = """
             SELECT 
-                dm.date,
+                strftime(dm.date, '%Y-%m-%d') as date,
                 dm.value,
-                dm.unit,
+                COALESCE(NULLIF(dm.unit, ''), ?) as unit,
                 b.baseline_28d_p25 as baseline_p25,
                 b.baseline_28d_p75 as baseline_p75,
                 b.baseline_28d_median as baseline_median,
@@ -306,30 +352,19 @@ async def get_daily_metric(
                 AND dm.date <= ?
             ORDER BY dm.date ASC
         """
-        result = con.execute(query, [metric_key, start_date, end_date]).fetchall()
-        
-        data = [
-            DailyMetricPoint(
-                date=row[0],
-                value=row[1],
-                unit=row[2] or metric_info.unit,
-                baseline_p25=row[3],
-                baseline_p75=row[4],
-                baseline_median=row[5],
-                anomaly_level=AnomalyLevel(row[6]) if row[6] else AnomalyLevel.none,
-            )
-            for row in result
-        ]
+        data = con.execute(
+            query, [metric_info.unit, metric_key, start_date, end_date]
+        ).fetch_arrow_table().to_pylist()
         
-        return DailyMetricResponse(
-            metric_key=metric_key,
-            display_name=metric_info.display_name,
-            unit=metric_info.unit,
-            start_date=start_date,
-            end_date=end_date,
-            data=data,
-            count=len(data),
-        )
+        return JSONResponse({
+            "metric_key": metric_key,
+            "display_name": metric_info.display_name,
+            "unit": metric_info.unit,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "data": data,
+            "count": len(data),
+        }, headers=headers)
     finally:
         con.close()
 
@@ -340,56 +375,98 @@ async def get_daily_metric(
 
 @router.get("/overview", response_model=OverviewResponse)
 async def get_overview(
+    request: Request,
     end_date: Optional[date] = Query(None, description="As-of date (default: latest)"),
-) -> OverviewResponse:
+) -> Response:
     """
     Get dashboard overview tiles for all metrics.
     
     Returns latest value, baseline comparison, and 7-day trend.
     
-    Cached for 5 minutes (keyed by end_date).
+    Cached per (end_date, data version): a rebuild invalidates immediately.
     """
-    # Check cache (key includes end_date for query param safety)
-    cache_key = f"overview_{end_date}"
-    cached = get_cached(cache_key, OVERVIEW_CACHE_TTL)
-    if cached is not None:
-        return cached
-    
+    # Keep this cursor open while building: it holds the shared connection,
+    # so no rebuild can land between reading the version and the overview
+    # queries (which would cache new data under the old version).
+    con = get_db_connection()
+    try:
+        version = data_version(con)
+        
+        headers = etag_headers(request, version)
+        cached = not_modified(request, headers)
+        if cached is not None:
+            return cached
+        
+        if version is None:
+            content = build_overview(end_date).model_dump_json()
+        else:
+            content = cached_overview_json(end_date, version)
+        return Response(content=content, media_type="application/json", headers=headers)
+    finally:
+        con.close()
+
+
+@lru_cache(maxsize=OVERVIEW_CACHE_SIZE)
+def cached_overview_json(end_date: Optional[date], version: int) -> str:
+    """Serialized overview; version only partitions the cache."""
+    return build_overview(end_date).model_dump_json()
+
+
+def build_overview(end_date: Optional[date]) -> OverviewResponse:
+    """Compute overview tiles as of end_date (latest data if None)."""
     con = get_db_connection()
     try:
         # Get latest date if not specified
         if end_date is None:
             result = con.execute("SELECT MAX(date) FROM daily_metrics").fetchone()
             end_date = result[0] if result and result[0] else date.today()
-            # Update cache key with resolved date
-            cache_key = f"overview_{end_date}"
+        
+        # Latest row, its baseline/anomaly and 7-day trend endpoints per metric,
+        # all in one query
+        rows = con.execute("""
+            WITH latest AS (
+                SELECT metric_key, date, value
+                FROM daily_metrics
+                WHERE metric_key = ANY(?) AND date <= ?
+                QUALIFY ROW_NUMBER() OVER (PARTITION BY metric_key ORDER BY date DESC) = 1
+            ),
+            trend AS (
+                SELECT 
+                    l.metric_key,
+                    ARG_MIN(d.value, d.date) as first_value,
+                    ARG_MAX(d.value, d.date) as last_value,
+                    COUNT(*) as points
+                FROM latest l
+                JOIN daily_metrics d
+                    ON d.metric_key = l.metric_key
+                    AND d.date > l.date - INTERVAL 7 DAY
+                    AND d.date <= l.date
+                GROUP BY l.metric_key
+            )
+            SELECT 
+                l.metric_key,
+                l.date,
+                l.value,
+                b.baseline_28d_median,
+                t.first_value,
+                t.last_value,
+                t.points,
+                a.anomaly_level
+            FROM latest l
+            LEFT JOIN baselines b ON b.metric_key = l.metric_key AND b.date = l.date
+            LEFT JOIN anomalies a ON a.metric_key = l.metric_key AND a.date = l.date
+            LEFT JOIN trend t ON t.metric_key = l.metric_key
+        """, [list(METRICS_CATALOG), end_date]).fetchall()
+        by_metric = {row[0]: row[1:] for row in rows}
         
         tiles = []
         
         for metric_key, metric_info in METRICS_CATALOG.items():
-            # Get latest value
-            latest_query = """
-                SELECT date, value, unit
-                FROM daily_metrics
-                WHERE metric_key = ? AND date <= ?
-                ORDER BY date DESC
-                LIMIT 1
-            """
-            latest = con.execute(latest_query, [metric_key, end_date]).fetchone()
-            
-            if not latest:
+            if metric_key not in by_metric:
                 continue
             
-            latest_date, latest_value, unit = latest
-            
-            # Get baseline for latest date
-            baseline_query = """
-                SELECT baseline_28d_median
-                FROM baselines
-                WHERE metric_key = ? AND date = ?
-            """
-            baseline = con.execute(baseline_query, [metric_key, latest_date]).fetchone()
-            baseline_median = baseline[0] if baseline else None
+            (latest_date, latest_value, baseline_median,
+             first_val, last_val, trend_points, anomaly) = by_metric[metric_key]
             
             # Calculate delta vs baseline
             delta_vs_baseline = None
@@ -399,21 +476,9 @@ async def get_overview(
                 if baseline_median != 0:
                     delta_percent = (delta_vs_baseline / baseline_median) * 100
             
-            # Get 7-day trend
-            trend_query = """
-                SELECT value
-                FROM daily_metrics
-                WHERE metric_key = ? 
-                    AND date > ? - INTERVAL 7 DAY
-                    AND date <= ?
-                ORDER BY date ASC
-            """
-            trend_data = con.execute(trend_query, [metric_key, latest_date, latest_date]).fetchall()
-            
+            # 7-day trend from first/last value in the window
             trend_7d = TrendDirection.flat
-            if len(trend_data) >= 2:
-                first_val = trend_data[0][0]
-                last_val = trend_data[-1][0]
+            if trend_points and trend_points >= 2:
                 if first_val and last_val:
                     change = last_val - first_val
                     threshold = abs(first_val) * 0.05  # 5% threshold
@@ -422,16 +487,9 @@ async def get_overview(
                     elif change < -threshold:
                         trend_7d = TrendDirection.down
             
-            # Get anomaly level for latest date
-            anomaly_query = """
-                SELECT anomaly_level
-                FROM anomalies
-                WHERE metric_key = ? AND date = ?
-            """
-            anomaly = con.execute(anomaly_query, [metric_key, latest_date]).fetchone()
-            anomaly_level = AnomalyLevel(anomaly[0]) if anomaly else AnomalyLevel.none
+            anomaly_level = ANOMALY_LEVELS.get(anomaly, AnomalyLevel.none)
             
-            tiles.append(OverviewTile(
+            tiles.append(OverviewTile.model_construct(
                 metric_key=metric_key,
                 display_name=metric_info.display_name,
                 latest_value=latest_value,
@@ -449,7 +507,6 @@ async def get_overview(
             tiles=tiles,
             count=len(tiles),
         )
-        set_cached(cache_key, response)
         return response
     finally:
         con.close()
@@ -461,6 +518,8 @@ async def get_overview(
 
 @router.get("/anomalies", response_model=AnomaliesResponse)
 async def get_anomalies(
+    request: Request,
+    response: Response,
     start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
     min_level: AnomalyLevel = Query(AnomalyLevel.mild, description="Minimum anomaly level"),
@@ -474,6 +533,12 @@ async def get_anomalies(
     
     con = get_db_connection()
     try:
+        headers = etag_headers(request, data_version(con))
+        cached = not_modified(request, headers)
+        if cached is not None:
+            return cached
+        response.headers.update(headers)
+        
         # Build level filter
         if min_level == AnomalyLevel.strong:
             level_filter = "anomaly_level = 'strong'"
@@ -487,22 +552,21 @@ async def get_anomalies(
                 AND {level_filter}
             ORDER BY date DESC, metric_key
         """
-        result = con.execute(query, [start_date, end_date]).fetchall()
+        cols = fetch_columns(con, query, [start_date, end_date])
         
         anomalies = []
-        for row in result:
-            metric_key = row[1]
-            metric_info = METRICS_CATALOG.get(metric_key)
-            display_name = metric_info.display_name if metric_info else metric_key
-            
-            anomalies.append(AnomalyItem(
-                date=row[0],
+        for d, metric_key, value, median, level, reason in zip(
+            cols["date"], cols["metric_key"], cols["value"],
+            cols["baseline_median"], cols["anomaly_level"], cols["reason"],
+        ):
+            anomalies.append(AnomalyItem.model_construct(
+                date=d,
                 metric_key=metric_key,
-                display_name=display_name,
-                value=row[2],
-                baseline_median=row[3],
-                anomaly_level=AnomalyLevel(row[4]),
-                reason=row[5] or "",
+                display_name=get_display_name(metric_key),
+                value=value,
+                baseline_median=median,
+                anomaly_level=ANOMALY_LEVELS[level],
+                reason=reason or "",
             ))
         
         return AnomaliesResponse(
@@ -522,6 +586,8 @@ async def get_anomalies(
 
 @router.get("/correlations", response_model=CorrelationsResponse)
 async def get_correlations(
+    request: Request,
+    response: Response,
     metric_key: str = Query(..., description="Metric key to find correlations for"),
     window_days: int = Query(90, description="Window days (default 90)"),
 ) -> CorrelationsResponse:
@@ -535,8 +601,14 @@ async def get_correlations(
     
     con = get_db_connection()
     try:
-        query = """
-            SELECT metric_a, metric_b, lag_days, corr, n, window_days
+        headers = etag_headers(request, data_version(con))
+        cached = not_modified(request, headers)
+        if cached is not None:
+            return cached
+        response.headers.update(headers)
+        
+        query = f"""
+            SELECT metric_a, metric_b, lag_days, corr, n, {CORRELATION_STRENGTH_SQL} as strength
             FROM correlations
             WHERE (metric_a = ? OR metric_b = ?)
                 AND window_days = ?
@@ -548,18 +620,15 @@ async def get_correlations(
         for row in result:
             metric_a, metric_b = row[0], row[1]
             
-            a_info = METRICS_CATALOG.get(metric_a)
-            b_info = METRICS_CATALOG.get(metric_b)
-            
-            correlations.append(CorrelationItem(
+            correlations.append(CorrelationItem.model_construct(
                 metric_a=metric_a,
                 metric_b=metric_b,
-                metric_a_display=a_info.display_name if a_info else metric_a,
-                metric_b_display=b_info.display_name if b_info else metric_b,
+                metric_a_display=get_display_name(metric_a),
+                metric_b_display=get_display_name(metric_b),
                 lag_days=row[2],
                 corr=round(row[3], 3),
                 n=row[4],
-                interpretation=interpret_correlation(row[3], metric_a, metric_b, row[2]),
+                interpretation=interpret_correlation(row[5], metric_a, metric_b, row[2]),
             ))
         
         return CorrelationsResponse(
@@ -578,6 +647,8 @@ async def get_correlations(
 
 @router.get("/chart-context", response_model=ChartContextResponse)
 async def get_chart_context(
+    request: Request,
+    response: Response,
     metric_key: str = Query(..., description="Metric key"),
     start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
@@ -596,139 +667,168 @@ async def get_chart_context(
     
     con = get_db_connection()
     try:
-        # Get time series data (last 90 points max)
-        ts_query = """
-            SELECT date, value
-            FROM daily_metrics
-            WHERE metric_key = ?
-                AND date >= ?
-                AND date <= ?
-            ORDER BY date DESC
-            LIMIT 90
+        headers = etag_headers(request, data_version(con))
+        cached = not_modified(request, headers)
+        if cached is not None:
+            return cached
+        response.headers.update(headers)
+        
+        # One statement for every section: the last 90 points of the series
+        # and their min/max, the baseline on focus_date (or the latest point),
+        # the 10 most recent anomalies plus range-wide mild/strong counts
+        # (window counts are computed before LIMIT), the top 5 correlations
+        # and the average sample count over the range
+        context_query = f"""
+            WITH ranged AS (
+                SELECT date, value, sample_count
+                FROM daily_metrics
+                WHERE metric_key = $metric_key
+                    AND date >= $start_date
+                    AND date <= $end_date
+            ),
+            series AS (
+                SELECT
+                    LIST(date ORDER BY date) as dates,
+                    LIST(value ORDER BY date) as "values",
+                    MIN(value) as min_value,
+                    MAX(value) as max_value,
+                    COUNT(value) as days_with_data,
+                    MAX(date) as last_date
+                FROM (
+                    SELECT date, value
+                    FROM ranged
+                    ORDER BY date DESC
+                    LIMIT 90
+                )
+            ),
+            recent_anomalies AS (
+                SELECT
+                    date, metric_key, value, baseline_median, anomaly_level, reason,
+                    COUNT(*) FILTER (WHERE anomaly_level = 'mild') OVER () as mild_count,
+                    COUNT(*) FILTER (WHERE anomaly_level = 'strong') OVER () as strong_count
+                FROM anomalies
+                WHERE metric_key = $metric_key
+                    AND date >= $start_date
+                    AND date <= $end_date
+                    AND anomaly_level != 'none'
+                ORDER BY date DESC
+                LIMIT 10
+            ),
+            top_correlations AS (
+                SELECT metric_a, metric_b, lag_days, corr, n, {CORRELATION_STRENGTH_SQL} as strength
+                FROM correlations
+                WHERE (metric_a = $metric_key OR metric_b = $metric_key)
+                ORDER BY ABS(corr) DESC
+                LIMIT 5
+            )
+            SELECT
+                s.dates,
+                s."values",
+                s.min_value,
+                s.max_value,
+                s.days_with_data,
+                b.baseline_28d_median,
+                b.baseline_28d_p25,
+                b.baseline_28d_p75,
+                (
+                    SELECT LIST({{
+                        'date': date, 'metric_key': metric_key, 'value': value,
+                        'baseline_median': baseline_median,
+                        'anomaly_level': anomaly_level, 'reason': reason
+                    }} ORDER BY date DESC)
+                    FROM recent_anomalies
+                ) as recent_anomalies,
+                (SELECT COALESCE(MAX(mild_count), 0) FROM recent_anomalies) as mild_count,
+                (SELECT COALESCE(MAX(strong_count), 0) FROM recent_anomalies) as strong_count,
+                (
+                    SELECT LIST({{
+                        'metric_a': metric_a, 'metric_b': metric_b, 'lag_days': lag_days,
+                        'corr': corr, 'n': n, 'strength': strength
+                    }} ORDER BY ABS(corr) DESC)
+                    FROM top_correlations
+                ) as correlations,
+                (SELECT AVG(sample_count) FROM ranged) as avg_sample_count
+            FROM series s
+            LEFT JOIN baselines b
+                ON b.metric_key = $metric_key
+                AND b.date = COALESCE($focus_date, s.last_date, $end_date)
         """
-        ts_result = con.execute(ts_query, [metric_key, start_date, end_date]).fetchall()
-        ts_result.reverse()  # Chronological order
+        (
+            dates, values, min_value, max_value, days_with_data,
+            baseline_median, baseline_p25, baseline_p75,
+            anomaly_rows, mild_count, strong_count, corr_rows, avg_sample_count,
+        ) = con.execute(context_query, {
+            "metric_key": metric_key,
+            "start_date": start_date,
+            "end_date": end_date,
+            "focus_date": focus_date,
+        }).fetchone()
         
-        dates = [row[0] for row in ts_result]
-        values = [row[1] for row in ts_result]
+        dates = dates or []
+        values = values or []
+        # Mean summed in date order in Python, as before the single statement
         non_null_values = [v for v in values if v is not None]
         
         time_series = TimeSeriesSummary(
             last_n_days=len(dates),
             values=values,
             dates=dates,
-            min_value=min(non_null_values) if non_null_values else None,
-            max_value=max(non_null_values) if non_null_values else None,
+            min_value=min_value,
+            max_value=max_value,
             mean_value=sum(non_null_values) / len(non_null_values) if non_null_values else None,
         )
         
-        # Get baseline for focus_date or latest date
-        baseline_date = focus_date or (dates[-1] if dates else end_date)
-        baseline_query = """
-            SELECT baseline_28d_median, baseline_28d_p25, baseline_28d_p75
-            FROM baselines
-            WHERE metric_key = ? AND date = ?
-        """
-        baseline_result = con.execute(baseline_query, [metric_key, baseline_date]).fetchone()
-        
         baseline = BaselineSummary(
-            current_median=baseline_result[0] if baseline_result else None,
-            current_p25=baseline_result[1] if baseline_result else None,
-            current_p75=baseline_result[2] if baseline_result else None,
-            has_baseline=baseline_result is not None and baseline_result[0] is not None,
+            current_median=baseline_median,
+            current_p25=baseline_p25,
+            current_p75=baseline_p75,
+            has_baseline=baseline_median is not None,
         )
         
-        # Get anomalies in range
-        anomaly_query = """
-            SELECT date, metric_key, value, baseline_median, anomaly_level, reason
-            FROM anomalies
-            WHERE metric_key = ?
-                AND date >= ?
-                AND date <= ?
-                AND anomaly_level != 'none'
-            ORDER BY date DESC
-            LIMIT 10
-        """
-        anomaly_result = con.execute(anomaly_query, [metric_key, start_date, end_date]).fetchall()
-        
         recent_anomalies = [
-            AnomalyItem(
-                date=row[0],
-                metric_key=row[1],
+            AnomalyItem.model_construct(
+                date=row["date"],
+                metric_key=row["metric_key"],
                 display_name=metric_info.display_name,
-                value=row[2],
-                baseline_median=row[3],
-                anomaly_level=AnomalyLevel(row[4]),
-                reason=row[5] or "",
+                value=row["value"],
+                baseline_median=row["baseline_median"],
+                anomaly_level=ANOMALY_LEVELS[row["anomaly_level"]],
+                reason=row["reason"] or "",
             )
-            for row in anomaly_result
+            for row in anomaly_rows or []
         ]
         
-        # Count anomalies
-        count_query = """
-            SELECT 
-                COUNT(*) FILTER (WHERE anomaly_level = 'mild') as mild,
-                COUNT(*) FILTER (WHERE anomaly_level = 'strong') as strong
-            FROM anomalies
-            WHERE metric_key = ?
-                AND date >= ?
-                AND date <= ?
-        """
-        count_result = con.execute(count_query, [metric_key, start_date, end_date]).fetchone()
-        
         anomalies = AnomalySummary(
-            total_count=(count_result[0] or 0) + (count_result[1] or 0),
-            mild_count=count_result[0] or 0,
-            strong_count=count_result[1] or 0,
+            total_count=mild_count + strong_count,
+            mild_count=mild_count,
+            strong_count=strong_count,
             recent_anomalies=recent_anomalies,
         )
         
-        # Get correlations
-        corr_query = """
-            SELECT metric_a, metric_b, lag_days, corr, n
-            FROM correlations
-            WHERE (metric_a = ? OR metric_b = ?)
-            ORDER BY ABS(corr) DESC
-            LIMIT 5
-        """
-        corr_result = con.execute(corr_query, [metric_key, metric_key]).fetchall()
-        
         correlations = [
-            CorrelationItem(
-                metric_a=row[0],
-                metric_b=row[1],
-                metric_a_display=METRICS_CATALOG.get(row[0], MetricInfo(
-                    metric_key=row[0], display_name=row[0], unit="", category=MetricCategory.activity
-                )).display_name,
-                metric_b_display=METRICS_CATALOG.get(row[1], MetricInfo(
-                    metric_key=row[1], display_name=row[1], unit="", category=MetricCategory.activity
-                )).display_name,
-                lag_days=row[2],
-                corr=round(row[3], 3),
-                n=row[4],
-                interpretation=interpret_correlation(row[3], row[0], row[1], row[2]),
+            CorrelationItem.model_construct(
+                metric_a=row["metric_a"],
+                metric_b=row["metric_b"],
+                metric_a_display=get_display_name(row["metric_a"]),
+                metric_b_display=get_display_name(row["metric_b"]),
+                lag_days=row["lag_days"],
+                corr=round(row["corr"], 3),
+                n=row["n"],
+                interpretation=interpret_correlation(
+                    row["strength"], row["metric_a"], row["metric_b"], row["lag_days"]
+                ),
             )
-            for row in corr_result
+            for row in corr_rows or []
         ]
         
         # Data quality
         total_days = (end_date - start_date).days + 1
-        days_with_data = len([v for v in values if v is not None])
-        
-        sample_query = """
-            SELECT AVG(sample_count)
-            FROM daily_metrics
-            WHERE metric_key = ?
-                AND date >= ?
-                AND date <= ?
-        """
-        sample_result = con.execute(sample_query, [metric_key, start_date, end_date]).fetchone()
         
         data_quality = DataQualityIndicators(
             total_days=total_days,
             days_with_data=days_with_data,
             coverage_percent=round((days_with_data / total_days) * 100, 1) if total_days > 0 else 0,
-            avg_sample_count=round(sample_result[0], 1) if sample_result and sample_result[0] else None,
+            avg_sample_count=round(avg_sample_count, 1) if avg_sample_count else None,
         )
         
         return ChartContextResponse(
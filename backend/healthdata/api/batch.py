@@ -0,0 +1,101 @@
+"""
+Batch API Endpoint
+
+- POST /analytics/batch - Run several GET /analytics/* requests in one round-trip
+
+Each sub-request is dispatched in-process through the ASGI app, so it gets the
+same validation, caching and ETag handling as a direct call, without an HTTP
+round-trip per panel. Sub-requests run concurrently and share the pooled
+read-only DuckDB connection; results come back in request order.
+"""
+
+import asyncio
+import json
+from typing import Any
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import BaseModel
+
+router = APIRouter(prefix="/analytics", tags=["batch"])
+
+BATCH_MAX_ITEMS = 20
+
+
+class BatchItem(BaseModel):
+    path: str
+    params: dict[str, Any] = {}
+
+
+class BatchResult(BaseModel):
+    path: str
+    status: int
+    body: Any
+
+
+async def dispatch(app, item: BatchItem) -> tuple[int, str]:
+    """Run one GET sub-request against the app; returns (status, JSON body)."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": item.path,
+        "raw_path": item.path.encode(),
+        "root_path": "",
+        "query_string": urlencode(item.params, doseq=True).encode(),
+        "headers": [(b"host", b"batch")],
+        "client": None,
+        "server": None,
+    }
+    request_sent = False
+    status = 500
+    is_json = False
+    chunks = []
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status, is_json
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            headers = dict(message.get("headers", []))
+            is_json = headers.get(b"content-type", b"").startswith(b"application/json")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    body = b"".join(chunks).decode()
+    if not is_json:
+        body = json.dumps(body or None)
+    return status, body
+
+
+@router.post("/batch", response_model=list[BatchResult])
+async def post_batch(request: Request, items: list[BatchItem]) -> Response:
+    """
+    Run several analytics GET requests in one call.
+
+    Body: [{"path": "/analytics/scores", "params": {"start_date": ..., ...}}, ...]
+    Each result carries the sub-request's status and JSON body, in order.
+    """
+    if len(items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_ITEMS} requests per batch")
+    for item in items:
+        if not item.path.startswith("/analytics/") or item.path == "/analytics/batch":
+            raise HTTPException(status_code=400, detail=f"Unsupported batch path: {item.path}")
+
+    responses = await asyncio.gather(*(dispatch(request.app, item) for item in items))
+
+    # Sub-responses are already serialized JSON; splice them in as-is
+    results = [
+        f'{{"path":{json.dumps(item.path)},"status":{status},"body":{body}}}'
+        for item, (status, body) in zip(items, responses)
+    ]
+    return Response(content="[" + ",".join(results) + "]", media_type="application/json")
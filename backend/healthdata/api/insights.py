@@ -6,23 +6,39 @@ New endpoints for WHOOP-style dashboard cards:
 - GET /analytics/recovery-vs-strain - Quadrant scatter data
 - GET /analytics/effort-composition - Effort breakdown by component
 - GET /analytics/readiness-timeline - Annotated recovery timeline
+- GET /analytics/dashboard - All four cards in one response
 
-All endpoints are read-only and query pre-computed derived_scores_daily table.
+All endpoints are read-only and query the pre-computed derived_scores_daily
+and derived_timeline_daily tables.
 No analytics computation happens in these endpoints.
 """
 
+import asyncio
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from enum import Enum
 from typing import Optional
 
 import duckdb
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 
-from backend.healthdata.config import DUCKDB_PATH
+from backend.healthdata.storage.duckdb_pool import get_read_cursor
 
 router = APIRouter(prefix="/analytics", tags=["insights"])
 
+# Serialized response bodies by ETag (request URL + data build), so a repeat
+# request against an unchanged build skips the query and serialization.
+# Least recently used entries are evicted first.
+RESPONSE_CACHE_SIZE = 64
+_response_cache: OrderedDict[str, str] = OrderedDict()
+
+# Worker threads for /dashboard, one per card query. DuckDB releases the GIL
+# while executing, so the four queries run side by side on separate cursors.
+_dashboard_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="insights-dashboard")
+
 
 # =============================================================================
 # PYDANTIC MODELS
@@ -54,10 +70,13 @@ class AnnotationType(str, Enum):
     recovery_down = "recovery_down"
 
 
-class Contributors(BaseModel):
-    hrv_pct: Optional[float] = None
-    rhr_pct: Optional[float] = None
-    effort_pct: Optional[float] = None
+ANNOTATION_TEXT = {
+    AnnotationType.high_strain.value: "High strain day",
+    AnnotationType.low_hrv.value: "HRV dipped below usual",
+    AnnotationType.high_rhr.value: "Resting HR elevated",
+    AnnotationType.recovery_up.value: "Recovery improved",
+    AnnotationType.recovery_down.value: "Recovery dropped",
+}
 
 
 class DataQuality(BaseModel):
@@ -74,7 +93,11 @@ class DailyScore(BaseModel):
     strain_score: Optional[int] = None
     strain_label: Optional[str] = None
     strain_primary_metric: Optional[str] = None
-    contributors: Contributors
+    # Recovery contributors (% share of the recovery score), kept flat so each
+    # row is a single model
+    hrv_pct: Optional[float] = None
+    rhr_pct: Optional[float] = None
+    effort_pct: Optional[float] = None
 
 
 class ScoresResponse(BaseModel):
@@ -133,13 +156,100 @@ class ReadinessTimelineResponse(BaseModel):
     count: int
 
 
+class DashboardResponse(BaseModel):
+    start_date: str
+    end_date: str
+    scores: ScoresResponse
+    recovery_vs_strain: RecoveryVsStrainResponse
+    effort_composition: EffortCompositionResponse
+    readiness_timeline: ReadinessTimelineResponse
+
+
 # =============================================================================
 # HELPERS
 # =============================================================================
 
 def get_db_connection() -> duckdb.DuckDBPyConnection:
-    """Get read-only DuckDB connection."""
-    return duckdb.connect(str(DUCKDB_PATH), read_only=True)
+    """Get a cursor on the shared read-only DuckDB connection."""
+    return get_read_cursor()
+
+
+def cached_response(
+    con: duckdb.DuckDBPyConnection, request: Request, response: Response
+) -> Optional[Response]:
+    """
+    Conditional-request and response-cache check for the insight endpoints.
+    
+    The ETag covers the request URL plus the current build of the tables
+    these endpoints read (derived_scores_daily computed_at and the
+    daily_metrics run id), so it changes exactly when a rebuild could change
+    the response. Sets ETag/Cache-Control on the response and returns a 304
+    when the client already holds this version, the cached body when the
+    server does, otherwise None.
+    """
+    try:
+        versions = con.execute("""
+            SELECT
+                (SELECT MAX(computed_at) FROM derived_scores_daily),
+                (SELECT MAX(run_id) FROM daily_metrics_meta)
+        """).fetchone()
+    except duckdb.CatalogException:
+        return None  # pre-versioned database: always serve in full
+    
+    key = f"{request.url.path}?{request.url.query}|{versions}"
+    etag = f'"{hashlib.md5(key.encode()).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if etag in _response_cache:
+        _response_cache.move_to_end(etag)
+        return Response(content=_response_cache[etag], media_type="application/json", headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def json_response(model: BaseModel, response: Response, include: Optional[dict] = None) -> Response:
+    """
+    Serialize a response model directly with pydantic's JSON serializer.
+    
+    Skips FastAPI's response_model re-validation and jsonable_encoder pass;
+    carries over headers set on the injected response (ETag/Cache-Control)
+    and caches the body under its ETag. include is passed through to
+    model_dump_json (sparse fieldsets).
+    """
+    headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    content = model.model_dump_json(include=include)
+    etag = headers.get("etag")
+    if etag is not None:
+        _response_cache[etag] = content
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def parse_fields(fields: Optional[str], model: type[BaseModel]) -> Optional[set[str]]:
+    """Parse a comma-separated sparse fieldset for model (None = all fields)."""
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - model.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {sorted(unknown)}. Valid fields: {list(model.model_fields)}"
+        )
+    return requested or None
+
+
+def sparse_include(
+    response_model: type[BaseModel], list_field: str, selected: Optional[set[str]]
+) -> Optional[dict]:
+    """model_dump include spec: full envelope, only selected fields per list item."""
+    if selected is None:
+        return None
+    include: dict = dict.fromkeys(response_model.model_fields, True)
+    include[list_field] = {"__all__": selected}
+    return include
 
 
 def validate_date_range(start_date: date, end_date: date, max_days: int = 730):
@@ -159,71 +269,96 @@ def validate_date_range(start_date: date, end_date: date, max_days: int = 730):
 # ENDPOINT 1: GET /analytics/scores
 # =============================================================================
 
+def build_scores(
+    con: duckdb.DuckDBPyConnection, start_date: date, end_date: date
+) -> ScoresResponse:
+    """Query and shape the /scores response."""
+    # Shaped in SQL to the DailyScore field types (date string, integer
+    # scores truncated like int()), so rows can skip model validation.
+    # days_with_data (days with a recovery or strain score, whichever is
+    # more) is a window aggregate over the same scan.
+    table = con.execute("""
+        SELECT 
+            CAST(date AS VARCHAR) AS date,
+            CAST(TRUNC(recovery_score) AS INTEGER) AS recovery_score,
+            recovery_label,
+            recovery_color,
+            CAST(TRUNC(strain_score) AS INTEGER) AS strain_score,
+            strain_label,
+            strain_primary_metric,
+            hrv_pct,
+            rhr_pct,
+            effort_pct,
+            GREATEST(COUNT(recovery_score) OVER (), COUNT(strain_score) OVER ()) AS days_with_data
+        FROM derived_scores_daily
+        WHERE date >= ? AND date <= ?
+        ORDER BY date
+    """, [start_date, end_date]).fetch_arrow_table()
+    cols = {name: table.column(name).to_pylist() for name in table.column_names}
+    
+    total_days = (end_date - start_date).days + 1
+    days_with_data_col = cols.pop("days_with_data")
+    days_with_data = days_with_data_col[0] if days_with_data_col else 0
+    
+    scores = [
+        DailyScore.model_construct(
+            date=d,
+            recovery_score=recovery,
+            recovery_label=recovery_label,
+            recovery_color=recovery_color,
+            strain_score=strain,
+            strain_label=strain_label,
+            strain_primary_metric=strain_metric,
+            hrv_pct=hrv_pct,
+            rhr_pct=rhr_pct,
+            effort_pct=effort_pct,
+        )
+        for (
+            d, recovery, recovery_label, recovery_color, strain, strain_label,
+            strain_metric, hrv_pct, rhr_pct, effort_pct,
+        ) in zip(*cols.values())
+    ]
+    
+    return ScoresResponse(
+        start_date=str(start_date),
+        end_date=str(end_date),
+        scores=scores,
+        data_quality=DataQuality(
+            total_days=total_days,
+            days_with_data=days_with_data,
+            coverage_percent=round(100 * days_with_data / total_days, 1) if total_days > 0 else 0,
+        ),
+    )
+
+
 @router.get("/scores", response_model=ScoresResponse)
 async def get_scores(
+    request: Request,
+    response: Response,
     start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
-) -> ScoresResponse:
+    fields: Optional[str] = Query(None, description="Comma-separated DailyScore fields to return (default: all)"),
+) -> Response:
     """
     Get daily recovery and strain scores for date range.
     
     Returns pre-computed scores from derived_scores_daily table.
     Recovery uses HRV, Resting HR, and Yesterday's Effort.
     Strain uses Physical Effort Load (or Active Energy as fallback).
+    With fields, each score carries only the listed fields.
     """
     validate_date_range(start_date, end_date)
+    selected = parse_fields(fields, DailyScore)
     
     con = get_db_connection()
     try:
-        result = con.execute("""
-            SELECT 
-                date,
-                recovery_score,
-                recovery_label,
-                recovery_color,
-                strain_score,
-                strain_label,
-                strain_primary_metric,
-                hrv_pct,
-                rhr_pct,
-                effort_pct
-            FROM derived_scores_daily
-            WHERE date >= ? AND date <= ?
-            ORDER BY date
-        """, [start_date, end_date]).fetchall()
-        
-        total_days = (end_date - start_date).days + 1
-        days_with_recovery = sum(1 for r in result if r[1] is not None)
-        days_with_strain = sum(1 for r in result if r[4] is not None)
-        days_with_data = max(days_with_recovery, days_with_strain)
+        cached = cached_response(con, request, response)
+        if cached is not None:
+            return cached
         
-        scores = [
-            DailyScore(
-                date=str(row[0]),
-                recovery_score=int(row[1]) if row[1] is not None else None,
-                recovery_label=row[2],
-                recovery_color=row[3],
-                strain_score=int(row[4]) if row[4] is not None else None,
-                strain_label=row[5],
-                strain_primary_metric=row[6],
-                contributors=Contributors(
-                    hrv_pct=row[7],
-                    rhr_pct=row[8],
-                    effort_pct=row[9],
-                ),
-            )
-            for row in result
-        ]
-        
-        return ScoresResponse(
-            start_date=str(start_date),
-            end_date=str(end_date),
-            scores=scores,
-            data_quality=DataQuality(
-                total_days=total_days,
-                days_with_data=days_with_data,
-                coverage_percent=round(100 * days_with_data / total_days, 1) if total_days > 0 else 0,
-            ),
+        return json_response(
+            build_scores(con, start_date, end_date), response,
+            include=sparse_include(ScoresResponse, "scores", selected),
         )
     finally:
         con.close()
@@ -233,11 +368,48 @@ async def get_scores(
 # ENDPOINT 2: GET /analytics/recovery-vs-strain
 # =============================================================================
 
+def build_recovery_vs_strain(
+    con: duckdb.DuckDBPyConnection, start_date: date, end_date: date
+) -> RecoveryVsStrainResponse:
+    """Query and shape the /recovery-vs-strain response."""
+    result = con.execute("""
+        SELECT 
+            CAST(date AS VARCHAR) AS date,
+            CAST(TRUNC(recovery_score) AS INTEGER) AS recovery_score,
+            CAST(TRUNC(strain_score) AS INTEGER) AS strain_score,
+            recovery_color
+        FROM derived_scores_daily
+        WHERE date >= ? AND date <= ?
+            AND recovery_score IS NOT NULL
+            AND strain_score IS NOT NULL
+        ORDER BY date
+    """, [start_date, end_date]).fetchall()
+    
+    points = [
+        RecoveryStrainPoint.model_construct(
+            date=row[0],
+            recovery_score=row[1],
+            strain_score=row[2],
+            recovery_color=row[3],
+        )
+        for row in result
+    ]
+    
+    return RecoveryVsStrainResponse(
+        start_date=str(start_date),
+        end_date=str(end_date),
+        points=points,
+        count=len(points),
+    )
+
+
 @router.get("/recovery-vs-strain", response_model=RecoveryVsStrainResponse)
 async def get_recovery_vs_strain(
+    request: Request,
+    response: Response,
     start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
-) -> RecoveryVsStrainResponse:
+) -> Response:
     """
     Get recovery vs strain scatter plot data.
     
@@ -248,35 +420,11 @@ async def get_recovery_vs_strain(
     
     con = get_db_connection()
     try:
-        result = con.execute("""
-            SELECT 
-                date,
-                recovery_score,
-                strain_score,
-                recovery_color
-            FROM derived_scores_daily
-            WHERE date >= ? AND date <= ?
-                AND recovery_score IS NOT NULL
-                AND strain_score IS NOT NULL
-            ORDER BY date
-        """, [start_date, end_date]).fetchall()
+        cached = cached_response(con, request, response)
+        if cached is not None:
+            return cached
         
-        points = [
-            RecoveryStrainPoint(
-                date=str(row[0]),
-                recovery_score=int(row[1]),
-                strain_score=int(row[2]),
-                recovery_color=row[3],
-            )
-            for row in result
-        ]
-        
-        return RecoveryVsStrainResponse(
-            start_date=str(start_date),
-            end_date=str(end_date),
-            points=points,
-            count=len(points),
-        )
+        return json_response(build_recovery_vs_strain(con, start_date, end_date), response)
     finally:
         con.close()
 
@@ -285,12 +433,110 @@ async def get_recovery_vs_strain(
 # ENDPOINT 3: GET /analytics/effort-composition
 # =============================================================================
 
+# period_start expression per granularity
+EFFORT_PERIOD_START = {
+    "day": "date",
+    "week": "DATE_TRUNC('week', date)",
+    "month": "DATE_TRUNC('month', date)",
+}
+
+# Native PIVOT to one row per day (daily_metrics holds one value per
+# metric per day), then roll days up into periods: volumes are
+# summed, heart_rate_max keeps the period peak. The period's volume
+# total (missing components count as 0) is returned alongside; the
+# component shares are computed and rounded in Python (none when the
+# total is 0).
+EFFORT_COMPOSITION_TEMPLATE = """
+    WITH daily AS (
+        PIVOT (
+            SELECT date, metric_key, value
+            FROM daily_metrics
+            WHERE date >= ? AND date <= ?
+                AND metric_key IN ('steps', 'flights_climbed', 'active_energy', 'exercise_time', 'heart_rate_max')
+        )
+        ON metric_key IN ('steps', 'flights_climbed', 'active_energy', 'exercise_time', 'heart_rate_max')
+        USING MAX(value)
+        GROUP BY date
+    ),
+    periods AS (
+        SELECT 
+            {period_start} AS period_start,
+            SUM(steps) AS steps,
+            SUM(flights_climbed) AS flights_climbed,
+            SUM(active_energy) AS active_energy,
+            SUM(exercise_time) AS exercise_time,
+            MAX(heart_rate_max) AS heart_rate_max
+        FROM daily
+        GROUP BY period_start
+    ),
+    totals AS (
+        SELECT 
+            *,
+            COALESCE(steps, 0) + COALESCE(flights_climbed, 0)
+                + COALESCE(active_energy, 0) + COALESCE(exercise_time, 0) AS total
+        FROM periods
+    )
+    SELECT 
+        CAST(period_start AS VARCHAR) AS period_start,
+        steps,
+        flights_climbed,
+        active_energy,
+        exercise_time,
+        heart_rate_max,
+        total
+    FROM totals
+    ORDER BY period_start
+"""
+
+# Rendered once per granularity at import; requests only bind the date range.
+EFFORT_COMPOSITION_SQL = {
+    granularity: EFFORT_COMPOSITION_TEMPLATE.format(period_start=period_start)
+    for granularity, period_start in EFFORT_PERIOD_START.items()
+}
+
+
+def build_effort_composition(
+    con: duckdb.DuckDBPyConnection, start_date: date, end_date: date, granularity: str
+) -> EffortCompositionResponse:
+    """Query and shape the /effort-composition response."""
+    result = con.execute(
+        EFFORT_COMPOSITION_SQL[granularity], [start_date, end_date]
+    ).fetchall()
+    
+    # Shares rounded with Python's round() (half to even on the double)
+    buckets = [
+        EffortBucket.model_construct(
+            period_start=row[0],
+            steps=row[1],
+            flights_climbed=row[2],
+            active_energy=row[3],
+            exercise_time=row[4],
+            heart_rate_max=row[5],
+            steps_pct=round(100 * (row[1] or 0) / row[6], 1) if row[6] > 0 else None,
+            flights_pct=round(100 * (row[2] or 0) / row[6], 1) if row[6] > 0 else None,
+            energy_pct=round(100 * (row[3] or 0) / row[6], 1) if row[6] > 0 else None,
+            exercise_pct=round(100 * (row[4] or 0) / row[6], 1) if row[6] > 0 else None,
+        )
+        for row in result
+    ]
+    
+    return EffortCompositionResponse(
+        start_date=str(start_date),
+        end_date=str(end_date),
+        granularity=granularity,
+        buckets=buckets,
+        count=len(buckets),
+    )
+
+
 @router.get("/effort-composition", response_model=EffortCompositionResponse)
 async def get_effort_composition(
+    request: Request,
+    response: Response,
     start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
     granularity: str = Query("day", description="Aggregation: day, week, or month"),
-) -> EffortCompositionResponse:
+) -> Response:
     """
     Get effort composition breakdown by component.
     
@@ -299,95 +545,16 @@ async def get_effort_composition(
     """
     validate_date_range(start_date, end_date)
     
-    if granularity not in ["day", "week", "month"]:
+    if granularity not in EFFORT_COMPOSITION_SQL:
         raise HTTPException(status_code=400, detail="granularity must be day, week, or month")
     
     con = get_db_connection()
     try:
-        if granularity == "day":
-            query = """
-                SELECT 
-                    date AS period_start,
-                    MAX(CASE WHEN metric_key = 'steps' THEN value END) AS steps,
-                    MAX(CASE WHEN metric_key = 'flights_climbed' THEN value END) AS flights_climbed,
-                    MAX(CASE WHEN metric_key = 'active_energy' THEN value END) AS active_energy,
-                    MAX(CASE WHEN metric_key = 'exercise_time' THEN value END) AS exercise_time,
-                    MAX(CASE WHEN metric_key = 'heart_rate_max' THEN value END) AS heart_rate_max
-                FROM daily_metrics
-                WHERE date >= ? AND date <= ?
-                    AND metric_key IN ('steps', 'flights_climbed', 'active_energy', 'exercise_time', 'heart_rate_max')
-                GROUP BY date
-                ORDER BY date
-            """
-        elif granularity == "week":
-            query = """
-                SELECT 
-                    DATE_TRUNC('week', date) AS period_start,
-                    SUM(CASE WHEN metric_key = 'steps' THEN value END) AS steps,
-                    SUM(CASE WHEN metric_key = 'flights_climbed' THEN value END) AS flights_climbed,
-                    SUM(CASE WHEN metric_key = 'active_energy' THEN value END) AS active_energy,
-                    SUM(CASE WHEN metric_key = 'exercise_time' THEN value END) AS exercise_time,
-                    MAX(CASE WHEN metric_key = 'heart_rate_max' THEN value END) AS heart_rate_max
-                FROM daily_metrics
-                WHERE date >= ? AND date <= ?
-                    AND metric_key IN ('steps', 'flights_climbed', 'active_energy', 'exercise_time', 'heart_rate_max')
-                GROUP BY DATE_TRUNC('week', date)
-                ORDER BY period_start
-            """
-        else:  # month
-            query = """
-                SELECT 
-                    DATE_TRUNC('month', date) AS period_start,
-                    SUM(CASE WHEN metric_key = 'steps' THEN value END) AS steps,
-                    SUM(CASE WHEN metric_key = 'flights_climbed' THEN value END) AS flights_climbed,
-                    SUM(CASE WHEN metric_key = 'active_energy' THEN value END) AS active_energy,
-                    SUM(CASE WHEN metric_key = 'exercise_time' THEN value END) AS exercise_time,
-                    MAX(CASE WHEN metric_key = 'heart_rate_max' THEN value END) AS heart_rate_max
-                FROM daily_metrics
-                WHERE date >= ? AND date <= ?
-                    AND metric_key IN ('steps', 'flights_climbed', 'active_energy', 'exercise_time', 'heart_rate_max')
-                GROUP BY DATE_TRUNC('month', date)
-                ORDER BY period_start
-            """
-        
-        result = con.execute(query, [start_date, end_date]).fetchall()
+        cached = cached_response(con, request, response)
+        if cached is not None:
+            return cached
         
-        buckets = []
-        for row in result:
-            steps = row[1] or 0
-            flights = row[2] or 0
-            energy = row[3] or 0
-            exercise = row[4] or 0
-            
-            total = steps + flights + energy + exercise
-            if total > 0:
-                steps_pct = round(100 * steps / total, 1)
-                flights_pct = round(100 * flights / total, 1)
-                energy_pct = round(100 * energy / total, 1)
-                exercise_pct = round(100 * exercise / total, 1)
-            else:
-                steps_pct = flights_pct = energy_pct = exercise_pct = None
-            
-            buckets.append(EffortBucket(
-                period_start=str(row[0]),
-                steps=row[1],
-                flights_climbed=row[2],
-                active_energy=row[3],
-                exercise_time=row[4],
-                heart_rate_max=row[5],
-                steps_pct=steps_pct,
-                flights_pct=flights_pct,
-                energy_pct=energy_pct,
-                exercise_pct=exercise_pct,
-            ))
-        
-        return EffortCompositionResponse(
-            start_date=str(start_date),
-            end_date=str(end_date),
-            granularity=granularity,
-            buckets=buckets,
-            count=len(buckets),
-        )
+        return json_response(build_effort_composition(con, start_date, end_date, granularity), response)
     finally:
         con.close()
 
@@ -396,11 +563,61 @@ async def get_effort_composition(
 # ENDPOINT 4: GET /analytics/readiness-timeline
 # =============================================================================
 
+def build_readiness_timeline(
+    con: duckdb.DuckDBPyConnection, start_date: date, end_date: date
+) -> ReadinessTimelineResponse:
+    """Query and shape the /readiness-timeline response."""
+    # Anomaly annotations are precomputed per day (derived_timeline_daily);
+    # the day-over-day recovery rules apply within the requested range
+    result = con.execute("""
+        WITH scores_with_lag AS (
+            SELECT 
+                date,
+                recovery_score,
+                anomaly_annotation_type,
+                LAG(recovery_score) OVER (ORDER BY date) AS prev_recovery
+            FROM derived_timeline_daily
+            WHERE date >= ? AND date <= ?
+        )
+        -- Rule cascade, first match wins
+        SELECT 
+            CAST(date AS VARCHAR) AS date,
+            CAST(TRUNC(recovery_score) AS INTEGER) AS recovery_score,
+            CASE
+                WHEN anomaly_annotation_type IS NOT NULL THEN anomaly_annotation_type
+                WHEN recovery_score - prev_recovery >= 15 THEN 'recovery_up'
+                WHEN recovery_score - prev_recovery <= -15 THEN 'recovery_down'
+            END AS annotation_type
+        FROM scores_with_lag
+        ORDER BY date
+    """, [start_date, end_date]).fetchall()
+    
+    timeline = [
+        TimelineDay.model_construct(
+            date=date_str,
+            recovery_score=recovery,
+            annotation=ANNOTATION_TEXT.get(annotation_type),
+            annotation_type=annotation_type,
+        )
+        for date_str, recovery, annotation_type in result
+    ]
+    
+    return ReadinessTimelineResponse(
+        start_date=str(start_date),
+        end_date=str(end_date),
+        timeline=timeline,
+        count=len(timeline),
+    )
+
+
 @router.get("/readiness-timeline", response_model=ReadinessTimelineResponse)
 async def get_readiness_timeline(
+    request: Request,
+    response: Response,
     start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
-) -> ReadinessTimelineResponse:
+    fields: Optional[str] = Query(None, description="Comma-separated TimelineDay fields to return (default: all)"),
+) -> Response:
     """
     Get recovery timeline with rule-based annotations.
     
@@ -410,105 +627,88 @@ async def get_readiness_timeline(
     - RHR elevated (strong anomaly, above baseline)
     - Recovery improved (+15 from previous day)
     - Recovery dropped (-15 from previous day)
+    
+    With fields, each timeline day carries only the listed fields.
     """
     validate_date_range(start_date, end_date)
+    selected = parse_fields(fields, TimelineDay)
     
     con = get_db_connection()
     try:
-        result = con.execute("""
-            WITH scores_with_lag AS (
-                SELECT 
-                    d.date,
-                    d.recovery_score,
-                    LAG(d.recovery_score) OVER (ORDER BY d.date) AS prev_recovery
-                FROM derived_scores_daily d
-                WHERE d.date >= ? AND d.date <= ?
-            ),
-            anomaly_check AS (
-                SELECT 
-                    s.date,
-                    s.recovery_score,
-                    s.prev_recovery,
-                    -- Check for strong anomalies
-                    EXISTS (
-                        SELECT 1 FROM anomalies a 
-                        WHERE a.date = s.date 
-                        AND a.metric_key IN ('physical_effort_load', 'active_energy')
-                        AND a.anomaly_level = 'strong'
-                    ) AS has_strain_anomaly,
-                    (
-                        SELECT a.value < b.baseline_28d_median
-                        FROM anomalies a
-                        JOIN baselines b ON a.date = b.date AND a.metric_key = b.metric_key
-                        WHERE a.date = s.date 
-                        AND a.metric_key = 'hrv_sdnn'
-                        AND a.anomaly_level = 'strong'
-                        LIMIT 1
-                    ) AS hrv_below_baseline,
-                    (
-                        SELECT a.value > b.baseline_28d_median
-                        FROM anomalies a
-                        JOIN baselines b ON a.date = b.date AND a.metric_key = b.metric_key
-                        WHERE a.date = s.date 
-                        AND a.metric_key = 'resting_heart_rate'
-                        AND a.anomaly_level = 'strong'
-                        LIMIT 1
-                    ) AS rhr_above_baseline
-                FROM scores_with_lag s
-            )
-            SELECT 
-                date,
-                recovery_score,
-                prev_recovery,
-                has_strain_anomaly,
-                hrv_below_baseline,
-                rhr_above_baseline
-            FROM anomaly_check
-            ORDER BY date
-        """, [start_date, end_date]).fetchall()
+        cached = cached_response(con, request, response)
+        if cached is not None:
+            return cached
         
-        timeline = []
-        for row in result:
-            date_val = row[0]
-            recovery = row[1]
-            prev_recovery = row[2]
-            has_strain = row[3]
-            hrv_low = row[4]
-            rhr_high = row[5]
-            
-            annotation = None
-            annotation_type = None
-            
-            if has_strain:
-                annotation = "High strain day"
-                annotation_type = "high_strain"
-            elif hrv_low:
-                annotation = "HRV dipped below usual"
-                annotation_type = "low_hrv"
-            elif rhr_high:
-                annotation = "Resting HR elevated"
-                annotation_type = "high_rhr"
-            elif recovery is not None and prev_recovery is not None:
-                delta = recovery - prev_recovery
-                if delta >= 15:
-                    annotation = "Recovery improved"
-                    annotation_type = "recovery_up"
-                elif delta <= -15:
-                    annotation = "Recovery dropped"
-                    annotation_type = "recovery_down"
-            
-            timeline.append(TimelineDay(
-                date=str(date_val),
-                recovery_score=int(recovery) if recovery is not None else None,
-                annotation=annotation,
-                annotation_type=annotation_type,
-            ))
+        return json_response(
+            build_readiness_timeline(con, start_date, end_date), response,
+            include=sparse_include(ReadinessTimelineResponse, "timeline", selected),
+        )
+    finally:
+        con.close()
+
+
+# =============================================================================
+# ENDPOINT 5: GET /analytics/dashboard
+# =============================================================================
+
+def build_with_cursor(build, *args):
+    """Run a card builder on its own cursor (executor thread entry point)."""
+    con = get_db_connection()
+    try:
+        return build(con, *args)
+    finally:
+        con.close()
+
+
+@router.get("/dashboard", response_model=DashboardResponse)
+async def get_dashboard(
+    request: Request,
+    response: Response,
+    start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
+    end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
+    granularity: str = Query("day", description="Effort composition aggregation: day, week, or month"),
+) -> Response:
+    """
+    Get all four insight cards in one response.
+    
+    Same payloads as /scores, /recovery-vs-strain, /effort-composition and
+    /readiness-timeline; the four queries run concurrently.
+    """
+    validate_date_range(start_date, end_date)
+    
+    if granularity not in EFFORT_COMPOSITION_SQL:
+        raise HTTPException(status_code=400, detail="granularity must be day, week, or month")
+    
+    # Keep this cursor open until the cards are built: it holds the shared
+    # connection, so no rebuild can land between reading the ETag version
+    # and the builders' queries.
+    con = get_db_connection()
+    try:
+        cached = cached_response(con, request, response)
+        if cached is not None:
+            return cached
         
-        return ReadinessTimelineResponse(
+        loop = asyncio.get_running_loop()
+        scores, recovery_vs_strain, effort_composition, readiness_timeline = await asyncio.gather(
+            loop.run_in_executor(_dashboard_executor, build_with_cursor, build_scores, start_date, end_date),
+            loop.run_in_executor(
+                _dashboard_executor, build_with_cursor, build_recovery_vs_strain, start_date, end_date
+            ),
+            loop.run_in_executor(
+                _dashboard_executor, build_with_cursor, build_effort_composition, start_date, end_date, granularity
+            ),
+            loop.run_in_executor(
+                _dashboard_executor, build_with_cursor, build_readiness_timeline, start_date, end_date
+            ),
+        )
+        
+        return json_response(DashboardResponse(
             start_date=str(start_date),
             end_date=str(end_date),
-            timeline=timeline,
-            count=len(timeline),
-        )
+            scores=scores,
+            recovery_vs_strain=recovery_vs_strain,
+            effort_composition=effort_composition,
+            readiness_timeline=readiness_timeline,
+        ), response)
     finally:
         con.close()
@@ -99,6 +99,26 @@ def test_chart_context():
     print(f"Data quality: {data['data_quality']['coverage_percent']}% coverage")
     print()
 
+def test_batch():
+    print("=" * 60)
+    print("7. POST /analytics/batch")
+    print("=" * 60)
+    items = [
+        {"path": "/analytics/overview", "params": {}},
+        {"path": "/analytics/anomalies", "params": {"start_date": "2026-01-01", "end_date": "2026-01-30"}},
+        {"path": "/analytics/metric/daily", "params": {"metric_key": "nope", "start_date": "2026-01-01", "end_date": "2026-01-30"}},
+    ]
+    r = requests.post(f"{BASE_URL}/analytics/batch", json=items)
+    data = r.json()
+    print(f"Status: {r.status_code}")
+    for item, result in zip(items, data):
+        direct = requests.get(f"{BASE_URL}{item['path']}", params=item['params'])
+        assert result['status'] == direct.status_code
+        assert result['body'] == direct.json()
+        print(f"  {result['path']}: {result['status']}")
+    print("✓ PASS: Batch results match direct requests")
+    print()
+
 def verify_sparse_metrics():
     print("=" * 60)
     print("VERIFICATION: vo2max and sleep_duration anomalies")
@@ -151,6 +171,7 @@ if __name__ == "__main__":
     test_anomalies()
     test_correlations()
     test_chart_context()
+    test_batch()
     verify_sparse_metrics()
     verify_null_baselines()
     
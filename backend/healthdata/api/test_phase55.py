@@ -7,11 +7,63 @@ Confirms:
 3. Sleep is not used in Recovery
 4. Steps never influence Strain
 5. Missing values remain missing (no interpolation)
+
+All endpoint calls are independent, so they are issued concurrently over one
+keep-alive client on first use; the checks then run in order on the responses.
 """
 
-import requests
+import asyncio
+from functools import lru_cache
+
+import httpx
 
 BASE_URL = "http://127.0.0.1:8000"
+GRANULARITIES = ["day", "week", "month"]
+
+
+async def fetch_responses() -> dict:
+    """Fetch every response the checks need, concurrently."""
+    limits = httpx.Limits(max_keepalive_connections=10, max_connections=10)
+    async with httpx.AsyncClient(base_url=BASE_URL, limits=limits) as client:
+        scores, rvs, timeline, all_scores, *compositions = await asyncio.gather(
+            client.get("/analytics/scores", params={
+                "start_date": "2026-01-20",
+                "end_date": "2026-01-30"
+            }),
+            client.get("/analytics/recovery-vs-strain", params={
+                "start_date": "2026-01-01",
+                "end_date": "2026-01-30"
+            }),
+            client.get("/analytics/readiness-timeline", params={
+                "start_date": "2026-01-01",
+                "end_date": "2026-01-30"
+            }),
+            client.get("/analytics/scores", params={
+                "start_date": "2025-01-01",
+                "end_date": "2026-01-30"
+            }),
+            *(
+                client.get("/analytics/effort-composition", params={
+                    "start_date": "2026-01-01",
+                    "end_date": "2026-01-30",
+                    "granularity": gran
+                })
+                for gran in GRANULARITIES
+            ),
+        )
+    return {
+        "scores": scores,
+        "recovery_vs_strain": rvs,
+        "effort_composition": dict(zip(GRANULARITIES, compositions)),
+        "readiness_timeline": timeline,
+        "all_scores": all_scores,
+    }
+
+
+@lru_cache(maxsize=None)
+def get_responses() -> dict:
+    """Responses of fetch_responses(), fetched once and shared by every check."""
+    return asyncio.run(fetch_responses())
 
 
 def test_scores_endpoint():
@@ -20,10 +72,7 @@ def test_scores_endpoint():
     print("1. Testing GET /analytics/scores")
     print("=" * 60)
     
-    r = requests.get(f"{BASE_URL}/analytics/scores", params={
-        "start_date": "2026-01-20",
-        "end_date": "2026-01-30"
-    })
+    r = get_responses()["scores"]
     assert r.status_code == 200, f"Expected 200, got {r.status_code}"
     
     data = r.json()
@@ -42,7 +91,7 @@ def test_scores_endpoint():
     print(f"    Recovery: {sample['recovery_score']} ({sample['recovery_label']})")
     print(f"    Strain: {sample['strain_score']} ({sample['strain_label']})")
     print(f"    Primary metric: {sample['strain_primary_metric']}")
-    print(f"    Contributors: {sample['contributors']}")
+    print(f"    Contributors: HRV={sample['hrv_pct']}, RHR={sample['rhr_pct']}, Effort={sample['effort_pct']}")
     
     print("  ✓ PASS")
 
@@ -53,10 +102,7 @@ def test_recovery_vs_strain():
     print("2. Testing GET /analytics/recovery-vs-strain")
     print("=" * 60)
     
-    r = requests.get(f"{BASE_URL}/analytics/recovery-vs-strain", params={
-        "start_date": "2026-01-01",
-        "end_date": "2026-01-30"
-    })
+    r = get_responses()["recovery_vs_strain"]
     assert r.status_code == 200
     
     data = r.json()
@@ -74,12 +120,7 @@ def test_effort_composition():
     print("3. Testing GET /analytics/effort-composition")
     print("=" * 60)
     
-    for gran in ["day", "week", "month"]:
-        r = requests.get(f"{BASE_URL}/analytics/effort-composition", params={
-            "start_date": "2026-01-01",
-            "end_date": "2026-01-30",
-            "granularity": gran
-        })
+    for gran, r in get_responses()["effort_composition"].items():
         assert r.status_code == 200
         data = r.json()
         print(f"  Granularity={gran}: {data['count']} buckets")
@@ -93,10 +134,7 @@ def test_readiness_timeline():
     print("4. Testing GET /analytics/readiness-timeline")
     print("=" * 60)
     
-    r = requests.get(f"{BASE_URL}/analytics/readiness-timeline", params={
-        "start_date": "2026-01-01",
-        "end_date": "2026-01-30"
-    })
+    r = get_responses()["readiness_timeline"]
     assert r.status_code == 200
     
     data = r.json()
@@ -117,10 +155,7 @@ def validate_quality_gates():
     print("5. Validating Quality Gates")
     print("=" * 60)
     
-    r = requests.get(f"{BASE_URL}/analytics/scores", params={
-        "start_date": "2025-01-01",
-        "end_date": "2026-01-30"
-    })
+    r = get_responses()["all_scores"]
     data = r.json()
     
     scores_with_recovery = [s for s in data['scores'] if s['recovery_score'] is not None]
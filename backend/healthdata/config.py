@@ -31,6 +31,14 @@ PARQUET_DIR = HEALTH_DATA_DIR / "parquet"
 DUCKDB_PATH = HEALTH_DATA_DIR / "health.duckdb"
 INVENTORY_DIR = HEALTH_DATA_DIR / "inventory"
 
+# DuckDB resource settings for analytics builds
+# DUCKDB_MEMORY_LIMIT uses DuckDB size syntax (e.g. "4GB"); unset keeps DuckDB's default
+DUCKDB_THREADS = int(os.getenv("DUCKDB_THREADS", os.cpu_count() or 1))
+DUCKDB_MEMORY_LIMIT = os.getenv("DUCKDB_MEMORY_LIMIT")
+
+# Worker processes for parsing export.xml (each parses one byte range)
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", os.cpu_count() or 1))
+
 # Export file paths (read-only, never stored in data folder)
 EXPORT_XML_PATH = HEALTH_EXPORT_DIR / "export.xml"
 EXPORT_CDA_XML_PATH = HEALTH_EXPORT_DIR / "export_cda.xml"
@@ -55,6 +63,8 @@ def get_config_summary() -> dict:
         "HEALTH_DATA_DIR": str(HEALTH_DATA_DIR),
         "PARQUET_DIR": str(PARQUET_DIR),
         "DUCKDB_PATH": str(DUCKDB_PATH),
+        "DUCKDB_THREADS": DUCKDB_THREADS,
+        "DUCKDB_MEMORY_LIMIT": DUCKDB_MEMORY_LIMIT,
         "export_xml_exists": EXPORT_XML_PATH.exists(),
         "export_cda_xml_exists": EXPORT_CDA_XML_PATH.exists(),
     }
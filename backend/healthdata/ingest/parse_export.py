@@ -8,38 +8,66 @@ Output structure:
 - data/parquet/records/type=<type>/year=YYYY/month=MM/part-0.parquet
 - data/parquet/workouts/year=YYYY/month=MM/part-0.parquet
 
+(parse workers write part-<i>.parquet files, which are then consolidated
+into a single part-0.parquet per partition, sorted by start_ts)
+
 Records schema:
 - user_id, type, value, unit, start_ts, end_ts, creation_ts,
-  source_name, device, metadata_json
+  source_name, device, metadata
 
 Workouts schema:
 - workout_type, start_ts, end_ts, duration_sec, distance_m,
-  energy_kcal, source_name, device, metadata_json
+  energy_kcal, source_name, device, metadata
+
+metadata is a MAP<string, string> of the element's MetadataEntry key/values.
 
 Usage:
     python -m backend.healthdata.ingest.parse_export
 """
 
-import json
+import mmap
+import re
+import shutil
 import sys
 from collections import defaultdict
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from xml.etree.ElementTree import iterparse
+from xml.etree.ElementTree import XMLPullParser
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent))
 
 from backend.healthdata.config import (
     EXPORT_XML_PATH,
+    INGEST_WORKERS,
     PARQUET_DIR,
     ensure_data_dirs,
     validate_export_exists,
 )
 
 BATCH_SIZE = 50000
+READ_SIZE = 64 * 1024
+# Bytes per block when pre-counting Records (count_records)
+COUNT_BLOCK_SIZE = 64 * 1024 * 1024
+
+# Parquet encoding: zstd, with dictionaries for the low-cardinality string
+# columns (a handful of types, units, sources, devices and metadata keys
+# repeated per file)
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+PARQUET_DICTIONARY_COLUMNS = (
+    "user_id", "type", "unit", "source_name", "device", "workout_type",
+    "metadata.key_value.key",
+)
+PARQUET_DATA_PAGE_SIZE = 1 << 20
+# Row groups of the consolidated partition files
+PARQUET_ROW_GROUP_SIZE = 128 * 1024
+
+# MetadataEntry key -> value
+METADATA_TYPE = pa.map_(pa.string(), pa.string())
 
 RECORD_SCHEMA = pa.schema([
     ("user_id", pa.string()),
@@ -51,7 +79,7 @@ RECORD_SCHEMA = pa.schema([
     ("creation_ts", pa.timestamp("us", tz="UTC")),
     ("source_name", pa.string()),
     ("device", pa.string()),
-    ("metadata_json", pa.string()),
+    ("metadata", METADATA_TYPE),
 ])
 
 WORKOUT_SCHEMA = pa.schema([
@@ -63,21 +91,59 @@ WORKOUT_SCHEMA = pa.schema([
     ("energy_kcal", pa.float64()),
     ("source_name", pa.string()),
     ("device", pa.string()),
-    ("metadata_json", pa.string()),
+    ("metadata", METADATA_TYPE),
 ])
 
+# WorkoutStatistics types (matched exactly) -> WORKOUT_SCHEMA column of their sum
+WORKOUT_STAT_COLUMNS = {
+    "HKQuantityTypeIdentifierDistanceWalkingRunning": "distance_m",
+    "HKQuantityTypeIdentifierActiveEnergyBurned": "energy_kcal",
+}
 
-def parse_apple_timestamp(ts_str: str | None) -> datetime | None:
-    """Parse Apple Health timestamp to datetime (UTC)."""
-    if not ts_str:
-        return None
-    try:
-        return datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S %z")
-    except ValueError:
-        try:
-            return datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            return None
+
+# Wall-clock fields of an Apple Health timestamp ("2024-01-31 07:15:00 -0800")
+APPLE_TIMESTAMP_FIELDS = (
+    r"^(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2}) "
+    r"(?P<hour>\d{1,2}):(?P<minute>\d{1,2}):(?P<second>\d{1,2})"
+)
+
+
+def parse_apple_timestamps(values: pa.Array) -> tuple[pa.Array, pa.Array]:
+    """
+    Parse a column of Apple Health timestamp strings.
+    
+    Returns (utc, local): UTC timestamps (strings without an offset are taken
+    as UTC) and the naive local wall-clock times used for partitioning.
+    Values datetime.strptime would reject are null in both, including those
+    pc.strptime would otherwise roll over (2024-02-30, 10:00:60) or accept
+    (year 0, offsets of 24h or more).
+    """
+    with_offset = pc.strptime(values, format="%Y-%m-%d %H:%M:%S %z", unit="us", error_is_null=True)
+    without_offset = pc.strptime(values, format="%Y-%m-%d %H:%M:%S", unit="us", error_is_null=True)
+    utc = pc.coalesce(with_offset, without_offset.cast(pa.timestamp("us", tz="UTC")))
+
+    wall_clock = pc.replace_substring_regex(values, pattern=r"^(\S+ \S+).*$", replacement=r"\1")
+    local = pc.strptime(wall_clock, format="%Y-%m-%d %H:%M:%S", unit="us", error_is_null=True)
+
+    # Valid when every parsed wall-clock field equals the one written
+    fields = pc.extract_regex(values, pattern=APPLE_TIMESTAMP_FIELDS)
+    valid = pc.and_kleene(
+        pc.is_valid(utc),
+        pc.greater_equal(pc.struct_field(fields, "year").cast(pa.int64()), 1),
+    )
+    for name, component in (
+        ("year", pc.year), ("month", pc.month), ("day", pc.day),
+        ("hour", pc.hour), ("minute", pc.minute), ("second", pc.second),
+    ):
+        written = pc.struct_field(fields, name).cast(pa.int64())
+        valid = pc.and_kleene(valid, pc.equal(component(local), written))
+    valid = pc.and_kleene(valid, pc.invert(pc.match_substring_regex(values, pattern=r" [+-](2[4-9]|[3-9]\d)")))
+    valid = pc.fill_null(valid, False)
+
+    return (
+        pc.if_else(valid, utc, pa.nulls(len(values), type=utc.type)),
+        pc.if_else(valid, local, pa.nulls(len(values), type=local.type)),
+    )
 
 
 def parse_float(val_str: str | None) -> float | None:
@@ -90,213 +156,458 @@ def parse_float(val_str: str | None) -> float | None:
         return None
 
 
-def extract_metadata(elem) -> str | None:
-    """Extract metadata entries from element as JSON string."""
+def parse_float_column(values: tuple) -> pa.Array:
+    """
+    Parse a column of numeric strings to float64 with one Arrow cast.
+    
+    Where the cast succeeds it matches float(). A column holding any value
+    the cast rejects (category values, blanks, padded numbers) falls back to
+    parse_float per value.
+    """
+    try:
+        return pc.cast(pa.array(values, type=pa.string()), pa.float64())
+    except pa.ArrowInvalid:
+        return pa.array([parse_float(value) for value in values], type=pa.float64())
+
+
+def extract_metadata(elem) -> dict | None:
+    """Extract metadata entries from element as a key -> value dict."""
     metadata = {}
     for meta_entry in elem.findall("MetadataEntry"):
         key = meta_entry.get("key")
         value = meta_entry.get("value")
         if key and value:
             metadata[key] = value
-    return json.dumps(metadata) if metadata else None
+    return metadata or None
+
 
+def parquet_write_options(schema: pa.Schema) -> dict:
+    """Parquet encoding options shared by the partition writers and consolidation."""
+    return {
+        "compression": PARQUET_COMPRESSION,
+        "compression_level": PARQUET_COMPRESSION_LEVEL,
+        "use_dictionary": [
+            path for path in PARQUET_DICTIONARY_COLUMNS if path.split(".")[0] in schema.names
+        ],
+        "data_page_size": PARQUET_DATA_PAGE_SIZE,
+        "write_statistics": True,
+    }
 
-def get_partition_key(dt: datetime | None, record_type: str) -> tuple:
-    """Get partition key (type_short, year, month) from datetime."""
-    if dt is None:
+
+def get_partition_key(record_type: str, year: int | None, month: int | None) -> tuple:
+    """Get partition key (type_short, year, month) from the local start year/month."""
+    if year is None:
         return (record_type, "unknown", "unknown")
     type_short = record_type.replace("HKQuantityTypeIdentifier", "").replace(
         "HKCategoryTypeIdentifier", "cat_"
     )
-    return (type_short, str(dt.year), f"{dt.month:02d}")
+    return (type_short, str(year), f"{month:02d}")
 
 
-def get_workout_partition_key(dt: datetime | None) -> tuple:
-    """Get partition key (year, month) for workouts."""
-    if dt is None:
+def get_workout_partition_key(year: int | None, month: int | None) -> tuple:
+    """Get partition key (year, month) for workouts from the local start year/month."""
+    if year is None:
         return ("unknown", "unknown")
-    return (str(dt.year), f"{dt.month:02d}")
+    return (str(year), f"{month:02d}")
 
 
 class PartitionedParquetWriter:
-    """Manages batched writes to partitioned Parquet files."""
+    """
+    Manages batched writes to partitioned Parquet files.
+    
+    Records are buffered as tuples in schema field order and transposed into
+    one Arrow array per column at flush time, which avoids the per-row key
+    lookups and type inference of Table.from_pylist. Timestamp and float
+    fields are buffered as the raw export strings and parsed a column at a
+    time; the partition of each row comes from its parsed local start time.
+    """
 
-    def __init__(self, base_dir: Path, schema: pa.Schema, partition_type: str):
+    def __init__(self, base_dir: Path, schema: pa.Schema, partition_type: str, part_name: str = "part-0.parquet"):
         self.base_dir = base_dir
         self.schema = schema
         self.partition_type = partition_type
-        self.buffers: dict[tuple, list[dict]] = defaultdict(list)
+        self.part_name = part_name
+        # Buffered per record type (one buffer for workouts), so a flush
+        # mostly lands in few partitions
+        self.buffers: dict[str, list[tuple]] = defaultdict(list)
         self.written_counts: dict[tuple, int] = defaultdict(int)
-        self.part_numbers: dict[tuple, int] = defaultdict(int)
-
-    def add_record(self, partition_key: tuple, record: dict):
-        """Add a record to the buffer for a partition."""
-        self.buffers[partition_key].append(record)
-        if len(self.buffers[partition_key]) >= BATCH_SIZE:
-            self._flush_partition(partition_key)
-
-    def _flush_partition(self, partition_key: tuple):
-        """Flush a partition buffer to Parquet."""
-        records = self.buffers[partition_key]
+        # One open writer per partition: each flush appends a row group to the
+        # partition's single part file instead of starting a new file
+        self.writers: dict[tuple, pq.ParquetWriter] = {}
+
+    def add_record(self, buffer_key: str, record: tuple):
+        """Add a record (values in schema order) to the buffer for buffer_key."""
+        self.buffers[buffer_key].append(record)
+        if len(self.buffers[buffer_key]) >= BATCH_SIZE:
+            self._flush_buffer(buffer_key)
+
+    def _flush_buffer(self, buffer_key: str):
+        """Parse a buffer into a table and append its rows to their partitions."""
+        records = self.buffers[buffer_key]
         if not records:
             return
 
+        arrays = []
+        start_local = None
+        for column, field in zip(zip(*records), self.schema):
+            if pa.types.is_timestamp(field.type):
+                utc, local = parse_apple_timestamps(pa.array(column, type=pa.string()))
+                arrays.append(utc)
+                if field.name == "start_ts":
+                    start_local = local
+            elif pa.types.is_float64(field.type):
+                arrays.append(parse_float_column(column))
+            else:
+                arrays.append(pa.array(column, type=field.type))
+        table = pa.Table.from_arrays(arrays, schema=self.schema)
+
+        years = pc.year(start_local).to_pylist()
+        months = pc.month(start_local).to_pylist()
         if self.partition_type == "records":
-            type_short, year, month = partition_key
-            partition_dir = self.base_dir / f"type={type_short}" / f"year={year}" / f"month={month}"
+            partition_keys = map(get_partition_key, table.column("type").to_pylist(), years, months)
         else:
-            year, month = partition_key
-            partition_dir = self.base_dir / f"year={year}" / f"month={month}"
-
-        partition_dir.mkdir(parents=True, exist_ok=True)
-        
-        part_num = self.part_numbers[partition_key]
-        output_path = partition_dir / f"part-{part_num}.parquet"
-        self.part_numbers[partition_key] += 1
-
-        table = pa.Table.from_pylist(records, schema=self.schema)
-        pq.write_table(table, output_path, compression="snappy")
-
-        self.written_counts[partition_key] += len(records)
-        self.buffers[partition_key] = []
+            partition_keys = map(get_workout_partition_key, years, months)
+        rows_by_partition: dict[tuple, list[int]] = defaultdict(list)
+        for row, partition_key in enumerate(partition_keys):
+            rows_by_partition[partition_key].append(row)
+
+        for partition_key, rows in rows_by_partition.items():
+            self._write_partition(partition_key, table.take(rows))
+        self.buffers[buffer_key] = []
+
+    def _write_partition(self, partition_key: tuple, table: pa.Table):
+        """Append a table to a partition's Parquet file."""
+        writer = self.writers.get(partition_key)
+        if writer is None:
+            if self.partition_type == "records":
+                type_short, year, month = partition_key
+                partition_dir = self.base_dir / f"type={type_short}" / f"year={year}" / f"month={month}"
+            else:
+                year, month = partition_key
+                partition_dir = self.base_dir / f"year={year}" / f"month={month}"
+            partition_dir.mkdir(parents=True, exist_ok=True)
+            writer = pq.ParquetWriter(partition_dir / self.part_name, self.schema, **parquet_write_options(self.schema))
+            self.writers[partition_key] = writer
+
+        writer.write_table(table)
+        self.written_counts[partition_key] += table.num_rows
 
     def flush_all(self):
-        """Flush all remaining buffers."""
-        for partition_key in list(self.buffers.keys()):
-            self._flush_partition(partition_key)
+        """Flush all remaining buffers and close the partition files."""
+        for buffer_key in list(self.buffers.keys()):
+            self._flush_buffer(buffer_key)
+        for writer in self.writers.values():
+            writer.close()
+        self.writers.clear()
 
     def get_total_written(self) -> int:
         """Get total records written across all partitions."""
         return sum(self.written_counts.values())
 
 
-def parse_export(export_path: Path, progress_interval: int = 100000):
+def split_export(export_path: Path, n_chunks: int) -> list[tuple[int, int]]:
     """
-    Stream parse export.xml and write to partitioned Parquet files.
+    Split the body of export.xml into up to n_chunks byte ranges of roughly
+    equal size, each starting on a top-level <Record> so it parses on its own.
+    
+    Records nested in a <Correlation> (the only element that contains
+    Records) are skipped as split points: a candidate is top level when the
+    nearest <Correlation start tag before it, if any, is already closed.
+    The first range starts after the <HealthData> start tag, the last ends
+    before its end tag.
     """
-    records_dir = PARQUET_DIR / "records"
-    workouts_dir = PARQUET_DIR / "workouts"
-
-    records_dir.mkdir(parents=True, exist_ok=True)
-    workouts_dir.mkdir(parents=True, exist_ok=True)
-
-    record_writer = PartitionedParquetWriter(records_dir, RECORD_SCHEMA, "records")
-    workout_writer = PartitionedParquetWriter(workouts_dir, WORKOUT_SCHEMA, "workouts")
+    with open(export_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        body_start = re.search(rb"<HealthData\b[^>]*>", mm).end()
+        body_end = mm.rfind(b"</HealthData>")
+        bounds = [body_start]
+        for k in range(1, n_chunks):
+            pos = max(body_start + (body_end - body_start) * k // n_chunks, bounds[-1] + 1)
+            while True:
+                pos = mm.find(b"<Record ", pos, body_end)
+                if pos == -1:
+                    break
+                open_tag = mm.rfind(b"<Correlation", body_start, pos)
+                if open_tag == -1 or mm.rfind(b"</Correlation>", open_tag, pos) != -1:
+                    break
+                pos += 1
+            if pos == -1:
+                break
+            bounds.append(pos)
+        bounds.append(body_end)
+    return list(zip(bounds, bounds[1:]))
+
+
+def count_records(export_path: Path) -> int:
+    """
+    Number of <Record elements in export.xml (including those nested in a
+    Correlation), by a byte scan over the mapped file one block at a time.
+    """
+    tag = b"<Record "
+    count = 0
+    with open(export_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start in range(0, len(mm), COUNT_BLOCK_SIZE):
+            # The block overlaps the next by len(tag) - 1 bytes, so a tag
+            # across the boundary is counted once, in the block it starts in
+            block = mm[start:start + COUNT_BLOCK_SIZE + len(tag) - 1]
+            count += block.count(tag)
+    return count
+
+
+def iterparse_range(export_path: Path, start: int, end: int):
+    """
+    iterparse-style (event, elem) stream over bytes [start, end) of
+    export.xml, parsed under a synthetic <HealthData> root element.
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    parser.feed(b"<HealthData>")
+    with open(export_path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            data = f.read(min(READ_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            parser.feed(data)
+            yield from parser.read_events()
+    parser.feed(b"</HealthData>")
+    yield from parser.read_events()
+    parser.close()
+
+
+def parse_range(
+    export_path: Path,
+    parquet_dir: Path,
+    start: int,
+    end: int,
+    part_name: str = "part-0.parquet",
+    progress_interval: int = 0,
+    expected_records: int = 0,
+) -> dict:
+    """
+    Parse the Records and Workouts in bytes [start, end) of export.xml and
+    write them to partitioned Parquet files named part_name under
+    parquet_dir (passed explicitly so spawned workers write where the
+    caller asked, not to the configured PARQUET_DIR).
+    
+    Runs in a worker process for parallel parses; progress_interval=0
+    disables progress output. With expected_records (count_records) the
+    progress lines also show the percentage done.
+    """
+    record_writer = PartitionedParquetWriter(parquet_dir / "records", RECORD_SCHEMA, "records", part_name)
+    workout_writer = PartitionedParquetWriter(parquet_dir / "workouts", WORKOUT_SCHEMA, "workouts", part_name)
 
     total_records = 0
     total_workouts = 0
     parse_errors = 0
 
-    print(f"Parsing: {export_path}")
-    print(f"File size: {export_path.stat().st_size / (1024*1024):.1f} MB")
-    print(f"Output: {PARQUET_DIR}")
-    print()
+    # Children (MetadataEntry, WorkoutStatistics) are left intact until their
+    # Record/Workout ends and is read; each finished element is then dropped
+    # from the root so processed records don't pile up as empty nodes.
+    context = iterparse_range(export_path, start, end)
+    _, root = next(context)
 
-    context = iterparse(str(export_path), events=("end",))
+    # Hot loop: helpers bound to locals, attributes read from elem.attrib
+    add_record = record_writer.add_record
+    metadata_of = extract_metadata
 
     for event, elem in context:
+        if event != "end":
+            continue
         tag = elem.tag
 
         if tag == "Record":
             total_records += 1
 
             try:
-                record_type = elem.get("type", "Unknown")
-                start_ts = parse_apple_timestamp(elem.get("startDate"))
-                end_ts = parse_apple_timestamp(elem.get("endDate"))
-                creation_ts = parse_apple_timestamp(elem.get("creationDate"))
-
-                record = {
-                    "user_id": "default",
-                    "type": record_type,
-                    "value": parse_float(elem.get("value")),
-                    "unit": elem.get("unit"),
-                    "start_ts": start_ts,
-                    "end_ts": end_ts,
-                    "creation_ts": creation_ts,
-                    "source_name": elem.get("sourceName"),
-                    "device": elem.get("device"),
-                    "metadata_json": extract_metadata(elem),
-                }
-
-                partition_key = get_partition_key(start_ts, record_type)
-                record_writer.add_record(partition_key, record)
+                get = elem.attrib.get
+                record_type = get("type", "Unknown")
+
+                # RECORD_SCHEMA field order; most Records have no children,
+                # so metadata is only extracted when there are some
+                record = (
+                    "default",
+                    record_type,
+                    get("value"),
+                    get("unit"),
+                    get("startDate"),
+                    get("endDate"),
+                    get("creationDate"),
+                    get("sourceName"),
+                    get("device"),
+                    metadata_of(elem) if len(elem) else None,
+                )
+
+                add_record(record_type, record)
 
             except Exception as e:
                 parse_errors += 1
                 if parse_errors <= 5:
                     print(f"  Warning: Parse error on record {total_records}: {e}")
 
-            if total_records % progress_interval == 0:
-                print(f"  Processed {total_records:,} records...")
+            if progress_interval and total_records % progress_interval == 0:
+                if expected_records:
+                    print(f"  Processed {total_records:,} records ({total_records * 100 / expected_records:.1f}%)...")
+                else:
+                    print(f"  Processed {total_records:,} records...")
 
-            elem.clear()
+            root.clear()
 
         elif tag == "Workout":
             total_workouts += 1
 
             try:
-                start_ts = parse_apple_timestamp(elem.get("startDate"))
-                end_ts = parse_apple_timestamp(elem.get("endDate"))
-
-                workout = {
-                    "workout_type": elem.get("workoutActivityType", "Unknown"),
-                    "start_ts": start_ts,
-                    "end_ts": end_ts,
-                    "duration_sec": parse_float(elem.get("duration")),
-                    "distance_m": None,
-                    "energy_kcal": None,
-                    "source_name": elem.get("sourceName"),
-                    "device": elem.get("device"),
-                    "metadata_json": extract_metadata(elem),
-                }
-
+                stats = {}
                 for stat in elem.findall("WorkoutStatistics"):
-                    stat_type = stat.get("type", "")
-                    if "DistanceWalkingRunning" in stat_type:
-                        workout["distance_m"] = parse_float(stat.get("sum"))
-                    elif "ActiveEnergyBurned" in stat_type:
-                        workout["energy_kcal"] = parse_float(stat.get("sum"))
-
-                partition_key = get_workout_partition_key(start_ts)
-                workout_writer.add_record(partition_key, workout)
+                    column = WORKOUT_STAT_COLUMNS.get(stat.get("type"))
+                    if column:
+                        stats[column] = stat.get("sum")
+
+                # WORKOUT_SCHEMA field order
+                workout = (
+                    elem.get("workoutActivityType", "Unknown"),
+                    elem.get("startDate"),
+                    elem.get("endDate"),
+                    elem.get("duration"),
+                    stats.get("distance_m"),
+                    stats.get("energy_kcal"),
+                    elem.get("sourceName"),
+                    elem.get("device"),
+                    extract_metadata(elem),
+                )
+
+                workout_writer.add_record("workouts", workout)
 
             except Exception as e:
                 parse_errors += 1
                 if parse_errors <= 5:
                     print(f"  Warning: Parse error on workout {total_workouts}: {e}")
 
-            elem.clear()
+            root.clear()
 
-        else:
-            elem.clear()
-
-    print()
-    print("Flushing remaining buffers...")
     record_writer.flush_all()
     workout_writer.flush_all()
 
-    print()
-    print("=" * 60)
-    print("Parse Complete")
-    print("=" * 60)
-    print(f"Total records parsed: {total_records:,}")
-    print(f"Total workouts parsed: {total_workouts:,}")
-    print(f"Records written to Parquet: {record_writer.get_total_written():,}")
-    print(f"Workouts written to Parquet: {workout_writer.get_total_written():,}")
-    print(f"Parse errors: {parse_errors}")
-    print(f"Record partitions: {len(record_writer.written_counts)}")
-    print(f"Workout partitions: {len(workout_writer.written_counts)}")
-
     return {
         "total_records": total_records,
         "total_workouts": total_workouts,
         "records_written": record_writer.get_total_written(),
         "workouts_written": workout_writer.get_total_written(),
         "parse_errors": parse_errors,
+        "record_partitions": set(record_writer.written_counts),
+        "workout_partitions": set(workout_writer.written_counts),
     }
 
 
+def consolidate_partition(partition_dir: Path, schema: pa.Schema):
+    """
+    Rewrite a partition's part files (one per parse range, one row group per
+    flush) as a single part-0.parquet sorted by start_ts, so each partition
+    has one footer and few large row groups with tight start_ts statistics.
+    """
+    parts = sorted(partition_dir.glob("part-*.parquet"))
+    table = pa.concat_tables([pq.ParquetFile(part).read() for part in parts]).sort_by("start_ts")
+    scratch = partition_dir / "part-0.parquet.tmp"
+    pq.write_table(table, scratch, row_group_size=PARQUET_ROW_GROUP_SIZE, **parquet_write_options(schema))
+    for part in parts:
+        part.unlink()
+    scratch.rename(partition_dir / "part-0.parquet")
+
+
+def partition_dirs(base_dir: Path) -> list[Path]:
+    """Leaf directories of a partitioned output that hold Parquet files."""
+    return sorted({path.parent for path in base_dir.rglob("*.parquet")})
+
+
+def parse_export(
+    export_path: Path,
+    progress_interval: int = 100000,
+    workers: int = INGEST_WORKERS,
+    parquet_dir: Path = PARQUET_DIR,
+):
+    """
+    Stream parse export.xml and write to partitioned Parquet files under
+    parquet_dir.
+    
+    With workers > 1 the file is split into byte ranges (split_export) that
+    are parsed in separate processes; each writes its own part-<i>.parquet
+    into the shared partition directories. Each partition is then
+    consolidated into one sorted file (consolidate_partition).
+    """
+    records_dir = parquet_dir / "records"
+    workouts_dir = parquet_dir / "workouts"
+
+    # Start from empty outputs so part files of an earlier run (possibly with
+    # a different worker count) don't linger next to the new ones
+    for output_dir in (records_dir, workouts_dir):
+        if output_dir.exists():
+            shutil.rmtree(output_dir)
+        output_dir.mkdir(parents=True)
+
+    print(f"Parsing: {export_path}")
+    print(f"File size: {export_path.stat().st_size / (1024*1024):.1f} MB")
+    print(f"Output: {parquet_dir}")
+    expected_records = count_records(export_path)
+    print(f"Records in export: {expected_records:,}")
+    print()
+
+    chunks = split_export(export_path, max(workers, 1))
+    if len(chunks) == 1:
+        results = [parse_range(
+            export_path, parquet_dir, *chunks[0], progress_interval=progress_interval, expected_records=expected_records
+        )]
+        print("Consolidating partitions...")
+        for output_dir, schema in ((records_dir, RECORD_SCHEMA), (workouts_dir, WORKOUT_SCHEMA)):
+            for partition_dir in partition_dirs(output_dir):
+                consolidate_partition(partition_dir, schema)
+    else:
+        print(f"Parsing {len(chunks)} ranges in parallel...")
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [
+                pool.submit(parse_range, export_path, parquet_dir, start, end, f"part-{i}.parquet")
+                for i, (start, end) in enumerate(chunks)
+            ]
+            results = []
+            parsed_records = 0
+            for i, future in enumerate(futures, 1):
+                results.append(future.result())
+                parsed_records += results[-1]["total_records"]
+                print(
+                    f"  Range {i}/{len(chunks)}: {results[-1]['total_records']:,} records "
+                    f"({parsed_records * 100 / max(expected_records, 1):.1f}%)"
+                )
+
+            print("Consolidating partitions...")
+            consolidations = [
+                pool.submit(consolidate_partition, partition_dir, schema)
+                for output_dir, schema in ((records_dir, RECORD_SCHEMA), (workouts_dir, WORKOUT_SCHEMA))
+                for partition_dir in partition_dirs(output_dir)
+            ]
+            for future in consolidations:
+                future.result()
+
+    result = {
+        key: sum(r[key] for r in results)
+        for key in ("total_records", "total_workouts", "records_written", "workouts_written", "parse_errors")
+    }
+    record_partitions = set().union(*(r["record_partitions"] for r in results))
+    workout_partitions = set().union(*(r["workout_partitions"] for r in results))
+
+    print()
+    print("=" * 60)
+    print("Parse Complete")
+    print("=" * 60)
+    print(f"Total records parsed: {result['total_records']:,}")
+    print(f"Total workouts parsed: {result['total_workouts']:,}")
+    print(f"Records written to Parquet: {result['records_written']:,}")
+    print(f"Workouts written to Parquet: {result['workouts_written']:,}")
+    print(f"Parse errors: {result['parse_errors']}")
+    print(f"Record partitions: {len(record_partitions)}")
+    print(f"Workout partitions: {len(workout_partitions)}")
+
+    return result
+
+
 def main():
     """Main entry point for the parser."""
     print("=" * 60)
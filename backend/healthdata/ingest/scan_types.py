@@ -15,9 +15,11 @@ Usage:
 """
 
 import csv
+import heapq
 import json
 import sys
 from collections import Counter, defaultdict
+from operator import itemgetter
 from pathlib import Path
 from xml.etree.ElementTree import iterparse
 
@@ -43,10 +45,10 @@ def scan_health_types(export_path: Path, progress_interval: int = 100000) -> dic
     Returns:
         Dictionary with type statistics
     """
-    # Accumulators
-    type_counts: Counter = Counter()
+    # Accumulators: one flat (type, source) count per record, keyed on
+    # interned strings; per-type totals and top sources are derived at the end
+    type_source_counts: dict[tuple[str, str], int] = {}
     type_units: dict[str, set] = defaultdict(set)
-    type_sources: dict[str, Counter] = defaultdict(Counter)
     
     # Also track workouts separately
     workout_counts: Counter = Counter()
@@ -59,32 +61,37 @@ def scan_health_types(export_path: Path, progress_interval: int = 100000) -> dic
     print(f"File size: {export_path.stat().st_size / (1024*1024):.1f} MB")
     print()
     
-    # Stream parse with iterparse
-    context = iterparse(str(export_path), events=("end",))
+    # Stream parse with iterparse; the root is kept so each finished
+    # Record/Workout can be dropped from it (clearing the element alone
+    # leaves an empty node per record attached to the root)
+    context = iterparse(str(export_path), events=("start", "end"))
+    _, root = next(context)
     
     for event, elem in context:
+        if event != "end":
+            continue
         tag = elem.tag
         
         if tag == "Record":
             total_records += 1
             
             # Extract attributes
-            record_type = elem.get("type", "Unknown")
+            record_type = sys.intern(elem.get("type", "Unknown"))
             unit = elem.get("unit")
-            source_name = elem.get("sourceName", "Unknown")
+            source_name = sys.intern(elem.get("sourceName", "Unknown"))
             
             # Accumulate
-            type_counts[record_type] += 1
+            key = (record_type, source_name)
+            type_source_counts[key] = type_source_counts.get(key, 0) + 1
             if unit:
                 type_units[record_type].add(unit)
-            type_sources[record_type][source_name] += 1
             
             # Progress indicator
             if total_records % progress_interval == 0:
                 print(f"  Processed {total_records:,} records...")
             
-            # Clear element to free memory
-            elem.clear()
+            # Drop the processed record to free memory
+            root.clear()
             
         elif tag == "Workout":
             total_workouts += 1
@@ -95,14 +102,14 @@ def scan_health_types(export_path: Path, progress_interval: int = 100000) -> dic
             workout_counts[workout_type] += 1
             workout_sources[source_name] += 1
             
-            elem.clear()
-            
-        elif tag in ("HealthData", "ExportDate", "Me"):
-            # Keep these for reference but clear
-            elem.clear()
-        else:
-            # Clear any other elements
-            elem.clear()
+            root.clear()
+    
+    # Per-type totals and sources, in first-seen order (as the counters were)
+    type_counts: Counter = Counter()
+    type_sources: dict[str, list[tuple[str, int]]] = defaultdict(list)
+    for (record_type, source_name), count in type_source_counts.items():
+        type_counts[record_type] += count
+        type_sources[record_type].append((source_name, count))
     
     print()
     print(f"Scan complete: {total_records:,} records, {total_workouts:,} workouts")
@@ -124,7 +131,7 @@ def scan_health_types(export_path: Path, progress_interval: int = 100000) -> dic
     # Record types with details
     for record_type, count in type_counts.most_common():
         units_list = sorted(type_units[record_type])
-        top_sources = type_sources[record_type].most_common(5)
+        top_sources = heapq.nlargest(5, type_sources[record_type], key=itemgetter(1))
         
         result["record_types"][record_type] = {
             "sample_count": count,
@@ -0,0 +1,135 @@
+"""Test that parallel export parsing writes the same rows as a single-process parse."""
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent))
+
+import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from backend.healthdata.ingest import parse_export as pe
+
+WORKERS = 7
+
+
+def write_export(path: Path, n_records: int = 600):
+    """Write a small export.xml mixing Records, Correlations (with nested Records) and Workouts."""
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        "<!DOCTYPE HealthData [",
+        "<!ELEMENT HealthData (ExportDate,Me,(Record|Correlation|Workout)*)>",
+        "<!ATTLIST Record type CDATA #REQUIRED>",
+        "]>",
+        '<HealthData locale="en_US">',
+        ' <ExportDate value="2025-06-30 10:00:00 -0700"/>',
+        ' <Me HKCharacteristicTypeIdentifierBiologicalSex="HKBiologicalSexNotSet"/>',
+    ]
+    for i in range(n_records):
+        ts = f"2025-{i % 6 + 1:02d}-{i % 28 + 1:02d} {i % 24:02d}:15:00 -0700"
+        lines.append(
+            f' <Record type="HKQuantityTypeIdentifierStepCount" sourceName="Watch" unit="count" '
+            f'creationDate="{ts}" startDate="{ts}" endDate="{ts}" value="{i}">'
+        )
+        lines.append(f'  <MetadataEntry key="n" value="{i}"/>')
+        lines.append(" </Record>")
+        if i % 3 == 0:
+            lines.append(
+                f' <Correlation type="HKCorrelationTypeIdentifierBloodPressure" sourceName="Cuff" '
+                f'creationDate="{ts}" startDate="{ts}" endDate="{ts}">'
+            )
+            lines.append(f'  <MetadataEntry key="c" value="{i}"/>')
+            for kind, value in (("Systolic", 120 + i % 10), ("Diastolic", 80 + i % 5)):
+                lines.append(
+                    f'  <Record type="HKQuantityTypeIdentifierBloodPressure{kind}" sourceName="Cuff" '
+                    f'unit="mmHg" creationDate="{ts}" startDate="{ts}" endDate="{ts}" value="{value}"/>'
+                )
+            lines.append(" </Correlation>")
+        if i % 50 == 0:
+            lines.append(
+                f' <Workout workoutActivityType="HKWorkoutActivityTypeRunning" duration="{i % 60}" '
+                f'sourceName="Watch" creationDate="{ts}" startDate="{ts}" endDate="{ts}">'
+            )
+            lines.append(
+                f'  <WorkoutStatistics type="HKQuantityTypeIdentifierDistanceWalkingRunning" sum="{i / 10}"/>'
+            )
+            lines.append(" </Workout>")
+    lines.append("</HealthData>")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def count_unmatched_rows(left_dir: Path, right_dir: Path, kind: str) -> int:
+    """Rows (with partition columns) of one output present in one side but not the other."""
+    def source(parquet_dir: Path) -> str:
+        glob = (parquet_dir / kind / "**" / "*.parquet").as_posix()
+        return f"read_parquet('{glob}', hive_partitioning=true)"
+    return duckdb.sql(f"""
+        SELECT COUNT(*) FROM (
+            (SELECT * FROM {source(left_dir)} EXCEPT ALL SELECT * FROM {source(right_dir)})
+            UNION ALL
+            (SELECT * FROM {source(right_dir)} EXCEPT ALL SELECT * FROM {source(left_dir)})
+        )
+    """).fetchone()[0]
+
+
+def parse_to(export_path: Path, parquet_dir: Path, workers: int) -> dict:
+    """Run parse_export into parquet_dir."""
+    return pe.parse_export(export_path, workers=workers, parquet_dir=parquet_dir)
+
+
+def test_split_points_are_top_level():
+    with tempfile.TemporaryDirectory() as tmp:
+        export_path = Path(tmp) / "export.xml"
+        write_export(export_path)
+        data = export_path.read_bytes()
+
+        ranges = pe.split_export(export_path, WORKERS)
+        assert len(ranges) > 1
+        for start, _ in ranges[1:]:
+            assert data.startswith(b"<Record ", start)
+            # The nearest Correlation before the split point must be closed
+            assert data.rfind(b"<Correlation", 0, start) < data.rfind(b"</Correlation>", 0, start)
+
+
+def test_parallel_parse_matches_single_process():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        export_path = tmp / "export.xml"
+        write_export(export_path)
+
+        single = parse_to(export_path, tmp / "single", workers=1)
+        parallel = parse_to(export_path, tmp / "parallel", workers=WORKERS)
+
+        assert single == parallel
+        assert single["total_records"] == 600 + 2 * 200
+        assert single["total_workouts"] == 12
+        assert single["parse_errors"] == 0
+        for kind in ("records", "workouts"):
+            assert count_unmatched_rows(tmp / "single", tmp / "parallel", kind) == 0
+
+
+def test_invalid_timestamps_are_null_and_unpartitioned():
+    values = pa.array([
+        "2024-01-31 07:15:00 -0800",
+        "2024-02-30 07:00:00 -0800",
+        "2024-01-05 25:00:00 -0800",
+        "2024-01-05 07:00:00 +2500",
+        "2024-01-05 07:00:00",
+        None,
+    ])
+    utc, local = pe.parse_apple_timestamps(values)
+    assert utc.is_null().to_pylist() == [False, True, True, True, False, True]
+    assert pc.year(local).to_pylist() == [2024, None, None, None, 2024, None]
+    assert pc.month(local).to_pylist() == [1, None, None, None, 1, None]
+    assert pe.get_partition_key("HKQuantityTypeIdentifierStepCount", None, None) == (
+        "HKQuantityTypeIdentifierStepCount", "unknown", "unknown"
+    )
+    assert pe.get_workout_partition_key(2024, 1) == ("2024", "01")
+
+
+if __name__ == "__main__":
+    test_split_points_are_top_level()
+    test_parallel_parse_matches_single_process()
+    test_invalid_timestamps_are_null_and_unpartitioned()
+    print("✓ PASS")
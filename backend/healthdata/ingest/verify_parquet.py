@@ -1,4 +1,6 @@
 """Quick verification script for Parquet outputs."""
+import hashlib
+import json
 import sys
 from pathlib import Path
 
@@ -6,13 +8,50 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent))
 
 import duckdb
 
-from backend.healthdata.config import PARQUET_DIR
+from backend.healthdata.config import INVENTORY_DIR, PARQUET_DIR
+
+# Aggregate results of earlier runs, keyed by query and Parquet fingerprint
+QUERY_CACHE_PATH = INVENTORY_DIR / "verify_parquet_cache.json"
+
+
+def parquet_fingerprint(parquet_dir: Path) -> str:
+    """Hash of every Parquet file's path, size and mtime; changes on any rewrite."""
+    digest = hashlib.sha1()
+    for path in sorted(parquet_dir.rglob("*.parquet")):
+        stat = path.stat()
+        digest.update(f"{path.relative_to(parquet_dir)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def load_query_cache() -> dict:
+    try:
+        return json.loads(QUERY_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def cached_query(con: duckdb.DuckDBPyConnection, sql: str, fingerprint: str, cache: dict) -> list:
+    """Rows of sql, reused from cache while the Parquet files are unchanged."""
+    key = hashlib.sha1(f"{sql}\n{fingerprint}".encode()).hexdigest()
+    if key not in cache:
+        cache[key] = [list(row) for row in con.execute(sql).fetchall()]
+    return cache[key]
+
 
 def main():
     records_path = PARQUET_DIR / "records" / "**" / "*.parquet"
     workouts_path = PARQUET_DIR / "workouts" / "**" / "*.parquet"
     
     con = duckdb.connect()
+    # One view per dataset: the glob is expanded and its schema bound once, and
+    # COUNT(*) over a view is answered from the Parquet footers
+    con.execute(f"CREATE VIEW records AS SELECT * FROM read_parquet('{records_path}', hive_partitioning=true)")
+    con.execute(f"CREATE VIEW workouts AS SELECT * FROM read_parquet('{workouts_path}', hive_partitioning=true)")
+    
+    # Entries for other fingerprints are stale; keep only this one's
+    fingerprint = parquet_fingerprint(PARQUET_DIR)
+    previous = load_query_cache()
+    cache = previous.get(fingerprint, {})
     
     print("=" * 60)
     print("Parquet Verification")
@@ -21,51 +60,53 @@ def main():
     # Count records by type
     print("\nTop 10 Record Types by Count:")
     print("-" * 40)
-    query = f"""
+    query = """
         SELECT type, COUNT(*) as cnt 
-        FROM read_parquet('{records_path}', hive_partitioning=true)
+        FROM records
         GROUP BY type 
         ORDER BY cnt DESC 
         LIMIT 10
     """
-    result = con.execute(query).fetchdf()
-    for _, row in result.iterrows():
-        short_type = row['type'].replace("HKQuantityTypeIdentifier", "").replace("HKCategoryTypeIdentifier", "Cat:")
-        print(f"  {short_type}: {row['cnt']:,}")
+    for record_type, cnt in cached_query(con, query, fingerprint, cache):
+        short_type = record_type.replace("HKQuantityTypeIdentifier", "").replace("HKCategoryTypeIdentifier", "Cat:")
+        print(f"  {short_type}: {cnt:,}")
     
     # Count by year
     print("\nRecords by Year:")
     print("-" * 40)
-    query = f"""
+    query = """
         SELECT YEAR(start_ts) as year, COUNT(*) as cnt 
-        FROM read_parquet('{records_path}', hive_partitioning=true)
+        FROM records
         WHERE start_ts IS NOT NULL
         GROUP BY YEAR(start_ts)
         ORDER BY year
     """
-    result = con.execute(query).fetchdf()
-    for _, row in result.iterrows():
-        print(f"  {int(row['year'])}: {row['cnt']:,}")
+    for year, cnt in cached_query(con, query, fingerprint, cache):
+        print(f"  {int(year)}: {cnt:,}")
     
     # Total counts
     print("\nTotals:")
     print("-" * 40)
-    total_records = con.execute(f"SELECT COUNT(*) FROM read_parquet('{records_path}', hive_partitioning=true)").fetchone()[0]
-    total_workouts = con.execute(f"SELECT COUNT(*) FROM read_parquet('{workouts_path}', hive_partitioning=true)").fetchone()[0]
+    total_records = cached_query(con, "SELECT COUNT(*) FROM records", fingerprint, cache)[0][0]
+    total_workouts = cached_query(con, "SELECT COUNT(*) FROM workouts", fingerprint, cache)[0][0]
     print(f"  Total records: {total_records:,}")
     print(f"  Total workouts: {total_workouts:,}")
     
     # Sample record
     print("\nSample Record:")
     print("-" * 40)
-    sample = con.execute(f"""
+    sample = con.execute("""
         SELECT type, value, unit, start_ts, source_name 
-        FROM read_parquet('{records_path}', hive_partitioning=true)
+        FROM records
         WHERE type LIKE '%StepCount%'
         LIMIT 1
     """).fetchdf()
     print(sample.to_string(index=False))
     
+    if previous.get(fingerprint) != cache:
+        QUERY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        QUERY_CACHE_PATH.write_text(json.dumps({fingerprint: cache}), encoding="utf-8")
+    
     print("\n" + "=" * 60)
     print("Verification Complete!")
     print("=" * 60)
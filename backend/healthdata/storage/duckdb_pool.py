@@ -0,0 +1,108 @@
+"""
+Shared read-only DuckDB connection for the API layer.
+
+Requests take a cursor on one process-wide read-only connection instead of
+each connecting to the file anew. Cursors are cheap, run in their own
+transaction and can be used from the request's thread, so callers keep their
+existing try/finally close().
+
+The connection is opened by the first active cursor and closed when the last
+one is closed. Concurrent requests (and the dashboard's parallel builds)
+share it, but between requests the file lock is released: the builders
+(build_duckdb, derived_scores) can run while the API is up, and the next
+request reopens the database and sees the rebuilt tables, so data-version
+ETags and caches invalidate. While a builder holds the file, reads fail as
+they did with per-request connections.
+
+Builders open their writable connection with open_build_connection, which
+applies the DUCKDB_* resource settings.
+"""
+
+import threading
+from typing import Optional
+
+import duckdb
+
+from backend.healthdata.config import DUCKDB_MEMORY_LIMIT, DUCKDB_PATH, DUCKDB_THREADS
+
+_connection: Optional[duckdb.DuckDBPyConnection] = None
+_active_cursors = 0
+_connection_lock = threading.Lock()
+
+
+class SharedCursor:
+    """Cursor on the shared connection; close() also releases the connection when idle."""
+
+    def __init__(self, cursor: duckdb.DuckDBPyConnection):
+        self._cursor = cursor
+        self._closed = False
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._cursor.close()
+        _release_connection()
+
+
+def get_read_cursor() -> SharedCursor:
+    """Get a cursor on the shared read-only DuckDB connection (opening it if idle)."""
+    global _connection, _active_cursors
+    with _connection_lock:
+        if _connection is None:
+            _connection = duckdb.connect(str(DUCKDB_PATH), read_only=True)
+        cursor = _connection.cursor()
+        _active_cursors += 1
+        return SharedCursor(cursor)
+
+
+def _release_connection() -> None:
+    """Drop one active cursor; close the connection (and its file lock) after the last."""
+    global _connection, _active_cursors
+    with _connection_lock:
+        _active_cursors = max(_active_cursors - 1, 0)
+        if _active_cursors == 0 and _connection is not None:
+            _connection.close()
+            _connection = None
+
+
+def check_database_available() -> bool:
+    """
+    Check that the database can be opened read-only (e.g. at server startup).
+
+    The connection is released again right away so builders can take the
+    file lock; this only surfaces a missing or locked database early.
+    Returns False if it cannot be opened yet (not built, or held by a
+    writer); requests then open it on first use as before.
+    """
+    try:
+        cursor = get_read_cursor()
+    except duckdb.Error:
+        return False
+    try:
+        cursor.execute("SELECT 1").fetchone()
+    finally:
+        cursor.close()
+    return True
+
+
+def close_shared_connection() -> None:
+    """Close the shared connection (e.g. on server shutdown)."""
+    global _connection, _active_cursors
+    with _connection_lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+            _active_cursors = 0
+
+
+def open_build_connection() -> duckdb.DuckDBPyConnection:
+    """Open a writable connection for a builder with DUCKDB_THREADS / DUCKDB_MEMORY_LIMIT applied."""
+    con = duckdb.connect(str(DUCKDB_PATH))
+    con.execute("SET threads = ?", [DUCKDB_THREADS])
+    if DUCKDB_MEMORY_LIMIT:
+        con.execute("SET memory_limit = ?", [DUCKDB_MEMORY_LIMIT])
+    return con
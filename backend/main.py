@@ -8,8 +8,12 @@ Composes two backends:
 All backend code is consolidated in this backend/ folder.
 """
 
+import importlib
+import json
 import os
 import sys
+import threading
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # =============================================================================
@@ -20,13 +24,17 @@ from dotenv import load_dotenv
 
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-BACKEND_DIR = Path(__file__).resolve().parent
 
 # Load unified .env from project root
 env_file = PROJECT_ROOT / ".env"
-if env_file.exists():
+ENV_FILE_EXISTS = env_file.exists()
+if ENV_FILE_EXISTS:
     load_dotenv(env_file)
 
+# Startup diagnostics (backends loaded, startup banner) print only with
+# LOG_STARTUP=1; warnings always print
+LOG_STARTUP = os.getenv("LOG_STARTUP") == "1"
+
 # =============================================================================
 # PATH SETUP
 # =============================================================================
@@ -39,15 +47,96 @@ if str(PROJECT_ROOT) not in sys.path:
 # FASTAPI APP CREATION
 # =============================================================================
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Log startup information (LOG_STARTUP=1) and check that DuckDB can be
+    opened; on shutdown, release the shared DuckDB connection (and its file
+    lock).
+    """
+    if LOG_STARTUP:
+        print(
+            f"Health Intelligence API - Unified Backend: project_root={PROJECT_ROOT} "
+            f"env_file={env_file} env_file_exists={ENV_FILE_EXISTS}"
+        )
+
+    try:
+        from backend.healthdata.storage.duckdb_pool import check_database_available
+        if not check_database_available():
+            print("⚠ DuckDB not available yet; connecting on first request")
+    except ImportError:
+        pass
+
+    yield
+
+    try:
+        from backend.healthdata.storage.duckdb_pool import close_shared_connection
+        close_shared_connection()
+    except ImportError:
+        pass
+
 
 app = FastAPI(
     title="Health Intelligence API",
     description="Unified API for Health Analytics and Deep Analysis",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Static payloads of the root and health checks
+ROOT_INFO = {
+    "service": "Health Intelligence API",
+    "version": "1.0.0",
+    "backends": {
+        "agent": "/agent",
+        "analytics": "/analytics",
+        "ai": "/ai",
+    }
+}
+HEALTH_STATUS = {"status": "healthy", "service": "unified"}
+# Encoded once, as JSONResponse would render them
+ROOT_BODY = json.dumps(ROOT_INFO, separators=(",", ":")).encode()
+HEALTH_BODY = json.dumps(HEALTH_STATUS, separators=(",", ":")).encode()
+
+
+class HealthCheckInterceptor:
+    """
+    Answer GET / and GET /health directly with pre-encoded JSON.
+    
+    Health probes skip routing, validation and serialization. Added before
+    CORS so it sits inside it; other methods fall through to the routes.
+    """
+
+    BODIES = {"/": ROOT_BODY, "/health": HEALTH_BODY}
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        body = self.BODIES.get(scope["path"]) if scope["type"] == "http" else None
+        if body is None or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body, "more_body": False})
+
+
+app.add_middleware(HealthCheckInterceptor)
+
 # CORS configuration for unified frontend
 app.add_middleware(
     CORSMiddleware,
@@ -65,44 +154,95 @@ app.add_middleware(
 )
 
 
+class AnalyticsGZipMiddleware:
+    """
+    GZip responses under /analytics only.
+    
+    Analytics payloads are large, repetitive JSON; the agent and AI routes
+    stream SSE, which older Starlette GZip middleware would buffer.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/analytics"):
+            await self.gzip_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+app.add_middleware(AnalyticsGZipMiddleware, minimum_size=1024)
+
+
 # =============================================================================
 # HEALTH CHECK
 # =============================================================================
 
+# GET requests are answered by HealthCheckInterceptor; the routes document
+# the endpoints and serve any request it passes on.
+
 @app.get("/")
 async def root():
     """Root health check for unified backend."""
-    return {
-        "service": "Health Intelligence API",
-        "version": "1.0.0",
-        "backends": {
-            "agent": "/agent",
-            "analytics": "/analytics",
-            "ai": "/ai",
-        }
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Unified health check endpoint."""
-    return {"status": "healthy", "service": "unified"}
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 # =============================================================================
-# INCLUDE AGENT BACKEND (Deep Analysis)
+# MOUNT AGENT BACKEND (Deep Analysis)
 # =============================================================================
-# The agent backend exposes an APIRouter, we add the /agent prefix here
+# The agent backend exposes an APIRouter. It pulls in the LangGraph/LangChain
+# stack, so it is imported on the first /agent request rather than at startup.
 
-try:
-    from backend.agent.api import router as agent_router
+class LazyRouterMount:
+    """
+    ASGI app serving a backend's APIRouter, imported on first request.
     
-    app.include_router(agent_router, prefix="/agent")
-    print("✓ Agent backend included at /agent")
-except ImportError as e:
-    print(f"⚠ Could not import agent backend: {e}")
-except Exception as e:
-    print(f"⚠ Error including agent backend: {e}")
+    The import runs once, in the threadpool (it can take seconds) under a
+    lock, and the router is included into its own FastAPI app (docs at
+    <mount>/docs). If the import fails, every request gets a 503.
+    """
+
+    def __init__(self, module: str, name: str, title: str, attr: str = "router"):
+        self.module = module
+        self.name = name
+        self.title = title
+        self.attr = attr
+        self.app = None
+        self.error = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        with self.lock:
+            if self.app is None and self.error is None:
+                try:
+                    router = getattr(importlib.import_module(self.module), self.attr)
+                    app = FastAPI(title=self.title)
+                    app.include_router(router)
+                    self.app = app
+                    if LOG_STARTUP:
+                        print(f"✓ {self.name} backend loaded")
+                except Exception as e:
+                    self.error = f"{self.name} backend unavailable: {e}"
+                    print(f"⚠ Could not import {self.name.lower()} backend: {e}")
+
+    async def __call__(self, scope, receive, send):
+        if self.app is None and self.error is None:
+            await run_in_threadpool(self.load)
+        if self.app is None:
+            await JSONResponse({"detail": self.error}, status_code=503)(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+app.mount("/agent", LazyRouterMount("backend.agent.api", "Agent", "Health Agent API"))
 
 
 # =============================================================================
@@ -114,31 +254,18 @@ except Exception as e:
 try:
     from backend.healthdata.api.analytics import router as analytics_router
     from backend.healthdata.api.insights import router as insights_router
+    from backend.healthdata.api.batch import router as batch_router
     from backend.healthdata.ai.api import router as ai_router
     
     # Include routers directly (they already have prefixes)
     app.include_router(analytics_router)
     app.include_router(insights_router)
+    app.include_router(batch_router)
     app.include_router(ai_router)
     
-    print("✓ Analytics routers included at /analytics and /ai")
+    if LOG_STARTUP:
+        print("✓ Analytics routers included at /analytics and /ai")
 except ImportError as e:
     print(f"⚠ Could not import analytics backend: {e}")
 except Exception as e:
     print(f"⚠ Error including analytics routers: {e}")
-
-
-# =============================================================================
-# STARTUP EVENT
-# =============================================================================
-
-@app.on_event("startup")
-async def startup_event():
-    """Log startup information."""
-    print("\n" + "=" * 60)
-    print("Health Intelligence API - Unified Backend")
-    print("=" * 60)
-    print(f"Project Root: {PROJECT_ROOT}")
-    print(f"Backend Dir: {BACKEND_DIR}")
-    print(f"Env File: {env_file} (exists: {env_file.exists()})")
-    print("=" * 60 + "\n")
@@ -163,7 +163,7 @@ function DetailPanel({ day, score, onClose }: DetailPanelProps) {
         </p>
       </div>
 
-      {score && score.contributors && (
+      {score && (
         <div
           className="pt-4 space-y-3"
           style={{ borderTop: `1px solid ${colors.ui.border}` }}
@@ -173,9 +173,9 @@ function DetailPanel({ day, score, onClose }: DetailPanelProps) {
           </p>
 
           {[
-            { label: 'HRV', value: score.contributors.hrv_pct, icon: '💓' },
-            { label: 'Resting HR', value: score.contributors.rhr_pct, icon: '❤️' },
-            { label: 'Prior Effort', value: score.contributors.effort_pct, icon: '🔥' },
+            { label: 'HRV', value: score.hrv_pct, icon: '💓' },
+            { label: 'Resting HR', value: score.rhr_pct, icon: '❤️' },
+            { label: 'Prior Effort', value: score.effort_pct, icon: '🔥' },
           ].map(({ label, value, icon }) => {
             if (value === null || value === undefined) return null;
             const impact = Math.round(value * 0.5);
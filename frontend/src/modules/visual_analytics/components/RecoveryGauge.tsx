@@ -25,29 +25,29 @@ function generateTeachingLine(score: DailyScore | null): string {
     return "Recovery data not available for this day.";
   }
 
-  const { contributors, recovery_score, recovery_label } = score;
+  const { hrv_pct, rhr_pct, effort_pct, recovery_score, recovery_label } = score;
   const parts: string[] = [];
 
-  if (contributors.hrv_pct !== null) {
-    if (contributors.hrv_pct < -20) {
+  if (hrv_pct !== null) {
+    if (hrv_pct < -20) {
       parts.push("HRV dropped below baseline");
-    } else if (contributors.hrv_pct > 20) {
+    } else if (hrv_pct > 20) {
       parts.push("HRV is elevated above baseline");
     }
   }
 
-  if (contributors.rhr_pct !== null) {
-    if (contributors.rhr_pct < -20) {
+  if (rhr_pct !== null) {
+    if (rhr_pct < -20) {
       parts.push("resting heart rate is higher than usual");
-    } else if (contributors.rhr_pct > 20) {
+    } else if (rhr_pct > 20) {
       parts.push("resting heart rate is lower than usual");
     }
   }
 
-  if (contributors.effort_pct !== null) {
-    if (contributors.effort_pct < -20) {
+  if (effort_pct !== null) {
+    if (effort_pct < -20) {
       parts.push("yesterday's effort was high");
-    } else if (contributors.effort_pct > 20) {
+    } else if (effort_pct > 20) {
       parts.push("yesterday was a light day");
     }
   }
@@ -379,17 +379,17 @@ export function RecoveryGauge({ initialRange = '7d' }: RecoveryGaugeProps) {
         </h4>
         <ContributorBar
           label="HRV"
-          value={selectedScore?.contributors.hrv_pct ?? null}
+          value={selectedScore?.hrv_pct ?? null}
           icon="💓"
         />
         <ContributorBar
           label="Resting HR"
-          value={selectedScore?.contributors.rhr_pct ?? null}
+          value={selectedScore?.rhr_pct ?? null}
           icon="❤️"
         />
         <ContributorBar
           label="Yesterday's Effort"
-          value={selectedScore?.contributors.effort_pct ?? null}
+          value={selectedScore?.effort_pct ?? null}
           icon="🔥"
         />
       </div>
@@ -75,11 +75,9 @@ export interface DailyScore {
   strain_score?: number
   strain_label?: string
   strain_primary_metric?: string
-  contributors: {
-    hrv_pct?: number
-    rhr_pct?: number
-    effort_pct?: number
-  }
+  hrv_pct?: number
+  rhr_pct?: number
+  effort_pct?: number
 }
 
 export interface ScoresResponse {
@@ -7,12 +7,6 @@
 // GET /analytics/scores
 // =============================================================================
 
-export interface Contributors {
-  hrv_pct: number | null;
-  rhr_pct: number | null;
-  effort_pct: number | null;
-}
-
 export interface DataQuality {
   total_days: number;
   days_with_data: number;
@@ -27,7 +21,9 @@ export interface DailyScore {
   strain_score: number | null;
   strain_label: string | null;
   strain_primary_metric: string | null;
-  contributors: Contributors;
+  hrv_pct: number | null;
+  rhr_pct: number | null;
+  effort_pct: number | null;
 }
 
 export interface ScoresResponse {
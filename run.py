@@ -3,6 +3,7 @@ Unified Server Runner for Health Intelligence App.
 
 Usage:
     python run.py
+    UVICORN_RELOAD=1 python run.py   # restart on changes under backend/
 
 This starts the unified backend server that serves both:
 - Agent backend at /agent/*
@@ -10,11 +11,13 @@ This starts the unified backend server that serves both:
 """
 
 import os
-import uvicorn
 
 if __name__ == "__main__":
+    import uvicorn
+    
     port = int(os.getenv("PORT", "8000"))
     host = os.getenv("HOST", "0.0.0.0")
+    reload = os.getenv("UVICORN_RELOAD", "0") == "1"
     
     print(f"\n🚀 Starting Health Intelligence API on http://{host}:{port}\n")
     
@@ -22,6 +25,6 @@ if __name__ == "__main__":
         "backend.main:app",
         host=host,
         port=port,
-        reload=True,
-        reload_dirs=["backend"],
+        reload=reload,
+        reload_dirs=["backend"] if reload else None,
     )